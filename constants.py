@@ -1,4 +1,5 @@
 from enum import Enum, IntEnum
+from data_structures.enum_array import IndexedEnum
 
 
 class GameResult(IntEnum):
@@ -23,7 +24,7 @@ class Constants:
     MAX_NUM_TEAMS = 20
 
 
-class PlayerStats(Enum):
+class PlayerStats(IndexedEnum):
     GAMES_PLAYED = "Games Played"
     GOALS = "Goals"
     ASSISTS = "Assists"
@@ -35,7 +36,7 @@ class PlayerStats(Enum):
     HEIGHT = "Height"
 
 
-class TeamStats(Enum):
+class TeamStats(IndexedEnum):
     GAMES_PLAYED = "Games Played"
     POINTS = "Points"
     WINS = "Wins"
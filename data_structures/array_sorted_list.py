@@ -1,5 +1,7 @@
 """ Array-based implementation of SortedList ADT. """
 
+from itertools import islice
+from typing import Iterator
 from data_structures.referential_array import ArrayR
 from data_structures.abstract_sorted_list import SortedList, T
 
@@ -30,6 +32,10 @@ class ArraySortedList(SortedList[T]):
             raise IndexError('Out of bounds access in array.')
         return self.array[index]
 
+    def __iter__(self) -> Iterator[T]:
+        """ Iterate over the items in sorted order, without copying them, see ArrayR.__iter__. """
+        return islice(self.array, len(self))
+
     def __contains__(self, item):
         """ Checks if item is in the list. """
         try:
@@ -40,25 +46,16 @@ class ArraySortedList(SortedList[T]):
 
     def _shuffle_right(self, index: int) -> None:
         """ Shuffle items to the right up to a given position. """
-        for i in range(len(self), index, -1):
-            self.array[i] = self.array[i - 1]
+        self.array[index + 1:len(self) + 1] = self.array[index:len(self)]
 
     def _shuffle_left(self, index: int) -> None:
         """ Shuffle items starting at a given position to the left. """
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i + 1]
+        self.array[index:len(self)] = self.array[index + 1:len(self) + 1]
 
     def _resize(self) -> None:
         """ Resize the list. """
-        # doubling the size of our list
-        new_array = ArrayR(2 * len(self.array))
-
-        # copying the contents
-        for i in range(self.length):
-            new_array[i] = self.array[i]
-
-        # referring to the new array
-        self.array = new_array
+        # doubling the size of our list, copying the contents
+        self.array = self.array.copy(2 * len(self.array))
 
     def delete_at_index(self, index: int) -> T:
         """ Delete item at a given position. """
@@ -93,6 +90,39 @@ class ArraySortedList(SortedList[T]):
         self.array[index] = item
         self.length += 1
 
+    def reposition(self, indices: list[int]) -> tuple[int, int]:
+        """ Move the items at the given positions back into sorted order after their
+            ordering has changed. All the other items must still be sorted relative
+            to each other. Repeated indices are only moved once.
+            Returns the range of positions, from start up to (not including) stop,
+            outside of which no item has moved.
+        :complexity: O(k*(log(n)*comp + n)) where n is the length of the list and k is
+                     the number of indices, as each moved item is taken out and binary
+                     searched back in, shuffling the items in between in a single slice copy.
+        """
+        for index in indices:
+            if index < 0 or len(self) <= index:
+                raise IndexError('Out of bounds access in array.')
+        if len(indices) == 0:
+            return 0, 0
+
+        # Take all the moved items out first, from the back so the other indices stay
+        # valid, leaving the rest sorted for the binary searches
+        removed = sorted(set(indices), reverse=True)
+        moved_items = [self.delete_at_index(index) for index in removed]
+
+        start = removed[-1]
+        stop = removed[0] + 1
+        for i, item in enumerate(moved_items):
+            index = self._index_to_add(item)
+            self._shuffle_right(index)
+            self.array[index] = item
+            self.length += 1
+            # Each later add can push this item one position further right
+            start = min(start, index)
+            stop = max(stop, index + len(moved_items) - i)
+        return start, stop
+
     def _index_to_add(self, item: T) -> int:
         """ Find the position where the new item should be placed.
         :complexity best: O(comp)   item is the middle element
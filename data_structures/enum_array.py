@@ -0,0 +1,119 @@
+""" Enum indexed array.
+
+Defines an array with one slot per member of an enum. Enums that derive from
+IndexedEnum number their members when the enum class is defined, so reading or
+writing an EnumArray is a single index into a list, without hashing the member.
+"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+from enum import Enum, EnumMeta
+from typing import Generic, Iterator, TypeVar, Union
+
+E = TypeVar('E', bound='IndexedEnum')
+T = TypeVar('T')
+
+
+class _IndexedEnumMeta(EnumMeta):
+    """ Numbers the members of an IndexedEnum once its class is built. """
+
+    def __new__(metacls, *args, **kwargs):
+        enum_class = super().__new__(metacls, *args, **kwargs)
+        for slot, member in enumerate(enum_class):
+            member.slot = slot
+        return enum_class
+
+
+class IndexedEnum(Enum, metaclass=_IndexedEnumMeta):
+    """
+    Enum whose members know their position in the enum.
+
+    attributes:
+        slot: the position of the member in definition order, from 0
+    """
+
+
+class EnumArray(Generic[E, T]):
+    """
+    Array with one slot per member of an IndexedEnum.
+
+    Type Arguments:
+        - E:    The IndexedEnum indexing the array.
+        - T:    Item Type.
+
+    None marks a member without an item, like an empty slot of a hash table.
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    def __init__(self, enum: type[E], default: Union[T, None] = None) -> None:
+        """
+        :complexity: O(M) where M is the number of members of the enum
+        """
+        self.enum = enum
+        self.items: list[Union[T, None]] = [default] * len(enum)
+
+    def __getitem__(self, member: E) -> T:
+        """
+        :raises KeyError: when the member is not of the enum or has no item.
+        """
+        if member.__class__ is not self.enum or self.items[member.slot] is None:
+            raise KeyError(member)
+        return self.items[member.slot]
+
+    def __setitem__(self, member: E, item: Union[T, None]) -> None:
+        """
+        :raises KeyError: when the member is not of the enum.
+        """
+        if member.__class__ is not self.enum:
+            raise KeyError(member)
+        self.items[member.slot] = item
+
+    def __delitem__(self, member: E) -> None:
+        """
+        :raises KeyError: when the member is not of the enum or has no item.
+        """
+        _ = self[member]
+        self.items[member.slot] = None
+
+    def __contains__(self, member: E) -> bool:
+        return member.__class__ is self.enum and self.items[member.slot] is not None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of members with an item.
+
+        :complexity: O(M) where M is the number of members of the enum
+        """
+        return sum(item is not None for item in self.items)
+
+    def __iter__(self) -> Iterator[E]:
+        """
+        Iterates over the members with an item, in definition order.
+
+        :complexity: O(M) where M is the number of members of the enum
+        """
+        return iter([member for member in self.enum if self.items[member.slot] is not None])
+
+    def keys(self) -> Iterator[E]:
+        """
+        Yields the members with an item, in definition order.
+
+        :complexity: O(M) where M is the number of members of the enum, over the whole iteration
+        """
+        return iter(self)
+
+    def values(self) -> Iterator[T]:
+        """
+        Yields the items, in definition order of their members.
+
+        :complexity: O(M) where M is the number of members of the enum, over the whole iteration
+        """
+        for item in self.items:
+            if item is not None:
+                yield item
+
+    def __str__(self) -> str:
+        result = ""
+        for member in self:
+            result += "(" + str(member.value) + "," + str(self.items[member.slot]) + ")\n"
+        return result
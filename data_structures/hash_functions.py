@@ -0,0 +1,105 @@
+""" Hash functions for the string keyed hash tables.
+
+Each hash function maps a key to a non-negative integer that does not depend on the
+size of a table, which reduces it modulo its own size. Any of them can be given to
+LinearProbeTable (and RobinHoodTable), HashyStepTable or HashTableSeparateChaining
+as its `hash_function`:
+```
+players = LinearProbeTable(hash_function=fnv1a_hash)
+players_by_name = LinearProbeTable(hash_function=SeededHash())
+```
+
+polynomial_hash is the hash the tables use by default. It is fixed, so anyone who
+knows it can choose keys that all land in the same cluster. SeededHash picks its
+base at random (or from a given seed), so such keys cannot be chosen in advance.
+"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+import secrets
+from typing import Union
+
+# Mersenne prime the polynomial hashes are reduced by
+HASH_MODULUS = (1 << 61) - 1
+HASH_BASE = 31
+FNV_OFFSET = 0xcbf29ce484222325
+FNV_PRIME = 0x100000001b3
+MASK = (1 << 64) - 1
+
+
+def polynomial_hash(key: str) -> int:
+    """
+    The polynomial hash of the tables, with a coefficient that changes per character.
+
+    :complexity: O(len(key))
+    """
+    value = 0
+    a = 31415
+    for char in key:
+        value = (ord(char) + a * value) % HASH_MODULUS
+        a = a * HASH_BASE % (HASH_MODULUS - 1)
+    return value
+
+
+def builtin_hash(key: str) -> int:
+    """
+    Python's own hash of the key, made non-negative. By far the fastest, as it is computed
+    in C and cached by the string.
+
+    Python seeds the hash of strings per process (see PYTHONHASHSEED), so a table using
+    it should not be pickled into another process, e.g. one used by MonteCarloRunner.
+
+    :complexity: O(len(key)) the first time a string is hashed, O(1) after that.
+    """
+    return hash(key) & MASK
+
+
+def fnv1a_hash(key: str, seed: int = 0) -> int:
+    """
+    64 bit FNV-1a hash of the key. A seed other than 0 is mixed into the offset basis,
+    giving a different hash function for each seed.
+
+    :complexity: O(len(key))
+    """
+    value = (FNV_OFFSET ^ seed) & MASK
+    for char in key:
+        value = ((value ^ ord(char)) * FNV_PRIME) & MASK
+    return value
+
+
+class SeededHash:
+    """
+    Polynomial hash modulo HASH_MODULUS with a base chosen from a seed.
+
+    For a random base, two different keys of length at most L have the same hash with
+    probability at most L / HASH_MODULUS, whatever the keys are.
+    Instances can be pickled, and hash the same way after unpickling.
+
+    attributes:
+        seed: the seed the base was chosen from
+        base: the base of the polynomial, in [2, HASH_MODULUS - 1)
+    """
+
+    def __init__(self, seed: Union[int, None] = None) -> None:
+        """
+        :param seed: seed of the base, a random one if None.
+        :complexity: O(1)
+        """
+        if seed is None:
+            seed = secrets.randbits(64)
+        self.seed = seed
+        self.base = 2 + fnv1a_hash(str(seed)) % (HASH_MODULUS - 3)
+
+    def __call__(self, key: str) -> int:
+        """
+        :complexity: O(len(key))
+        """
+        value = 1
+        base = self.base
+        for char in key:
+            value = (value * base + ord(char)) % HASH_MODULUS
+        return value
+
+    def __repr__(self) -> str:
+        return "SeededHash(" + str(self.seed) + ")"
+
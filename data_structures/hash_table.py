@@ -7,7 +7,8 @@ __author__ = 'Jackson Goerner'
 __since__ = '07/02/2023'
 
 
-from typing import TypeVar, Generic
+from typing import Callable, Generic, Iterable, Iterator, TypeVar, Union
+from data_structures.hash_functions import polynomial_hash
 from data_structures.referential_array import ArrayR
 
 K = TypeVar('K')
@@ -18,15 +19,42 @@ class FullError(Exception):
     pass
 
 
+class _Tombstone:
+    """
+    Marks the slot of a deleted entry in tables that delete lazily.
+    There is a single instance, which stays the same object when pickled.
+    """
+
+    def __reduce__(self) -> str:
+        return 'TOMBSTONE'
+
+    def __repr__(self) -> str:
+        return 'TOMBSTONE'
+
+
+TOMBSTONE = _Tombstone()
+
+
 class LinearProbeTable(Generic[K, V]):
     """
     Linear Probe Table.
 
     Type Arguments:
         - K:    Key Type. In most cases should be string.
-                Otherwise `hash` should be overwritten.
+                Otherwise `full_hash` should be overwritten.
         - V:    Value Type.
 
+    Entries are kept in three parallel arrays: `array` holds the keys (or None for an
+    empty slot), `value_array` the values and `hash_array` the full hashes. Updating a
+    key only writes its value slot, and no object is allocated per entry.
+    The full hash does not depend on the table size, so it is computed once per key
+    and reused when probing, deleting and rehashing.
+
+    By default deleting an entry reinserts the rest of its cluster. With `tombstones`
+    the slot is marked with TOMBSTONE instead, which probes skip and inserts reuse,
+    and the table is compacted once the tombstones fill more than
+    `tombstone_threshold` of it.
+
     Unless stated otherwise, all methods have O(1) complexity.
     """
 
@@ -34,16 +62,97 @@ class LinearProbeTable(Generic[K, V]):
     TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869]
 
     HASH_BASE = 31
+    # Largest fraction of the table that can be filled before it is resized
+    LOAD_FACTOR = 0.5
+    # Fraction of the table that tombstones can fill before it is compacted
+    TOMBSTONE_THRESHOLD = 0.25
 
-    def __init__(self, sizes=None) -> None:
+    def __init__(self, sizes=None, tombstones: bool = False, tombstone_threshold: float = TOMBSTONE_THRESHOLD,
+                 hash_function: Union[Callable[[K], int], None] = None) -> None:
         """
         Initialise the Hash Table.
+
+        :param tombstones: whether deletes mark slots with tombstones instead of reinserting the cluster.
+        :param tombstone_threshold: fraction of the table tombstones can fill before it is compacted.
+        :param hash_function: used as the full hash of this table instead of full_hash,
+                              see data_structures.hash_functions.
+        :raises ValueError: when the threshold would let the table fill up (it must be in (0, 0.5)).
         """
         if sizes is not None:
             self.TABLE_SIZES = sizes
+        if hash_function is not None:
+            self.full_hash = hash_function
+        if tombstones and not 0 < tombstone_threshold < 0.5:
+            raise ValueError("Tombstone threshold should be between 0 and 0.5.")
         self.size_index = 0
-        self.array:ArrayR[tuple[K, V]] = ArrayR(self.TABLE_SIZES[self.size_index])
+        self._allocate(self.TABLE_SIZES[self.size_index])
         self.count = 0
+        self.use_tombstones = tombstones
+        self.tombstone_threshold = tombstone_threshold
+        self.tombstones = 0
+
+    def _allocate(self, size: int) -> None:
+        """
+        Replace the key, value and hash arrays with empty ones of the given size.
+
+        :complexity: O(M) where M is the size.
+        """
+        self.array: ArrayR[K] = ArrayR(size)
+        self.value_array: ArrayR[V] = ArrayR(size)
+        self.hash_array: ArrayR[int] = ArrayR(size)
+
+    @classmethod
+    def with_capacity(cls, capacity: int, sizes=None, **kwargs) -> LinearProbeTable[K, V]:
+        """
+        Create an empty table large enough to hold `capacity` entries without resizing.
+
+        :param kwargs: passed on to the constructor, e.g. tombstones or hash_function.
+        :complexity: O(M) where M is the size of the table chosen.
+        """
+        table = cls(sizes, **kwargs)
+        table.reserve(capacity)
+        return table
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[K, V]], sizes=None, **kwargs) -> LinearProbeTable[K, V]:
+        """
+        Create a table holding the given (key, value) pairs, sized for all of them up front.
+
+        :param kwargs: passed on to the constructor, see with_capacity.
+        :complexity: See update.
+        """
+        table = cls(sizes, **kwargs)
+        table.update(items)
+        return table
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Grow the table (never shrink it) to the smallest size in TABLE_SIZES that holds
+        `capacity` entries without resizing, or the largest size if none does.
+
+        :complexity best: O(1) the table is already large enough.
+        :complexity worst: O(M + N^2) see _rebuild, where M is the size of the table chosen.
+        """
+        size_index = self.size_index
+        while size_index < len(self.TABLE_SIZES) - 1 and capacity > self.TABLE_SIZES[size_index] * self.LOAD_FACTOR:
+            size_index += 1
+        if size_index > self.size_index:
+            self.size_index = size_index
+            self._rebuild(self.TABLE_SIZES[size_index])
+
+    def update(self, items: Iterable[tuple[K, V]]) -> None:
+        """
+        Set every (key, value) pair of a batch, reserving room for the whole batch first
+        so the table is resized at most once.
+        Keys already in the table count towards the reservation, so it may be larger than needed.
+
+        :complexity: O(B * setitem) where B is the size of the batch, plus one reserve.
+        """
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        self.reserve(self.count + len(items))
+        for key, value in items:
+            self[key] = value
 
     def hash(self, key: K) -> int:
         """
@@ -51,13 +160,18 @@ class LinearProbeTable(Generic[K, V]):
 
         :complexity: O(len(key))
         """
+        return self.full_hash(key) % self.table_size
 
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
-        return value
+    def full_hash(self, key: K) -> int:
+        """
+        Hash a key independently of the table size.
+        The position of the key in the table is this hash modulo the table size.
+        This is polynomial_hash of data_structures.hash_functions, unless the table
+        was given another hash function.
+
+        :complexity: O(len(key))
+        """
+        return polynomial_hash(key)
 
     @property
     def table_size(self) -> int:
@@ -69,63 +183,80 @@ class LinearProbeTable(Generic[K, V]):
         """
         return self.count
 
-    def _linear_probe(self, key: K, is_insert: bool) -> int:
+    def _linear_probe(self, key: K, is_insert: bool, key_hash: int = None) -> int:
         """
         Find the correct position for this key in the hash table using linear probing.
+        The stored hash of an entry is compared before its key, so keys are only
+        compared when their full hashes match.
+        Tombstones are probed past, and an insert of a new key reuses the first one found.
+
+        :param key_hash: full_hash(key), computed if not given.
         :complexity best: O(hash(key)) first position is empty
         :complexity worst: O(hash(key) + N*comp(K)) when we've searched the entire table
                         where N is the tablesize
         :raises KeyError: When the key is not in the table, but is_insert is False.
         :raises FullError: When a table is full and cannot be inserted.
         """
+        if key_hash is None:
+            key_hash = self.full_hash(key)
         # Initial position
-        position = self.hash(key)
+        position = key_hash % self.table_size
+        first_tombstone = None
 
         for _ in range(self.table_size):
-            if self.array[position] is None:
+            resident = self.array[position]
+            if resident is None:
                 # Empty spot. Am I upserting or retrieving?
                 if is_insert:
-                    return position
+                    return position if first_tombstone is None else first_tombstone
                 else:
                     raise KeyError(key)
-            elif self.array[position][0] == key:
+            elif resident is TOMBSTONE:
+                # Deleted entry, the key could still be further along.
+                if first_tombstone is None:
+                    first_tombstone = position
+            elif self.hash_array[position] == key_hash and resident == key:
                 return position
-            else:
-                # Taken by something else. Time to linear probe.
-                position = (position + 1) % self.table_size
+            # Taken by something else. Time to linear probe.
+            position = (position + 1) % self.table_size
 
+        if is_insert and first_tombstone is not None:
+            return first_tombstone
         if is_insert:
             raise FullError("Table is full!")
         else:
             raise KeyError(key)
 
-    def keys(self) -> ArrayR[K]:
+    def items(self) -> Iterator[tuple[K, V]]:
         """
-        Returns all keys in the hash table.
+        Yields all (key, value) pairs in the hash table, without copying them.
+        The table should not be modified while iterating.
 
-        :complexity: O(N) where N is self.table_size.
+        :complexity: O(N) where N is self.table_size, over the whole iteration.
         """
-        res = ArrayR(self.count)
-        i = 0
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res[i] = self.array[x][0]
-                i += 1
-        return res
+        for position, key in self.array.enumerate():
+            if key is not None and key is not TOMBSTONE:
+                yield key, self.value_array[position]
 
-    def values(self) -> ArrayR[V]:
+    def keys(self) -> Iterator[K]:
         """
-        Returns all values in the hash table.
+        Yields all keys in the hash table, see items.
 
-        :complexity: O(N) where N is self.table_size.
+        :complexity: O(N) where N is self.table_size, over the whole iteration.
         """
-        res = ArrayR(self.count)
-        i = 0
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res[i] = self.array[x][1]
-                i += 1
-        return res
+        for key in self.array:
+            if key is not None and key is not TOMBSTONE:
+                yield key
+
+    def values(self) -> Iterator[V]:
+        """
+        Yields all values in the hash table, see items.
+
+        :complexity: O(N) where N is self.table_size, over the whole iteration.
+        """
+        for position, key in self.array.enumerate():
+            if key is not None and key is not TOMBSTONE:
+                yield self.value_array[position]
 
     def __contains__(self, key: K) -> bool:
         """
@@ -148,73 +279,175 @@ class LinearProbeTable(Generic[K, V]):
         :raises KeyError: when the key doesn't exist.
         """
         position = self._linear_probe(key, False)
-        return self.array[position][1]
+        return self.value_array[position]
 
     def __setitem__(self, key: K, data: V) -> None:
         """
         Set an (key, value) pair in our hash table.
+        Updating a key already in the table only writes its value.
 
         :complexity: See linear probe.
         :raises FullError: when the table cannot be resized further.
         """
 
-        position = self._linear_probe(key, True)
-
-        if self.array[position] is None:
-            self.count += 1
+        key_hash = self.full_hash(key)
+        position = self._linear_probe(key, True, key_hash)
 
-        self.array[position] = (key, data)
-
-        if len(self) > self.table_size / 2:
+        resident = self.array[position]
+        if resident is not None and resident is not TOMBSTONE:
+            self.value_array[position] = data
+            return
+        if resident is TOMBSTONE:
+            self.tombstones -= 1
+        self.count += 1
+        self.array[position] = key
+        self.value_array[position] = data
+        self.hash_array[position] = key_hash
+
+        if len(self) > self.table_size * self.LOAD_FACTOR:
             self._rehash()
 
     def __delitem__(self, key: K) -> None:
         """
         Deletes a (key, value) pair in our hash table.
 
-        :complexity best: O(hash(key)) deleting item is not probed and in correct spot.
-        :complexity worst: O(N*hash(key)+N^2*comp(K)) deleting item is midway through large chain.
+        The rest of the cluster is reinserted using the stored hashes, so no key is rehashed.
+        With tombstones the slot is marked as deleted instead, unless it ends its cluster.
+
+        :complexity best: O(hash(key)) deleting item is not probed and in correct spot,
+                          or the table uses tombstones and is not compacted.
+        :complexity worst: O(hash(key)+N^2) deleting item is midway through large chain.
+                           With tombstones, O(hash(key)+N) amortised over the deletes since
+                           the last compaction.
         :raises KeyError: when the key doesn't exist.
         """
         position = self._linear_probe(key, False)
+        self.count -= 1
+        self.value_array[position] = None
+        if self.use_tombstones:
+            if self.array[(position + 1) % self.table_size] is None:
+                # Nothing was probed past this slot, so it can simply be emptied.
+                self.array[position] = None
+            else:
+                self.array[position] = TOMBSTONE
+                self.tombstones += 1
+                if self.tombstones > self.table_size * self.tombstone_threshold:
+                    self._compact()
+            return
         # Remove the element
         self.array[position] = None
-        self.count -= 1
         # Start moving over the cluster
         position = (position + 1) % self.table_size
         while self.array[position] is not None:
-            key2, value = self.array[position]
+            key = self.array[position]
+            key_hash = self.hash_array[position]
+            value = self.value_array[position]
             self.array[position] = None
+            self.value_array[position] = None
             # Reinsert.
-            newpos = self._linear_probe(key2, True)
-            self.array[newpos] = (key2, value)
+            new_position = self._free_position(key_hash)
+            self.array[new_position] = key
+            self.value_array[new_position] = value
+            self.hash_array[new_position] = key_hash
             position = (position + 1) % self.table_size
 
     def is_empty(self) -> bool:
         return self.count == 0
 
+    def _probe_distance(self, position: int, key_hash: int) -> int:
+        """
+        Number of slots between the position of an entry and the position its hash points to.
+        """
+        return (position - key_hash) % self.table_size
+
+    def max_probe_distance(self) -> int:
+        """
+        Returns the longest probe distance of an entry in the table, 0 if it is empty.
+
+        :complexity: O(N) where N is self.table_size.
+        """
+        longest = 0
+        for position in range(self.table_size):
+            key = self.array[position]
+            if key is not None and key is not TOMBSTONE:
+                longest = max(longest, self._probe_distance(position, self.hash_array[position]))
+        return longest
+
+    def mean_probe_distance(self) -> float:
+        """
+        Returns the mean probe distance of the entries in the table, 0 if it is empty.
+        A successful lookup probes one slot more than the distance of its entry.
+
+        :complexity: O(N) where N is self.table_size.
+        """
+        if self.count == 0:
+            return 0.0
+        total = 0
+        for position in range(self.table_size):
+            key = self.array[position]
+            if key is not None and key is not TOMBSTONE:
+                total += self._probe_distance(position, self.hash_array[position])
+        return total / self.count
+
     def is_full(self) -> bool:
         return self.count == self.table_size
 
+    def _free_position(self, key_hash: int) -> int:
+        """
+        Find the first empty position for a key that is known not to be in the table.
+
+        :complexity best: O(1) first position is empty
+        :complexity worst: O(N) where N is the tablesize
+        """
+        position = key_hash % self.table_size
+        while self.array[position] is not None:
+            position = (position + 1) % self.table_size
+        return position
+
     def _rehash(self) -> None:
         """
-        Need to resize table and reinsert all values
+        Need to resize table and reinsert all values.
+        Entries are moved as they are, positioned by their stored hash.
 
-        :complexity best: O(N*hash(K)) No probing.
-        :complexity worst: O(N*hash(K) + N^2*comp(K)) Lots of probing.
+        :complexity best: O(N) No probing.
+        :complexity worst: O(N^2) Lots of probing.
         Where N is len(self)
         """
-        old_array = self.array
         self.size_index += 1
         if self.size_index == len(self.TABLE_SIZES):
             # Cannot be resized further.
             return
-        self.array = ArrayR(self.TABLE_SIZES[self.size_index])
-        self.count = 0
-        for item in old_array:
-            if item is not None:
-                key, value = item
-                self[key] = value
+        self._rebuild(self.TABLE_SIZES[self.size_index])
+
+    def _compact(self) -> None:
+        """
+        Reinsert all values into a table of the same size, dropping the tombstones.
+
+        :complexity best: O(M) No probing.
+        :complexity worst: O(M + N^2) Lots of probing.
+        Where N is len(self) and M is the tablesize
+        """
+        self._rebuild(self.table_size)
+
+    def _rebuild(self, size: int) -> None:
+        """
+        Move all the entries into a new array of the given size, positioned by their stored hash.
+
+        :complexity best: O(M) No probing.
+        :complexity worst: O(M + N^2) Lots of probing.
+        Where N is len(self) and M is the old tablesize
+        """
+        old_keys, old_values, old_hashes = self.array, self.value_array, self.hash_array
+        self._allocate(size)
+        self.tombstones = 0
+        for old_position in range(len(old_keys)):
+            key = old_keys[old_position]
+            if key is not None and key is not TOMBSTONE:
+                key_hash = old_hashes[old_position]
+                position = self._free_position(key_hash)
+                self.array[position] = key
+                self.value_array[position] = old_values[old_position]
+                self.hash_array[position] = key_hash
 
     def __str__(self) -> str:
         """
@@ -223,8 +456,6 @@ class LinearProbeTable(Generic[K, V]):
         :complexity: O(N * (str(key) + str(value))) where N is the table size
         """
         result = ""
-        for item in self.array:
-            if item is not None:
-                (key, value) = item
-                result += "(" + str(key) + "," + str(value) + ")\n"
+        for key, value in self.items():
+            result += "(" + str(key) + "," + str(value) + ")\n"
         return result
@@ -3,14 +3,16 @@
 Defines a Hash Table using Linear Probing for conflict resolution.
 It currently rehashes the primary cluster to handle deletion.
 """
+from __future__ import annotations
 __author__ = 'Brendon Taylor & Rupert Ebeling'
 __docformat__ = 'reStructuredText'
 __modified__ = '15/08/2023'
 __since__ = '31/03/2023'
 
+from data_structures.hash_functions import polynomial_hash
 from data_structures.referential_array import ArrayR
 from data_structures.linked_list import LinkedList
-from typing import TypeVar, Generic
+from typing import Callable, Generic, Iterable, Iterator, TypeVar, Union
 
 
 T = TypeVar('T')
@@ -24,22 +26,88 @@ class HashTableSeparateChaining(Generic[T]):
         MIN_CAPACITY: smallest valid table size
         DEFAULT_TABLE_SIZE: default table size used in the __init__
         DEFAULT_HASH_TABLE: default hash base used for the hash function
+        TABLE_SIZES: the prime sizes the table grows through
+        LOAD_FACTOR: largest average chain length before the table grows
 
     attributes:
         count: number of elements in the hash table
         array: used to represent our internal array
+        hash_function: hashes keys independently of the table size, polynomial_hash by default
+
+    The table grows to the next size in TABLE_SIZES once it holds more than
+    LOAD_FACTOR items per chain, so chains stay O(1) long on average.
     """
     MIN_CAPACITY = 1
 
     DEFAULT_TABLE_SIZE = 17
     DEFAULT_HASH_BASE = 31
+    TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869]
+    LOAD_FACTOR = 1
 
-    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE) -> None:
+    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE, hash_function: Union[Callable[[str], int], None] = None) -> None:
         """
+        :param hash_function: hashes keys (modulo the table size) instead of polynomial_hash,
+                              see data_structures.hash_functions
         :complexity: O(A) where A is complexity of ArrayR.__init__()
         """
         self.count = 0
         self.table = ArrayR(max(self.MIN_CAPACITY, table_size))
+        self.hash_function = polynomial_hash if hash_function is None else hash_function
+
+    @classmethod
+    def with_capacity(cls, capacity: int, **kwargs) -> HashTableSeparateChaining[T]:
+        """
+        Creates an empty table that holds `capacity` items without growing, using the
+        smallest size in TABLE_SIZES that does (or the largest size if none does).
+        Any other keyword arguments (hash_function) are passed on to the constructor
+        :complexity: O(M) where M is the size of the table chosen
+        """
+        return cls(cls._size_for(capacity), **kwargs)
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[str, T]], **kwargs) -> HashTableSeparateChaining[T]:
+        """
+        Creates a table holding the given (key, data) pairs, sized for all of them up front.
+        Any other keyword arguments are passed on to the constructor, see with_capacity
+        :complexity: O(B * setitem) where B is the number of pairs
+        """
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        table = cls.with_capacity(len(items), **kwargs)
+        table.update(items)
+        return table
+
+    @classmethod
+    def _size_for(cls, capacity: int) -> int:
+        """
+        Returns the smallest size in TABLE_SIZES that holds `capacity` items without growing,
+        or the largest size if none does
+        :complexity: O(S) where S is the length of TABLE_SIZES
+        """
+        for size in cls.TABLE_SIZES:
+            if capacity <= size * cls.LOAD_FACTOR:
+                return size
+        return cls.TABLE_SIZES[-1]
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Grows the table (never shrinks it) so that it holds `capacity` items without growing
+        :complexity: O(1) if the table is already large enough, otherwise see _rehash
+        """
+        size = self._size_for(capacity)
+        if size > len(self.table):
+            self._rehash(size)
+
+    def update(self, items: Iterable[tuple[str, T]]) -> None:
+        """
+        Sets every (key, data) pair of a batch, reserving room for the whole batch first
+        :complexity: O(B * setitem) where B is the number of pairs, plus one reserve
+        """
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        self.reserve(self.count + len(items))
+        for key, data in items:
+            self[key] = data
 
     def __len__(self) -> int:
         """
@@ -72,23 +140,50 @@ class HashTableSeparateChaining(Generic[T]):
     def __setitem__(self, key: str, data: T) -> None:
         """
         Set a (key, data) pair in our hash table
+        :complexity: O(K + L) where K is the size of the key and L the length of the chain,
+                     which is O(K) expected as the table grows with the number of items
         """
         position = self.hash(key)
         if self.table[position] is None:
             self.table[position] = LinkedList()
 
         # Attempt to find the key in our linked list
-        if len(self.table[position]) > 0:
-            for index, item in enumerate(self.table[position]):
-                if item[0] == key:
-                    # If found update the data
-                    self.table[position][index] = (key, data)
-                    return
-                
+        node = self.table[position].head
+        while node is not None:
+            if node.item[0] == key:
+                # If found update the data in the node
+                node.item = (key, data)
+                return
+            node = node.link
+
         # self.table[position].insert(0, (key, data)) # To insert at the beginning 
         self.table[position].append((key, data))
         self.count += 1
 
+        if self.count > len(self.table) * self.LOAD_FACTOR:
+            self._rehash()
+
+    def _rehash(self, size: int = None) -> None:
+        """
+        Moves every item into a larger table, by default the next size in TABLE_SIZES.
+        Does nothing if the table is already at least as large as the largest size.
+        :complexity: O(M + N*K) where M is the new size, N the number of items and K the size of the largest key
+        """
+        if size is None:
+            size = next((size for size in self.TABLE_SIZES if size > len(self.table)), None)
+            if size is None:
+                # Cannot be resized further.
+                return
+        old_table = self.table
+        self.table = ArrayR(size)
+        for chain in old_table:
+            if chain is not None:
+                for key, data in chain:
+                    position = self.hash(key)
+                    if self.table[position] is None:
+                        self.table[position] = LinkedList()
+                    self.table[position].append((key, data))
+
     def __contains__(self, key: str) -> bool:
         """
         Checks to see if the given key is in the Hash Table
@@ -125,16 +220,11 @@ class HashTableSeparateChaining(Generic[T]):
 
     def hash(self, key: str) -> int:
         """
-        Universal Hash function
+        Hash function, the hash function of the table modulo the table size
         :post: returns a valid position (0 <= value < table_size)
         :complexity: O(K) where K is the size of the key
         """
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % len(self.table)
-            a = a * HashTableSeparateChaining.DEFAULT_HASH_BASE % (len(self.table) - 1)
-        return value
+        return self.hash_function(key) % len(self.table)
 
     def insert(self, key: str, data: T) -> None:
         """
@@ -148,38 +238,36 @@ class HashTableSeparateChaining(Generic[T]):
         Returns an iterator for the hash table
         :complexity: O(N) where N number of items in our hash table
         """
-        for list in self.table:
-            if list is not None:
-                for item in list:
-                    yield item[1]
+        return self.values()
 
-    def keys(self) -> ArrayR[str]:
+    def items(self) -> Iterator[tuple[str, T]]:
         """
-        Returns all keys in the hash table
-        :complexity: O(N) where N number of items in our hash table
+        Yields all (key, data) pairs in the hash table, without copying them
+        The table should not be modified while iterating
+        :complexity: O(M + N) where M is the table size and N the number of items, over the whole iteration
         """
-        res = ArrayR(self.count)
-        i = 0
-        for list in self.table:
-            if list is not None:
-                for item in list:
-                    res[i] = item[0]
-                    i += 1
-        return res
+        for chain in self.table:
+            if chain is not None:
+                node = chain.head
+                while node is not None:
+                    yield node.item
+                    node = node.link
 
-    def values(self) -> ArrayR[T]:
+    def keys(self) -> Iterator[str]:
         """
-        Returns all values in the hash table
-        :complexity: O(N) where N number of items in our hash table
+        Yields all keys in the hash table, see items
+        :complexity: O(M + N) where M is the table size and N the number of items, over the whole iteration
         """
-        res = ArrayR(self.count)
-        i = 0
-        for list in self.table:
-            if list is not None:
-                for item in list:
-                    res[i] = item[1]
-                    i += 1
-        return res
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[T]:
+        """
+        Yields all values in the hash table, see items
+        :complexity: O(M + N) where M is the table size and N the number of items, over the whole iteration
+        """
+        for _, data in self.items():
+            yield data
 
     def __str__(self) -> str:
         """
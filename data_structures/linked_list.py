@@ -60,7 +60,13 @@ class LinkedList(List[T]):
         """ Append the item to the end of the list. 
         Given we have a reference to the rear of the list, this is O(1).
         """
-        self.insert(len(self), item)
+        if self.is_empty():
+            self.insert(0, item)
+        else:
+            new_node = Node(item)
+            self.rear.link = new_node
+            self.rear = new_node
+            self.length += 1
 
     def __get_node_at_index(self, index: int) -> Node[T]:
         if 0 <= index and index <= len(self):
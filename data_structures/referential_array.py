@@ -13,17 +13,25 @@ space to hold the references.
 Note that while I do check the precondition in __init__ (noone else
 would), I do not check that of getitem or setitem, since that is already
 checked by self.array[index].
+
+Bulk operations (slices, copy, fill, +) go through ctypes slice assignment,
+which copies all the references in C rather than one Python call per element.
+A view shares the references of part of another array instead of copying them.
 """
 __author__ = "Julian Garcia for the __init__ code, Maria Garcia de la Banda for the rest"
 __docformat__ = 'reStructuredText'
 
-from ctypes import py_object
-from typing import Generic, Union, TypeVar
+from ctypes import addressof, py_object, sizeof
+from typing import Generic, Iterator, Union, TypeVar
 
 T = TypeVar('T')
 
 
 class ArrayR(Generic[T]):
+    # Type of the elements of the ctypes array, and the value new positions hold
+    CTYPE = py_object
+    EMPTY = None
+
     def __init__(self, length: int) -> None:
         """ Creates an array of references to objects of the given length
         :complexity: O(length) for best/worst case to initialise to None
@@ -31,8 +39,19 @@ class ArrayR(Generic[T]):
         """
         if length <= 0:
             raise ValueError("Array length should be larger than 0.")
-        self.array = (length * py_object)()  # initialises the space
-        self.array[:] = [None for _ in range(length)]
+        self.array = (length * self.CTYPE)()  # initialises the space
+        if self.CTYPE is py_object:
+            # Other ctypes arrays start zeroed, references start as NULL
+            self.array[:] = [None] * length
+
+    @classmethod
+    def _wrap(cls, array) -> ArrayR[T]:
+        """ Creates an ArrayR around an existing ctypes array of references
+        :complexity: O(1)
+        """
+        new_array = cls.__new__(cls)
+        new_array.array = array
+        return new_array
 
     def __len__(self) -> int:
         """ Returns the length of the array
@@ -40,20 +59,118 @@ class ArrayR(Generic[T]):
         """
         return len(self.array)
 
-    def __getitem__(self, index: int) -> T:
-        """ Returns the object in position index.
-        :complexity: O(1)
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, list[T]]:
+        """ Returns the object in position index, or a list of the objects in a slice
+        :complexity: O(1), or O(k) for a slice of k objects
         :pre: index in between 0 and length - self.array[] checks it
         """
         return self.array[index]
 
-    def __setitem__(self, index: int, value: T) -> None:
-        """ Sets the object in position index to value
-        :complexity: O(1)
+    def __setitem__(self, index: Union[int, slice], value: T) -> None:
+        """ Sets the object in position index to value, or the objects in a slice to
+            those of a sequence of the same length
+        :complexity: O(1), or O(k) for a slice of k objects
         :pre: index in between 0 and length - self.array[] checks it
+        :raises ValueError: when the sequence is not as long as the slice
         """
         self.array[index] = value
 
+    def __iter__(self) -> Iterator[T]:
+        """ Returns an iterator over the objects of the array, reading the ctypes array in
+            place rather than copying it. Any number of iterations can run at once, and a
+            position set during an iteration is seen by it if it has not got there yet
+        :complexity: O(1) to create, O(n) where n is the length of the array over the whole iteration
+        """
+        return iter(self.array)
+
+    def __reversed__(self) -> Iterator[T]:
+        """ Returns an iterator over the objects of the array from last to first, see __iter__
+        :complexity: O(1) to create, O(n) where n is the length of the array over the whole iteration
+        """
+        return reversed(self.array)
+
+    def enumerate(self, start: int = 0) -> Iterator[tuple[int, T]]:
+        """ Returns an iterator over (index, object) pairs, with indices counting from start,
+            see __iter__
+        :complexity: O(1) to create, O(n) where n is the length of the array over the whole iteration
+        """
+        return enumerate(self.array, start)
+
+    def index(self, value: T, start: int = 0, stop: Union[int, None] = None) -> int:
+        """ Returns the first position from start up to (not including) stop holding an
+            object equal to value
+        :complexity: O(n*comp) where n is the length of the array
+        :raises ValueError: when no such object is found
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        try:
+            return self.array[start:stop].index(value) + start
+        except ValueError:
+            raise ValueError(f"{value} is not in the array") from None
+
+    def count(self, value: T) -> int:
+        """ Returns the number of objects in the array equal to value
+        :complexity: O(n*comp) where n is the length of the array
+        """
+        return self.array[:].count(value)
+
+    def copy(self, length: Union[int, None] = None) -> ArrayR[T]:
+        """ Returns a new array holding the same objects. With a length, the new array has
+            that length instead, truncating or padding with EMPTY
+        :complexity: O(n) where n is the length of the new array
+        :pre: length > 0
+        """
+        if length is None:
+            length = len(self)
+        if length <= 0:
+            raise ValueError("Array length should be larger than 0.")
+        array = (length * self.CTYPE)()
+        array[:] = self.array[:length] + [self.EMPTY] * (length - len(self))
+        return type(self)._wrap(array)
+
+    def fill(self, value: T, start: int = 0, stop: Union[int, None] = None) -> None:
+        """ Sets every position from start up to (not including) stop to value
+        :complexity: O(k) where k is the number of positions set
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start < stop:
+            self[start:stop] = [value] * (stop - start)
+
+    def view(self, start: int = 0, stop: Union[int, None] = None) -> ArrayR[T]:
+        """ Returns an array over positions start up to (not including) stop of this one,
+            without copying: setting a position of either array changes both.
+            A copy of the view is made when it is pickled
+        :complexity: O(1)
+        :raises ValueError: when the range is empty
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            raise ValueError("Array length should be larger than 0.")
+        return _ArrayView(self, start, stop)
+
+    def __add__(self, other: ArrayR[T]) -> ArrayR[T]:
+        """ Returns a new array holding the objects of this array followed by those of other
+        :complexity: O(n + m) where n and m are the lengths of the arrays
+        """
+        if not isinstance(other, ArrayR):
+            return NotImplemented
+        array = ((len(self) + len(other)) * self.CTYPE)()
+        array[:] = self.array[:] + other.array[:]
+        return type(self)._wrap(array)
+
+    def __getstate__(self) -> list:
+        """ Returns the contents as a list, since ctypes arrays of references cannot be pickled
+        :complexity: O(n) where n is the length of the array
+        """
+        return self.array[:]
+
+    def __setstate__(self, state: list) -> None:
+        """ Rebuilds the array from the list produced by __getstate__
+        :complexity: O(n) where n is the length of the list
+        """
+        self.array = (len(state) * self.CTYPE)()
+        self.array[:] = state
+
     @classmethod
     def from_list(cls, lst: list) -> Union[ArrayR, None]:
         """ Creates an ArrayR from a list
@@ -61,24 +178,65 @@ class ArrayR(Generic[T]):
         """
         if len(lst) == 0:
             return None
-        new_array = cls(len(lst))
-        new_array.array[:] = lst
-        return new_array
+        array = (len(lst) * cls.CTYPE)()
+        array[:] = lst
+        return cls._wrap(array)
 
     def to_list(self) -> list:
         """ Returns a list representation of the array
         :complexity: O(n) where n is the length of the array
         """
-        return [self.array[i] for i in range(len(self))]
+        return self.array[:]
 
     def __str__(self) -> str:
         """ Returns a string representation of the array
         :complexity: O(n) where n is the length of the array
         """
-        return str([self.array[i] for i in range(len(self))])
+        return str(self.array[:])
 
     def __repr__(self) -> str:
         """ Returns a string representation of the array for debugging purposes
         :complexity: O(n) where n is the length of the array
         """
         return str(self)
+
+
+class _ArrayView(ArrayR[T]):
+    """ Positions start up to (not including) stop of another array, see ArrayR.view
+
+    The view reads straight from the memory of its base array. Writes go through the
+    base array instead, as the references in that memory are owned (kept alive) by it.
+    """
+
+    def __init__(self, base: ArrayR[T], start: int, stop: int) -> None:
+        """ :complexity: O(1) """
+        self.array = ((stop - start) * py_object).from_address(addressof(base.array) + start * sizeof(py_object))
+        self.base = base
+        self.start = start
+
+    @classmethod
+    def _wrap(cls, array) -> ArrayR[T]:
+        """ Arrays made from a view (copies, concatenations) are plain arrays """
+        return ArrayR._wrap(array)
+
+    def __setitem__(self, index: Union[int, slice], value: T) -> None:
+        """ Sets the object in position index of the view, or the objects in a slice of it
+        :complexity: See ArrayR.__setitem__, plus O(d) where d is the number of views it is a view of
+        :raises IndexError: when the index is out of the view
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            stop += self.start
+            # A reversed slice that runs to the front of the view stops at -1, which
+            # must not be read as the last position of the base array
+            self.base[self.start + start:stop if stop >= 0 else None:step] = value
+            return
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("invalid index")
+        self.base[self.start + index] = value
+
+    def __reduce__(self) -> tuple:
+        """ Pickles a copy of the viewed objects, as the memory cannot be shared """
+        return ArrayR.from_list, (self.array[:],)
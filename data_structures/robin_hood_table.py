@@ -0,0 +1,159 @@
+""" Hash Table ADT
+
+Defines a Hash Table using Robin Hood Linear Probing for conflict resolution.
+"""
+from __future__ import annotations
+
+from typing import Callable, TypeVar, Union
+from data_structures.hash_table import FullError, LinearProbeTable
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class RobinHoodTable(LinearProbeTable[K, V]):
+    """
+    Robin Hood Linear Probe Table.
+
+    Has the same interface as LinearProbeTable. On insert, a new entry takes the slot
+    of any entry that is closer to its own hash position ("richer") and that entry is
+    moved along instead. This keeps the entries of a cluster ordered by hash position,
+    so probe distances stay short and even at a higher load factor, and a lookup for
+    a missing key stops as soon as it passes where the key would be.
+
+    Deleting shifts the rest of the cluster back by one slot (backward-shift deletion),
+    so no tombstones are needed.
+
+    Type Arguments:
+        - K:    Key Type. In most cases should be string.
+                Otherwise `full_hash` should be overwritten.
+        - V:    Value Type.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    # Largest fraction of the table that can be filled before it is resized
+    LOAD_FACTOR = 0.85
+
+    def __init__(self, sizes=None, hash_function: Union[Callable[[K], int], None] = None) -> None:
+        """
+        Initialise the Hash Table.
+
+        :param hash_function: used as the full hash of this table instead of full_hash.
+        """
+        LinearProbeTable.__init__(self, sizes, hash_function=hash_function)
+
+    def _linear_probe(self, key: K, is_insert: bool, key_hash: int = None) -> int:
+        """
+        Find the position of this key in the hash table, or where it would be inserted.
+        The search stops at the first empty slot or at the first entry closer to its
+        hash position than the key would be, as the key cannot be any further along.
+
+        :param key_hash: full_hash(key), computed if not given.
+        :complexity best: O(hash(key)) first position is empty
+        :complexity worst: O(hash(key) + D*comp(K)) where D is the longest probe distance
+        :raises KeyError: When the key is not in the table, but is_insert is False.
+        :raises FullError: When a table is full and cannot be inserted.
+        """
+        if key_hash is None:
+            key_hash = self.full_hash(key)
+        position = key_hash % self.table_size
+
+        for distance in range(self.table_size):
+            resident = self.array[position]
+            if resident is None:
+                # Empty spot, the key is not in the table.
+                if is_insert:
+                    return position
+                raise KeyError(key)
+            resident_hash = self.hash_array[position]
+            if distance > self._probe_distance(position, resident_hash):
+                # Richer entry, the key is not in the table.
+                if is_insert:
+                    return position
+                raise KeyError(key)
+            elif resident_hash == key_hash and resident == key:
+                return position
+            position = (position + 1) % self.table_size
+
+        if is_insert:
+            raise FullError("Table is full!")
+        else:
+            raise KeyError(key)
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+
+        :complexity best: O(hash(key)) first position is empty
+        :complexity worst: O(hash(key) + D*comp(K) + C) where D is the longest probe distance
+                           and C the length of the cluster that is shifted along.
+        :raises FullError: when the table cannot be resized further.
+        """
+        key_hash = self.full_hash(key)
+        position = self._linear_probe(key, True, key_hash)
+
+        resident = self.array[position]
+        if resident is not None and self.hash_array[position] == key_hash and resident == key:
+            self.value_array[position] = data
+            return
+
+        if self.count == self.table_size:
+            raise FullError("Table is full!")
+        self._shift_in(key, data, key_hash, position)
+        self.count += 1
+
+        if len(self) > self.table_size * self.LOAD_FACTOR:
+            self._rehash()
+
+    def _shift_in(self, key: K, data: V, key_hash: int, position: int) -> None:
+        """
+        Place an entry at a position, moving the rest of the cluster along by one slot.
+        The cluster stays ordered by hash position, so every moved entry still ends up
+        no closer to its hash position than the entries it passed.
+
+        :complexity: O(C) where C is the length of the cluster after the position.
+        """
+        while key is not None:
+            key, self.array[position] = self.array[position], key
+            data, self.value_array[position] = self.value_array[position], data
+            key_hash, self.hash_array[position] = self.hash_array[position], key_hash
+            position = (position + 1) % self.table_size
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table, shifting the following
+        entries of the cluster that are not at their hash position back by one slot.
+
+        :complexity best: O(hash(key)) the next slot is empty or holds an entry at its hash position.
+        :complexity worst: O(hash(key) + D*comp(K) + C) where D is the longest probe distance
+                           and C the length of the cluster.
+        :raises KeyError: when the key doesn't exist.
+        """
+        position = self._linear_probe(key, False)
+        self.count -= 1
+        following = (position + 1) % self.table_size
+        while self.array[following] is not None and self._probe_distance(following, self.hash_array[following]) > 0:
+            self.array[position] = self.array[following]
+            self.value_array[position] = self.value_array[following]
+            self.hash_array[position] = self.hash_array[following]
+            position = following
+            following = (following + 1) % self.table_size
+        self.array[position] = None
+        self.value_array[position] = None
+
+    def _rebuild(self, size: int) -> None:
+        """
+        Move all the entries into a new array of the given size, positioned by their stored hash.
+
+        :complexity best: O(M) No probing.
+        :complexity worst: O(M + N*D) where D is the longest probe distance.
+        Where N is len(self) and M is the old tablesize
+        """
+        old_keys, old_values, old_hashes = self.array, self.value_array, self.hash_array
+        self._allocate(size)
+        for old_position in range(len(old_keys)):
+            key = old_keys[old_position]
+            if key is not None:
+                key_hash = old_hashes[old_position]
+                self._shift_in(key, old_values[old_position], key_hash, self._linear_probe(key, True, key_hash))
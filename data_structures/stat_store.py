@@ -0,0 +1,249 @@
+""" Columnar storage for integer statistics.
+
+Keeps one contiguous array of 64-bit integers per statistic, indexed by a
+dense id handed out to each owner (a player or a team). Reading a stat is an
+index into the array of that stat, and whole-league aggregates such as sums,
+top-k and resets are single passes over one array.
+"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+import weakref
+from array import array
+from enum import Enum
+from heapq import nlargest
+from typing import Generic, Iterable, Iterator, TypeVar, Union
+from data_structures.enum_array import EnumArray, IndexedEnum
+
+E = TypeVar('E', bound=IndexedEnum)
+
+
+class StatStore(Generic[E]):
+    """
+    Columnar store of integer statistics.
+
+    Type Arguments:
+        - E:    The IndexedEnum whose members are the statistics.
+
+    attributes:
+        fields: the statistics held by the store, in enum order
+        columns: one integer array per statistic, indexed by owner id, in an EnumArray
+        owners: a weak reference to the owner of each id, None for free ids
+        versions: the number of writes to each statistic, in an EnumArray, see version
+
+    Ids of owners that have been garbage collected are reused.
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+    TYPECODE = 'q'
+
+    def __init__(self, fields: Iterable[E]) -> None:
+        """
+        :complexity: O(F) where F is the number of fields
+        """
+        self.fields: tuple[E, ...] = tuple(fields)
+        self.enum: type[E] = type(self.fields[0])
+        self.columns: EnumArray[E, array] = EnumArray(self.enum)
+        for field in self.fields:
+            self.columns[field] = array(StatStore.TYPECODE)
+        self.versions: EnumArray[E, int] = EnumArray(self.enum, 0)
+        self.owners: list[Union[weakref.ref, None]] = []
+        self.free_ids: list[int] = []
+
+    def __len__(self) -> int:
+        """
+        Returns the number of owners in the store
+        """
+        return len(self.owners) - len(self.free_ids)
+
+    def allocate(self, owner: object) -> int:
+        """
+        Gives the owner a dense id, with every statistic set to 0.
+        The id is released automatically once the owner is garbage collected.
+
+        :complexity: O(F) where F is the number of fields
+        """
+        if self.free_ids:
+            owner_id = self.free_ids.pop()
+            for column in self.columns.values():
+                column[owner_id] = 0
+            self.owners[owner_id] = weakref.ref(owner)
+        else:
+            owner_id = len(self.owners)
+            for column in self.columns.values():
+                column.append(0)
+            self.owners.append(weakref.ref(owner))
+        weakref.finalize(owner, self.release, owner_id).atexit = False
+        return owner_id
+
+    def release(self, owner_id: int) -> None:
+        """
+        Frees an id so that it can be given to a new owner.
+        """
+        self.owners[owner_id] = None
+        self.free_ids.append(owner_id)
+
+    def get(self, owner_id: int, field: E) -> int:
+        """
+        Returns the value of a statistic for an owner.
+        The column is found by the slot of the field, as in EnumArray.__getitem__
+        but without a second method call, as this is called for every stat read.
+
+        :raises KeyError: when the field is not held by the store.
+        """
+        column = self.columns.items[field.slot] if field.__class__ is self.enum else None
+        if column is None:
+            raise KeyError(field)
+        return column[owner_id]
+
+    def set(self, owner_id: int, field: E, value: int) -> None:
+        """
+        Sets the value of a statistic for an owner.
+        The column is found by the slot of the field, see get.
+
+        :raises KeyError: when the field is not held by the store.
+        """
+        column = self.columns.items[field.slot] if field.__class__ is self.enum else None
+        if column is None:
+            raise KeyError(field)
+        column[owner_id] = value
+        self.versions.items[field.slot] += 1
+
+    def get_row(self, owner_id: int) -> list[int]:
+        """
+        Returns the values of every statistic for an owner, in field order.
+
+        :complexity: O(F) where F is the number of fields
+        """
+        return [self.columns[field][owner_id] for field in self.fields]
+
+    def set_row(self, owner_id: int, values: list[int]) -> None:
+        """
+        Sets the values of every statistic for an owner, in field order.
+
+        :complexity: O(F) where F is the number of fields
+        """
+        for field, value in zip(self.fields, values):
+            self.columns[field][owner_id] = value
+            self.versions[field] += 1
+
+    def reset_row(self, owner_id: int, fields: Union[Iterable[E], None] = None) -> None:
+        """
+        Sets the given statistics (all of them if None) of an owner to 0.
+
+        :complexity: O(F) where F is the number of fields
+        """
+        for field in self.fields if fields is None else fields:
+            self.columns[field][owner_id] = 0
+            self.versions[field] += 1
+
+    def reset(self, fields: Union[Iterable[E], None] = None) -> None:
+        """
+        Sets the given statistics (all of them if None) of every owner to 0.
+
+        :complexity: O(F*N) where F is the number of fields reset and N the number of ids,
+                     done as one array copy per field.
+        """
+        for field in self.fields if fields is None else fields:
+            column = self.columns[field]
+            column[:] = array(StatStore.TYPECODE, [0]) * len(column)
+            self.versions[field] += 1
+
+    def version(self, fields: Iterable[E]) -> int:
+        """
+        Returns a number that changes whenever a statistic of the given fields is written
+        for any owner, through the store or a StatView of it, so that values computed from
+        those statistics can tell when they are out of date.
+
+        :complexity: O(F) where F is the number of fields given
+        """
+        return sum(self.versions[field] for field in fields)
+
+    def total(self, field: E) -> int:
+        """
+        Returns the sum of a statistic over every owner.
+
+        :complexity: O(N) where N is the number of ids
+        """
+        return sum(self.columns[field])
+
+    def top_k(self, field: E, k: int) -> list[tuple[int, object]]:
+        """
+        Returns the k owners with the highest value of a statistic, highest first,
+        as (value, owner) pairs.
+
+        :complexity: O(N*log(k)) where N is the number of ids
+        """
+        column = self.columns[field]
+        live_ids = [owner_id for owner_id in range(len(self.owners)) if self.owners[owner_id] is not None]
+        return [(column[owner_id], self.owners[owner_id]()) for owner_id in nlargest(k, live_ids, key=column.__getitem__)]
+
+    def row(self, owner_id: int) -> StatView[E]:
+        """
+        Returns a view of the statistics of one owner.
+        """
+        return StatView(self, owner_id)
+
+
+class StatView(Generic[E]):
+    """
+    View of the statistics of one owner of a StatStore.
+
+    Can be indexed by the enum members or by their values, like the
+    tables keyed by stat.value that used to hold the statistics.
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    def __init__(self, store: StatStore[E], owner_id: int) -> None:
+        self.store = store
+        self.owner_id = owner_id
+
+    def _field(self, key: Union[E, str]) -> E:
+        """
+        :complexity: O(F) where F is the number of fields, when looked up by value.
+        :raises KeyError: when the key is not one of the fields.
+        """
+        if isinstance(key, Enum):
+            return key
+        for field in self.store.fields:
+            if field.value == key:
+                return field
+        raise KeyError(key)
+
+    def __getitem__(self, key: Union[E, str]) -> int:
+        return self.store.get(self.owner_id, self._field(key))
+
+    def __setitem__(self, key: Union[E, str], value: int) -> None:
+        self.store.set(self.owner_id, self._field(key), value)
+
+    def __contains__(self, key: Union[E, str]) -> bool:
+        try:
+            return self._field(key) in self.store.columns
+        except KeyError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self.store.fields)
+
+    def keys(self) -> Iterator[str]:
+        """
+        Yields the values of the fields.
+
+        :complexity: O(F) where F is the number of fields, over the whole iteration
+        """
+        for field in self.store.fields:
+            yield field.value
+
+    def values(self) -> Iterator[int]:
+        """
+        Yields the statistics, in the same order as keys.
+
+        :complexity: O(F) where F is the number of fields, over the whole iteration
+        """
+        for field in self.store.fields:
+            yield self.store.columns[field][self.owner_id]
+
+    def __str__(self) -> str:
+        result = ""
+        for key, value in zip(self.keys(), self.values()):
+            result += "(" + str(key) + "," + str(value) + ")\n"
+        return result
@@ -0,0 +1,319 @@
+""" Opt-in instrumentation for the hash tables.
+
+enable_stats(table) swaps the class of a table for an instrumented subclass that
+records how the table behaves, and disable_stats(table) swaps it back. Tables
+that are not instrumented run their own methods unchanged, so instrumentation
+costs nothing while it is disabled.
+
+Works with LinearProbeTable, RobinHoodTable, HashyStepTable, HashyPerfectionTable
+(and PerfectHashTable), HashTableSeparateChaining and their subclasses.
+
+Usage:
+```
+stats = enable_stats(team.players_by_name)
+...                                 # play some seasons
+disable_stats(team.players_by_name)
+print(stats.report())
+```
+"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+from time import perf_counter
+from typing import Any, Union
+
+
+class TableStats:
+    """
+    What an instrumented table recorded.
+
+    attributes:
+        searches: histogram of the slots probed (or chain nodes scanned) by searches for a key
+                  that did not fail, including inserts of new keys
+        failed_searches: histogram of the slots probed (or chain nodes scanned) by lookups and
+                         deletes of keys that are not in the table
+        rehashes: number of times the table was rebuilt (grown, shrunk or compacted)
+        rehash_time: total seconds spent rebuilding the table
+        operations: number of inserts, updates and deletes
+        load_factors: (operations, load factor) samples, taken every `sample_interval`
+                      operations and after every rebuild
+        chain_lengths: histogram of the chain lengths of a separate chaining table,
+                       taken when stats are disabled (None for other tables)
+    """
+    DEFAULT_SAMPLE_INTERVAL = 64
+
+    def __init__(self, sample_interval: int = DEFAULT_SAMPLE_INTERVAL) -> None:
+        """
+        :raises ValueError: when the sample interval is not positive.
+        """
+        if sample_interval <= 0:
+            raise ValueError("Sample interval should be larger than 0.")
+        self.sample_interval = sample_interval
+        self.searches: dict[int, int] = {}
+        self.failed_searches: dict[int, int] = {}
+        self.rehashes = 0
+        self.rehash_time = 0.0
+        self.operations = 0
+        self.load_factors: list[tuple[int, float]] = []
+        self.chain_lengths: Union[dict[int, int], None] = None
+
+    def record_search(self, length: int, found: bool) -> None:
+        histogram = self.searches if found else self.failed_searches
+        histogram[length] = histogram.get(length, 0) + 1
+
+    def record_operation(self, load_factor: float) -> None:
+        self.operations += 1
+        if self.operations % self.sample_interval == 0:
+            self.load_factors.append((self.operations, load_factor))
+
+    def record_rehash(self, seconds: float, load_factor: float) -> None:
+        self.rehashes += 1
+        self.rehash_time += seconds
+        self.load_factors.append((self.operations, load_factor))
+
+    @staticmethod
+    def mean(histogram: dict[int, int]) -> float:
+        """
+        Returns the mean of a histogram, 0 if it is empty.
+
+        :complexity: O(H) where H is the number of distinct lengths.
+        """
+        total = sum(histogram.values())
+        return sum(length * times for length, times in histogram.items()) / total if total else 0.0
+
+    def report(self) -> str:
+        """
+        Returns a summary of the stats.
+
+        :complexity: O(H + L) where H is the number of distinct lengths and L the number of load samples.
+        """
+        result = ""
+        result += "Searches: " + str(sum(self.searches.values())) + ", mean length " + \
+                  format(TableStats.mean(self.searches), ".2f") + "\n"
+        result += "Failed searches: " + str(sum(self.failed_searches.values())) + ", mean length " + \
+                  format(TableStats.mean(self.failed_searches), ".2f") + "\n"
+        result += "Search lengths: " + str(dict(sorted(self.searches.items()))) + "\n"
+        result += "Failed search lengths: " + str(dict(sorted(self.failed_searches.items()))) + "\n"
+        if self.chain_lengths is not None:
+            result += "Chain lengths: " + str(dict(sorted(self.chain_lengths.items()))) + "\n"
+        result += "Rehashes: " + str(self.rehashes) + " in " + format(self.rehash_time, ".6f") + "s\n"
+        result += "Load factors: " + ", ".join(
+            str(operations) + ":" + format(load_factor, ".2f") for operations, load_factor in self.load_factors) + "\n"
+        return result
+
+
+class _CountingArray:
+    """
+    Stands in for the array of an open addressing table during a probe, counting the slots read.
+    """
+    __slots__ = ('array', 'reads')
+
+    def __init__(self, array) -> None:
+        self.array = array
+        self.reads = 0
+
+    def __getitem__(self, index: int) -> Any:
+        self.reads += 1
+        return self.array[index]
+
+    def __setitem__(self, index: int, item: Any) -> None:
+        self.array[index] = item
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+
+class _Instrumented:
+    """
+    Methods shared by every instrumented table.
+
+    An instrumented class is made by subclassing the class of the table (and nothing else,
+    so a table can switch between the two) with these methods copied in, along with those
+    of the subclass of _Instrumented for its kind of table. The methods of the table itself
+    are reached through `uninstrumented`.
+    """
+    stats: TableStats
+    # The class the instrumented class was made from
+    uninstrumented: type
+
+    def _stats_load(self) -> float:
+        return len(self) / len(self.array)
+
+    def __setitem__(self, key, data) -> None:
+        self.uninstrumented.__setitem__(self, key, data)
+        self.stats.record_operation(self._stats_load())
+
+    def __delitem__(self, key) -> None:
+        self.uninstrumented.__delitem__(self, key)
+        self.stats.record_operation(self._stats_load())
+
+
+class _InstrumentedOpenAddressing(_Instrumented):
+    """
+    Counts the slots read by each probe, and times every rebuild of the array.
+    """
+
+    def _stats_probe(self, probe, key, is_insert: bool, key_hash: Union[int, None]) -> int:
+        array = self.array
+        counter = _CountingArray(array)
+        self.array = counter
+        try:
+            position = probe(self, key, is_insert, key_hash)
+        except KeyError:
+            self.stats.record_search(counter.reads, False)
+            raise
+        finally:
+            self.array = array
+        self.stats.record_search(counter.reads, True)
+        return position
+
+    def _linear_probe(self, key, is_insert: bool, key_hash: Union[int, None] = None) -> int:
+        return self._stats_probe(self.uninstrumented._linear_probe, key, is_insert, key_hash)
+
+    def _hashy_probe(self, key, is_insert: bool, key_hash: Union[int, None] = None) -> int:
+        return self._stats_probe(self.uninstrumented._hashy_probe, key, is_insert, key_hash)
+
+    def _rebuild(self, size: int) -> None:
+        start = perf_counter()
+        # Probes made while rebuilding are not searches
+        instrumented = self.__class__
+        self.__class__ = instrumented.uninstrumented
+        try:
+            self._rebuild(size)
+        finally:
+            self.__class__ = instrumented
+        self.stats.record_rehash(perf_counter() - start, self._stats_load())
+
+
+class _InstrumentedChaining(_Instrumented):
+    """
+    Counts the chain nodes scanned by each search, and times every growth of the table.
+    """
+
+    def _stats_load(self) -> float:
+        return len(self) / len(self.table)
+
+    def _stats_scan(self, key) -> tuple[int, bool]:
+        """
+        Returns the number of nodes a search for the key scans and whether it finds the key.
+        """
+        chain = self.table[self.hash(key)]
+        node = chain.head if chain is not None else None
+        scanned = 0
+        while node is not None:
+            scanned += 1
+            if node.item[0] == key:
+                return scanned, True
+            node = node.link
+        return scanned, False
+
+    def __getitem__(self, key):
+        self.stats.record_search(*self._stats_scan(key))
+        return self.uninstrumented.__getitem__(self, key)
+
+    def __setitem__(self, key, data) -> None:
+        scanned, _ = self._stats_scan(key)
+        self.stats.record_search(scanned, True)
+        self.uninstrumented.__setitem__(self, key, data)
+        self.stats.record_operation(self._stats_load())
+
+    def __delitem__(self, key) -> None:
+        self.stats.record_search(*self._stats_scan(key))
+        self.uninstrumented.__delitem__(self, key)
+        self.stats.record_operation(self._stats_load())
+
+    def _rehash(self, size: Union[int, None] = None) -> None:
+        old_size = len(self.table)
+        start = perf_counter()
+        self.uninstrumented._rehash(self, size)
+        if len(self.table) != old_size:
+            self.stats.record_rehash(perf_counter() - start, self._stats_load())
+
+    def chain_length_histogram(self) -> dict[int, int]:
+        histogram: dict[int, int] = {}
+        for chain in self.table:
+            length = 0 if chain is None else len(chain)
+            histogram[length] = histogram.get(length, 0) + 1
+        return histogram
+
+
+class _InstrumentedPerfect(_Instrumented):
+    """
+    Every search of a perfect hash table reads a single slot.
+    """
+
+    def _stats_call(self, method, *args):
+        try:
+            result = method(self, *args)
+        except KeyError:
+            self.stats.record_search(1, False)
+            raise
+        self.stats.record_search(1, True)
+        return result
+
+    def __getitem__(self, key):
+        return self._stats_call(self.uninstrumented.__getitem__, key)
+
+    def __setitem__(self, key, data) -> None:
+        self._stats_call(self.uninstrumented.__setitem__, key, data)
+        self.stats.record_operation(self._stats_load())
+
+    def __delitem__(self, key) -> None:
+        self._stats_call(self.uninstrumented.__delitem__, key)
+        self.stats.record_operation(self._stats_load())
+
+
+# Instrumented class made for each table class, so it is only made once
+_instrumented_classes: dict[type, type] = {}
+
+
+def _instrumented_class(table_type: type) -> type:
+    if table_type not in _instrumented_classes:
+        if hasattr(table_type, '_linear_probe') or hasattr(table_type, '_hashy_probe'):
+            methods = _InstrumentedOpenAddressing
+        elif hasattr(table_type, '_rehash'):
+            methods = _InstrumentedChaining
+        else:
+            methods = _InstrumentedPerfect
+        namespace = {}
+        for kind in reversed(methods.__mro__[:-1]):
+            namespace.update((name, value) for name, value in vars(kind).items()
+                             if name not in ('__module__', '__qualname__', '__doc__', '__dict__', '__weakref__'))
+        namespace['uninstrumented'] = table_type
+        namespace['_stats_kind'] = methods
+        _instrumented_classes[table_type] = type("Instrumented" + table_type.__name__, (table_type,), namespace)
+    return _instrumented_classes[table_type]
+
+
+def _is_instrumented(table) -> bool:
+    return type(table) in _instrumented_classes.values()
+
+
+def enable_stats(table, sample_interval: int = TableStats.DEFAULT_SAMPLE_INTERVAL) -> TableStats:
+    """
+    Starts recording stats for a table, or returns the stats being recorded if it already is.
+
+    :complexity: O(1)
+    """
+    if _is_instrumented(table):
+        return table.stats
+    table.stats = TableStats(sample_interval)
+    table.__class__ = _instrumented_class(type(table))
+    return table.stats
+
+
+def disable_stats(table) -> Union[TableStats, None]:
+    """
+    Stops recording stats for a table and returns what was recorded, None if it was not instrumented.
+    For a separate chaining table the current chain lengths are added to the stats.
+
+    :complexity: O(1), or O(M) for a separate chaining table where M is its size.
+    """
+    if not _is_instrumented(table):
+        return None
+    stats = table.stats
+    if table._stats_kind is _InstrumentedChaining:
+        stats.chain_lengths = table.chain_length_histogram()
+    table.__class__ = table.uninstrumented
+    del table.stats
+    return stats
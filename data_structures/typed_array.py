@@ -0,0 +1,90 @@
+""" Fixed width numeric arrays with the interface of ArrayR.
+
+IntArray holds 64 bit integers and FloatArray 64 bit floats, stored directly in a
+ctypes array (8 bytes each) instead of as references to boxed Python numbers.
+New positions hold 0. As in C, integers are stored modulo 2^64 rather than
+checked for overflow.
+
+Both expose their memory through the buffer protocol, so other libraries can use
+it without copying:
+```
+goals = IntArray.from_list([3, 1, 4])
+memoryview(goals)[0]        # 3, on Python 3.12+ (goals.buffer() on earlier versions)
+numpy.asarray(goals)        # shares the memory of goals
+```
+"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+import sys
+from ctypes import addressof, c_double, c_int64, sizeof
+from typing import Union
+from data_structures.referential_array import ArrayR
+
+
+class NumericArray(ArrayR):
+    """ ArrayR of fixed width numbers, see IntArray and FloatArray """
+    # Element type in the notation of the struct module, and of NumPy's array interface
+    # without the byte order
+    FORMAT = ""
+    TYPESTR = ""
+
+    def view(self, start: int = 0, stop: Union[int, None] = None) -> NumericArray:
+        """ Returns an array over positions start up to (not including) stop of this one,
+            without copying: setting a position of either array changes both.
+            As numbers are not references, the view is an array of the same type that
+            writes straight to the shared memory
+        :complexity: O(1)
+        :raises ValueError: when the range is empty
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            raise ValueError("Array length should be larger than 0.")
+        array = ((stop - start) * self.CTYPE).from_address(addressof(self.array) + start * sizeof(self.CTYPE))
+        view = type(self)._wrap(array)
+        # Keeps the memory alive
+        view.base = self
+        return view
+
+    def sum(self) -> Union[int, float]:
+        """ Returns the sum of the numbers in the array
+        :complexity: O(n) where n is the length of the array
+        """
+        return sum(self.array[:])
+
+    def buffer(self) -> memoryview:
+        """ Returns a memoryview of the numbers in the array, sharing its memory
+        :complexity: O(1)
+        """
+        # ctypes gives the format with an explicit byte order, which memoryview cannot index
+        return memoryview(self.array).cast('B').cast(self.FORMAT)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """ Buffer protocol (Python 3.12+), see buffer """
+        return self.buffer()
+
+    @property
+    def __array_interface__(self) -> dict:
+        """ NumPy's array interface, so numpy.asarray shares the memory of the array """
+        return {
+            'shape': (len(self),),
+            'typestr': ('<' if sys.byteorder == 'little' else '>') + self.TYPESTR,
+            'data': (addressof(self.array), False),
+            'version': 3,
+        }
+
+
+class IntArray(NumericArray):
+    """ Array of 64 bit integers """
+    CTYPE = c_int64
+    EMPTY = 0
+    FORMAT = "q"
+    TYPESTR = "i8"
+
+
+class FloatArray(NumericArray):
+    """ Array of 64 bit floats """
+    CTYPE = c_double
+    EMPTY = 0.0
+    FORMAT = "d"
+    TYPESTR = "f8"
@@ -1,17 +1,103 @@
 from __future__ import annotations
-from data_structures.hash_table import LinearProbeTable
 from data_structures.referential_array import ArrayR
-from constants import PlayerPosition, PlayerStats, ResultStats
+from constants import ResultStats
+from goal_distribution import GoalDistribution
 from player import Player
+from player_sampler import PlayerSampler
 from random_gen import RandomGen
 from team import Team
+from typing import Iterator, Union
+
+
+
+class GameOutcome:
+    """
+    The result of a simulated game.
+
+    Holds the goals and the names of the players involved in each kind of event
+    as plain attributes. The name arrays are None when nothing of that kind happened.
+
+    Also behaves like the table that GameSimulator.simulate used to return, so
+    result[ResultStats.HOME_GOALS.value] still works for existing callers.
+    """
+    __slots__ = ('home_goals', 'away_goals', 'goal_scorers', 'goal_assists', 'tackles', 'interceptions')
+
+    # Attribute holding the value of each ResultStats key
+    FIELDS = {
+        ResultStats.HOME_GOALS.value: 'home_goals',
+        ResultStats.AWAY_GOALS.value: 'away_goals',
+        ResultStats.GOAL_SCORERS.value: 'goal_scorers',
+        ResultStats.GOAL_ASSISTS.value: 'goal_assists',
+        ResultStats.TACKLES.value: 'tackles',
+        ResultStats.INTERCEPTIONS.value: 'interceptions',
+    }
+
+    def __init__(self, home_goals: int, away_goals: int,
+                 goal_scorers: Union[ArrayR[str], None] = None, goal_assists: Union[ArrayR[str], None] = None,
+                 tackles: Union[ArrayR[str], None] = None, interceptions: Union[ArrayR[str], None] = None) -> None:
+        self.home_goals: int = home_goals
+        self.away_goals: int = away_goals
+        self.goal_scorers: Union[ArrayR[str], None] = goal_scorers
+        self.goal_assists: Union[ArrayR[str], None] = goal_assists
+        self.tackles: Union[ArrayR[str], None] = tackles
+        self.interceptions: Union[ArrayR[str], None] = interceptions
+
+    def __getitem__(self, key: str):
+        """
+        Returns the value for a ResultStats key.
+
+        :complexity: O(1)
+        :raises KeyError: when the key is not a ResultStats value.
+        """
+        return getattr(self, GameOutcome.FIELDS[key])
+
+    def __setitem__(self, key: str, value) -> None:
+        """
+        Sets the value for a ResultStats key.
+
+        :complexity: O(1)
+        :raises KeyError: when the key is not a ResultStats value.
+        """
+        setattr(self, GameOutcome.FIELDS[key], value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in GameOutcome.FIELDS
+
+    def __len__(self) -> int:
+        return len(GameOutcome.FIELDS)
+
+    def keys(self) -> Iterator[str]:
+        """
+        Yields all the ResultStats keys.
+
+        :complexity: O(K) where K is the number of ResultStats, over the whole iteration.
+        """
+        return iter(GameOutcome.FIELDS)
+
+    def values(self) -> Iterator:
+        """
+        Yields the values of all the ResultStats keys, in the same order as keys.
+
+        :complexity: O(K) where K is the number of ResultStats, over the whole iteration.
+        """
+        for field in GameOutcome.FIELDS.values():
+            yield getattr(self, field)
 
+    def __str__(self) -> str:
+        return (f"GameOutcome(home_goals={self.home_goals}, away_goals={self.away_goals}, "
+                f"goal_scorers={self.goal_scorers}, goal_assists={self.goal_assists}, "
+                f"tackles={self.tackles}, interceptions={self.interceptions})")
+
+    def __repr__(self) -> str:
+        return str(self)
 
 
 class GameSimulator:
+    # Distribution of goals scored by each team, replace it to configure the simulator
+    goal_distribution: GoalDistribution = GoalDistribution.default()
 
     @staticmethod
-    def simulate(home_team: Team, away_team: Team) -> LinearProbeTable:
+    def simulate(home_team: Team, away_team: Team, goals: Union[tuple[int, int], None] = None) -> GameOutcome:
         """
         Simulates a game between two teams, considering player stats for a more probabilistic outcome.
         Note: To call this method, use: GameSimulator.simulate(home_team, away_team)
@@ -19,92 +105,47 @@ class GameSimulator:
         Args:
             home_team (Team): The home team.
             away_team (Team): The away team.
+            goals (Union[tuple[int, int], None]): The (home goals, away goals) of the game, for example
+                from GoalDistribution.draw_fixtures. If None, they are drawn from goal_distribution.
 
         Returns:
-            LinearProbeTable: A table with keys 'Home Goals', 'Away Goals', 'Goal Scorers',
-                            'Goal Assists', 'Interceptions', 'Tacklers'
+            GameOutcome: The goals, goal scorers, goal assists, tackles and interceptions of the game.
+                It can also be indexed with the keys 'Home Goals', 'Away Goals', 'Goal Scorers',
+                'Goal Assists', 'Interceptions', 'Tackles'
         """
-        result_table: LinearProbeTable = LinearProbeTable()
-
         # 1. Determine goals scored by each team with a higher likelihood of low scores
-        goal_distribution: list[int] = [0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5
-        home_goals: int = RandomGen.random_choice(goal_distribution)
-        away_goals: int = RandomGen.random_choice(goal_distribution)
-        result_table[ResultStats.HOME_GOALS.value] = home_goals
-        result_table[ResultStats.AWAY_GOALS.value] = away_goals
+        if goals is None:
+            home_goals: int = GameSimulator.goal_distribution.draw()
+            away_goals: int = GameSimulator.goal_distribution.draw()
+        else:
+            home_goals, away_goals = goals
 
         # 2. Select goal scorers and assist providers based on stats
         goal_scorers: list[str] = []
         goal_assists: list[str] = []
-        home_players: ArrayR[Player] = home_team.get_players()
-        away_players: ArrayR[Player] = away_team.get_players()
-
-        # Get a list of outfield player from both teams
-        home_outfield: list[Player] = [player for player in home_players if player.get_position() != PlayerPosition.GOALKEEPER]
-        away_outfield: list[Player] = [player for player in away_players if player.get_position() != PlayerPosition.GOALKEEPER]
-
-        all_players: ArrayR[Player] = ArrayR(len(home_players) + len(away_players))
-
-        for i in range(len(home_players)):
-            all_players[i] = home_players[i]
-
-        for i in range(len(away_players)):
-            all_players[i + len(home_players)] = away_players[i]
+        home_sampler: PlayerSampler = home_team.get_sampler()
+        away_sampler: PlayerSampler = away_team.get_sampler()
 
         for _ in range(home_goals):
-            scorer: Player = GameSimulator.__weighted_choice(home_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
+            scorer: Player = home_sampler.choose_scorer()
             goal_scorers.append(scorer.get_name())
 
             if RandomGen.random_chance(0.7):  # 70% chance of an assist
-                assist: Player = GameSimulator.__weighted_choice(home_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
+                assist: Player = home_sampler.choose_assister()
                 goal_assists.append(assist.get_name())
 
         for _ in range(away_goals):
-            scorer: Player = GameSimulator.__weighted_choice(away_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
+            scorer: Player = away_sampler.choose_scorer()
             goal_scorers.append(scorer.get_name())
 
             if RandomGen.random_chance(0.7):  # 70% chance of an assist
-                assist: Player = GameSimulator.__weighted_choice(away_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
+                assist: Player = away_sampler.choose_assister()
                 goal_assists.append(assist.get_name())
 
-        result_table[ResultStats.GOAL_SCORERS.value] = ArrayR.from_list(goal_scorers)
-        result_table[ResultStats.GOAL_ASSISTS.value] = ArrayR.from_list(goal_assists)
-
         # 3. Assign interceptions and tackles based on defensive stats
-        interceptions: list[str] = [GameSimulator.__weighted_choice(all_players, PlayerStats.HEIGHT).get_name() for _ in range(RandomGen.randint(0, 10))]
-        tackles: list[str] = [GameSimulator.__weighted_choice(all_players, PlayerStats.HEIGHT).get_name() for _ in range(RandomGen.randint(0, 10))]
-
-        result_table[ResultStats.TACKLES.value] = ArrayR.from_list(tackles)
-        result_table[ResultStats.INTERCEPTIONS.value] = ArrayR.from_list(interceptions)
+        interceptions: list[str] = [PlayerSampler.choose_defender(home_sampler, away_sampler).get_name() for _ in range(RandomGen.randint(0, 10))]
+        tackles: list[str] = [PlayerSampler.choose_defender(home_sampler, away_sampler).get_name() for _ in range(RandomGen.randint(0, 10))]
 
-        return result_table
-
-    @staticmethod
-    def __weighted_choice(players: list, *attributes: str) -> Player:
-        """
-        Selects a player based on weighted stats.
-
-        Args:
-            players (list): List of players to choose from.
-            *attributes (str): Attributes to consider for weighting.
-
-        Returns:
-            Player: The selected player.
-        """
-        total_weight: int = sum(
-            sum(player[attr] for attr in attributes) for player in players
-        )
-
-        if total_weight == 0:  # Handle edge case where all weights are zero
-            return RandomGen.random_choice(players)
-
-        rand_val: int = RandomGen.random_choice(range(total_weight))
-        cumulative_weight: int = 0
-        for player in players:
-            player_weight: int = sum(player[attr] for attr in attributes)
-            cumulative_weight += player_weight
-            if cumulative_weight >= rand_val:
-                return player
-
-        # Fallback in case rounding errors cause a miss
-        return RandomGen.random_choice(players)
+        return GameOutcome(home_goals, away_goals,
+                           ArrayR.from_list(goal_scorers), ArrayR.from_list(goal_assists),
+                           ArrayR.from_list(tackles), ArrayR.from_list(interceptions))
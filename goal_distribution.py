@@ -0,0 +1,93 @@
+from __future__ import annotations
+from bisect import bisect_right
+from data_structures.referential_array import ArrayR
+from random_gen import RandomGen
+from typing import Union
+
+
+class GoalDistribution:
+    """
+    Distribution of the number of goals a team scores in a game.
+
+    Built once from integer weights, where weights[g] is the relative likelihood of
+    scoring g goals. The cumulative weights are precomputed, so a draw is one random
+    number and a binary search rather than building and indexing a list with one
+    entry per unit of weight.
+
+    Drawing `g` with weights summing to W uses RandomGen.randint(0, W - 1), the same
+    number RandomGen.random_choice would use on a list of W goal counts, so seeded
+    games keep their results.
+
+    Usage:
+    ```
+    distribution = GoalDistribution([30, 30, 20, 10, 5, 5])
+    distribution.draw()                 # 0 goals 30% of the time, 5 goals 5% of the time
+    distribution.draw_fixtures(10)      # (home goals, away goals) for 10 fixtures
+    ```
+    """
+
+    # Weights used by the game simulator unless it is configured otherwise
+    DEFAULT_WEIGHTS = [30, 30, 20, 10, 5, 5]
+
+    def __init__(self, weights: Union[list[int], ArrayR[int]]) -> None:
+        """
+        Args:
+            weights (Union[list[int], ArrayR[int]]): weights[g] is the weight of scoring g goals.
+
+        Raises:
+            ValueError: If a weight is negative or all the weights are zero.
+
+        Complexity:
+            Best Case Complexity: O(G) where G is the number of weights.
+            Worst Case Complexity: O(G) where G is the number of weights.
+        """
+        self.cumulative_weights: list[int] = []
+        total_weight: int = 0
+        for weight in weights:
+            if weight < 0:
+                raise ValueError("Goal weights cannot be negative.")
+            total_weight += weight
+            self.cumulative_weights.append(total_weight)
+
+        if total_weight == 0:
+            raise ValueError("At least one goal weight should be larger than 0.")
+        self.total_weight: int = total_weight
+
+    @classmethod
+    def default(cls) -> GoalDistribution:
+        """
+        Returns the distribution used by the game simulator by default,
+        with a higher likelihood of low scores.
+        """
+        return cls(cls.DEFAULT_WEIGHTS)
+
+    def draw(self) -> int:
+        """
+        Returns a random number of goals.
+
+        Complexity:
+            Best Case Complexity: O(log(G)) where G is the number of weights.
+            Worst Case Complexity: O(log(G)) where G is the number of weights.
+        """
+        return bisect_right(self.cumulative_weights, RandomGen.randint(0, self.total_weight - 1))
+
+    def draw_fixtures(self, num_fixtures: int) -> ArrayR[tuple[int, int]]:
+        """
+        Draws the home and away goals for a batch of fixtures in one call.
+        The goals are drawn in the order home, away, home, away, ...
+
+        Returns:
+            ArrayR[tuple[int, int]]: The (home goals, away goals) of each fixture.
+
+        Complexity:
+            Best Case Complexity: O(F * log(G)) where F is the number of fixtures and G the number of weights.
+            Worst Case Complexity: O(F * log(G)) where F is the number of fixtures and G the number of weights.
+        """
+        cumulative_weights = self.cumulative_weights
+        last = self.total_weight - 1
+        fixtures: ArrayR[tuple[int, int]] = ArrayR(num_fixtures)
+        for i in range(num_fixtures):
+            home_goals = bisect_right(cumulative_weights, RandomGen.randint(0, last))
+            away_goals = bisect_right(cumulative_weights, RandomGen.randint(0, last))
+            fixtures[i] = (home_goals, away_goals)
+        return fixtures
@@ -0,0 +1,159 @@
+"""
+Hash function benchmark.
+
+Compares the hash functions of data_structures.hash_functions on corpora of keys
+like the ones the tables hold: player names, stat keys, and player names crafted
+to collide under the default polynomial hash. For each corpus and hash function
+it reports how many keys collide and how fast keys are hashed and stored.
+
+Usage:
+```
+python hash_benchmark.py --keys 2000 --repeat 5
+```
+"""
+from __future__ import annotations
+import argparse
+from itertools import product
+from time import perf_counter
+from typing import Callable
+from constants import PlayerStats
+from data_structures.hash_functions import SeededHash, builtin_hash, fnv1a_hash, polynomial_hash
+from data_structures.hash_table import LinearProbeTable
+
+FIRST_NAMES = [
+    "Alexey", "Maria", "Jordan", "Luca", "Sofia", "Mateo", "Amara", "Kenji", "Chloe", "Omar",
+    "Freya", "Diego", "Nadia", "Tomas", "Zara", "Hugo", "Ingrid", "Kwame", "Lena", "Rafael",
+    "Yuki", "Ethan", "Priya", "Jonas", "Aisha", "Marco", "Elif", "Samuel", "Noor", "Viktor",
+]
+LAST_NAMES = [
+    "Smith", "Garcia", "Muller", "Rossi", "Silva", "Kowalski", "Nguyen", "Okafor", "Jensen", "Haddad",
+    "Tanaka", "Dubois", "Petrov", "Santos", "Novak", "Andersen", "Kim", "Mensah", "Costa", "Fischer",
+    "Ivanova", "Moreau", "Yilmaz", "Larsen", "Bianchi", "Walsh", "Suzuki", "Herrera", "Bakker", "Osei",
+]
+
+
+def player_names(count: int) -> list[str]:
+    """
+    Returns `count` distinct player names, numbered once every first and last name pair is used.
+
+    Complexity:
+        Best Case Complexity: O(N) where N is count.
+        Worst Case Complexity: O(N) where N is count.
+    """
+    pairs = [first + " " + last for first, last in product(FIRST_NAMES, LAST_NAMES)]
+    return [pairs[i % len(pairs)] + ("" if i < len(pairs) else " " + str(i // len(pairs))) for i in range(count)]
+
+
+def stat_keys(count: int) -> list[str]:
+    """
+    Returns `count` keys made of a player name and the name of one of their stats.
+
+    Complexity:
+        Best Case Complexity: O(N) where N is count.
+        Worst Case Complexity: O(N) where N is count.
+    """
+    stats = list(PlayerStats)
+    names = player_names(-(-count // len(stats)))
+    return [name + ": " + stat.value for name, stat in product(names, stats)][:count]
+
+
+def crafted_names(count: int) -> list[str]:
+    """
+    Returns `count` player names that all start at the same slot of a LinearProbeTable sized
+    for them when it uses the default polynomial hash, as an adversary who knows the hash could.
+
+    Complexity:
+        Best Case Complexity: O(N*M) where N is count and M the size of the table for N keys.
+        Worst Case Complexity: O(N*M) as above.
+    """
+    size = LinearProbeTable.with_capacity(count).table_size
+    names = []
+    candidates = 0
+    while len(names) < count:
+        batch = player_names(candidates + size * count)[candidates:]
+        candidates += len(batch)
+        names.extend(name for name in batch if polynomial_hash(name) % size == 0)
+    return names[:count]
+
+
+def hash_stats(hash_function: Callable[[str], int], keys: list[str], repeat: int) -> dict[str, float]:
+    """
+    Measures a hash function on a list of distinct keys.
+
+    Returns:
+        dict[str, float]: with
+            hash_collisions: keys with the same full hash as an earlier key
+            slot_collisions: fraction of keys whose first slot, in a LinearProbeTable sized
+                for the keys, is the first slot of an earlier key
+            mean_probe: mean probe distance of the keys in that table
+            hashes_per_second, operations_per_second: best of `repeat` runs, where an
+                operation is an insert or a lookup
+
+    Complexity:
+        Best Case Complexity: O(R*N*L) where R is repeat, N the number of keys and L their length.
+        Worst Case Complexity: O(R*N*(L + N)) when the keys all cluster together.
+    """
+    hashes = [hash_function(key) for key in keys]
+    size = LinearProbeTable.with_capacity(len(keys)).table_size
+    slots = set()
+    slot_collisions = 0
+    for key_hash in hashes:
+        if key_hash % size in slots:
+            slot_collisions += 1
+        slots.add(key_hash % size)
+
+    hash_time = table_time = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        for key in keys:
+            hash_function(key)
+        hash_time = min(hash_time, perf_counter() - start)
+
+        start = perf_counter()
+        table = LinearProbeTable(hash_function=hash_function)
+        table.reserve(len(keys))
+        for i, key in enumerate(keys):
+            table[key] = i
+        for key in keys:
+            table[key]
+        table_time = min(table_time, perf_counter() - start)
+
+    return {
+        'hash_collisions': len(keys) - len(set(hashes)),
+        'slot_collisions': slot_collisions / len(keys),
+        'mean_probe': table.mean_probe_distance(),
+        'hashes_per_second': len(keys) / hash_time,
+        'operations_per_second': 2 * len(keys) / table_time,
+    }
+
+
+if __name__ == "__main__":
+
+    p = argparse.ArgumentParser(description="Benchmark the hash functions of the hash tables.")
+    p.add_argument("--keys", type=int, default=2000, help="Number of keys in each corpus.")
+    p.add_argument("--crafted", type=int, default=100,
+                   help="Number of keys crafted to collide under the polynomial hash.")
+    p.add_argument("--repeat", type=int, default=5, help="Number of timed runs, the best is reported.")
+    p.add_argument("--seed", type=int, default=None, help="Seed of the seeded hash, random if not given.")
+    args = p.parse_args()
+
+    hash_functions = {
+        "polynomial": polynomial_hash,
+        "builtin": builtin_hash,
+        "fnv1a": fnv1a_hash,
+        "seeded": SeededHash(args.seed),
+    }
+    corpora = {
+        "player names": player_names(args.keys),
+        "stat keys": stat_keys(args.keys),
+        "crafted names": crafted_names(args.crafted),
+    }
+
+    print(f"{'corpus':<15}{'hash':<12}{'collisions':>11}{'slot coll.':>11}{'mean probe':>11}"
+          f"{'hashes/s':>12}{'ops/s':>12}")
+    for corpus, keys in corpora.items():
+        for name, hash_function in hash_functions.items():
+            stats = hash_stats(hash_function, keys, args.repeat)
+            print(f"{corpus:<15}{name:<12}{stats['hash_collisions']:>11}{stats['slot_collisions']:>11.1%}"
+                  f"{stats['mean_probe']:>11.2f}{stats['hashes_per_second']:>12,.0f}"
+                  f"{stats['operations_per_second']:>12,.0f}")
@@ -3,8 +3,9 @@ from __future__ import annotations
 __author__ = 'Brendon Taylor'
 __since__ = '22/08/2024'
 
+from data_structures.hash_functions import fnv1a_hash
 from data_structures.referential_array import ArrayR
-from typing import Generic, Union, TypeVar
+from typing import Generic, Iterable, Iterator, Union, TypeVar
 
 K = TypeVar('K')
 V = TypeVar('V')
@@ -48,33 +49,36 @@ class HashyPerfectionTable(Generic[K, V]):
         """
         return self.count
 
-    def keys(self) -> ArrayR[K]:
+    def items(self) -> Iterator[tuple[K, V]]:
         """
-        Returns all keys in the hash table.
+        Yields all (key, value) pairs in the hash table, without copying them.
+        The table should not be modified while iterating.
 
-        :complexity: O(N) where N is self.table_size.
+        :complexity: O(N) where N is self.table_size, over the whole iteration.
         """
-        res = ArrayR(len(self.array))
-        i = 0
-        for x in range(len(self)):
-            if self.array[x] is not None:
-                res[i] = self.array[x][0]
-                i += 1
-        return res
+        for item in self.array:
+            if item is not None:
+                yield item[0], item[1]
+
+    def keys(self) -> Iterator[K]:
+        """
+        Yields all keys in the hash table, see items.
+
+        :complexity: O(N) where N is self.table_size, over the whole iteration.
+        """
+        for item in self.array:
+            if item is not None:
+                yield item[0]
 
-    def values(self) -> ArrayR[V]:
+    def values(self) -> Iterator[V]:
         """
-        Returns all values in the hash table.
+        Yields all values in the hash table, see items.
 
-        :complexity: O(N) where N is self.table_size.
+        :complexity: O(N) where N is self.table_size, over the whole iteration.
         """
-        res = ArrayR(len(self.array))
-        i = 0
-        for x in range(len(self)):
-            if self.array[x] is not None:
-                res[i] = self.array[x][1]
-                i += 1
-        return res
+        for item in self.array:
+            if item is not None:
+                yield item[1]
 
     def __contains__(self, key: K) -> bool:
         """
@@ -103,8 +107,8 @@ class HashyPerfectionTable(Generic[K, V]):
         KeyError: When the key doesn't exist.
         """
         
-        position = self.hash(key) % 13
-        if self.array[position] is None:
+        position = self.hash(key) % len(self.array)
+        if self.array[position] is None or self.array[position][0] != key:
             raise KeyError(f"{key} not found")
         return self.array[position][1]
 
@@ -121,7 +125,7 @@ class HashyPerfectionTable(Generic[K, V]):
         Raises:
         KeyError: When the key doesn't exist.
         """
-        position = self.hash(key) % 13  
+        position = self.hash(key) % len(self.array)
 
         if self.array[position] is not None and self.array[position][0] != key:
             raise KeyError("Hash collision")
@@ -144,7 +148,7 @@ class HashyPerfectionTable(Generic[K, V]):
         Raises:
         KeyError: When the key doesn't exist.
         """
-        position = self.hash(key) % 13  # Ensure index is within table bounds
+        position = self.hash(key) % len(self.array)  # Ensure index is within table bounds
         if self.array[position] is None or self.array[position][0] != key:
             raise KeyError(f"{key} not found")
         self.array[position] = None
@@ -170,3 +174,142 @@ class HashyPerfectionTable(Generic[K, V]):
                 (key, value) = item
                 result += "(" + str(key) + "," + str(value) + ")\n"
         return result
+
+
+class PerfectHashTable(HashyPerfectionTable[K, V]):
+    """
+    HashyPerfectionTable with a perfect hash function generated for any fixed set of keys,
+    using hash and displace (CHD).
+
+    Every key has a 64 bit FNV-1a hash. The keys are split into buckets by their hash and
+    each bucket is given a displacement (d0, d1), chosen largest bucket first, so that the
+    positions (f1 + d0*f2 + d1) % table_size of its keys are distinct and still free, where
+    f1 and f2 also come from the hash. If two keys cannot be separated the seed of the hash
+    is changed and the construction starts again.
+
+    By default the table has one slot per key (a minimal perfect hash). The key each slot
+    belongs to is kept, so any key outside the set raises KeyError, even when its slot is empty.
+
+    Usage:
+    ```
+    table = PerfectHashTable([stat.value for stat in TeamStats])
+    table[TeamStats.POINTS.value] = 3
+    ```
+    """
+
+    # Average number of keys per bucket
+    BUCKET_SIZE = 2
+    MAX_SEEDS = 100
+
+    def __init__(self, keys: Iterable[K], table_size: Union[int, None] = None) -> None:
+        """
+        Generate the hash function for the keys.
+
+        Args:
+        keys: The keys the table can hold, which should be distinct strings.
+        table_size: The number of slots, at least the number of keys. The number of keys if None.
+
+        Raises:
+        ValueError: When the keys are not distinct, the table is too small
+            or no hash function was found.
+
+        Complexity:
+        Best Case Complexity: O(N*L) where N is the number of keys and L the length of the longest key,
+            when the first displacement tried fits every bucket.
+        Worst Case Complexity: O(S*N*(L + M^2)) where S is MAX_SEEDS and M the table size. In practice
+            the first seed nearly always works and most buckets fit within a few displacements.
+        """
+        keys = list(keys)
+        if len(set(keys)) != len(keys):
+            raise ValueError("The keys of a perfect hash table should be distinct.")
+        size = len(keys) if table_size is None else table_size
+        if size < len(keys):
+            raise ValueError("The table should have at least one slot per key.")
+
+        self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(max(size, 1))
+        self.count: int = 0
+        self.num_buckets: int = max(1, -(-len(keys) // PerfectHashTable.BUCKET_SIZE))
+
+        for seed in range(PerfectHashTable.MAX_SEEDS):
+            self.seed: int = seed
+            displacements = self.__displace(keys)
+            if displacements is not None:
+                self.displacements: list[int] = displacements
+                self.slot_keys: ArrayR[Union[K, None]] = ArrayR(len(self.array))
+                for key in keys:
+                    self.slot_keys[self.__slot(key)] = key
+                return
+        raise ValueError("No perfect hash function was found for the keys.")
+
+    def __displace(self, keys: list[K]) -> Union[list[int], None]:
+        """
+        Choose a displacement for each bucket with the current seed.
+
+        Returns:
+        The displacement d0 * table_size + d1 of each bucket, or None if a bucket did not fit.
+
+        Complexity:
+        Best Case Complexity: O(N*L) where N is the number of keys and L the length of the longest key.
+        Worst Case Complexity: O(N*(L + M^2)) where M is the table size.
+        """
+        size = len(self.array)
+        buckets: list[list[int]] = [[] for _ in range(self.num_buckets)]
+        for key in keys:
+            key_hash = fnv1a_hash(key, self.seed)
+            buckets[key_hash % self.num_buckets].append(key_hash)
+
+        displacements = [0] * self.num_buckets
+        taken = [False] * size
+        for bucket in sorted(range(self.num_buckets), key=lambda b: len(buckets[b]), reverse=True):
+            if not buckets[bucket]:
+                break
+            for displacement in range(size * size):
+                d0, d1 = divmod(displacement, size)
+                positions = {self.__position(key_hash, d0, d1) for key_hash in buckets[bucket]}
+                if len(positions) == len(buckets[bucket]) and not any(taken[p] for p in positions):
+                    for position in positions:
+                        taken[position] = True
+                    displacements[bucket] = displacement
+                    break
+            else:
+                return None
+        return displacements
+
+    def __position(self, key_hash: int, d0: int, d1: int) -> int:
+        """
+        Position of a key with the given hash in a bucket with displacement (d0, d1).
+        """
+        size = len(self.array)
+        f1 = (key_hash >> 16) % size
+        f2 = (key_hash >> 40) % size
+        return (f1 + d0 * f2 + d1) % size
+
+    def __slot(self, key: K) -> int:
+        """
+        Position the hash function gives the key, whether or not it is in the set.
+
+        Complexity:
+        Best Case Complexity:O(len(key))
+        Worst Case Complexity:O(len(key))
+        """
+        key_hash = fnv1a_hash(key, self.seed)
+        d0, d1 = divmod(self.displacements[key_hash % self.num_buckets], len(self.array))
+        return self.__position(key_hash, d0, d1)
+
+    def hash(self, key: K) -> int:
+        """
+        Hash a key for insert/retrieve/update into the hashtable.
+        Every key of the set has its own position, so getting, setting or deleting
+        any other key raises KeyError.
+
+        Complexity:
+        Best Case Complexity:O(len(key))
+        Worst Case Complexity:O(len(key) + comp(K))
+
+        Raises:
+        KeyError: When the key is not one of the keys of the table.
+        """
+        position = self.__slot(key)
+        if self.slot_keys[position] != key:
+            raise KeyError(f"{key} not found")
+        return position
@@ -6,8 +6,10 @@ from __future__ import annotations
 __author__ = 'Jackson Goerner'
 __since__ = '07/02/2023'
 
+from data_structures.hash_table import TOMBSTONE
+from data_structures.hash_functions import polynomial_hash
 from data_structures.referential_array import ArrayR
-from typing import Generic, TypeVar, Union
+from typing import Callable, Generic, Iterable, Iterator, TypeVar, Union
 
 K = TypeVar('K')
 V = TypeVar('V')
@@ -27,6 +29,16 @@ class HashyStepTable(Generic[K, V]):
                 Otherwise `hash` should be overwritten.
         - V:    Value Type.
 
+    Entries are kept in three parallel arrays: `array` holds the keys (or None for an
+    empty slot), `value_array` the values and `hash_array` the hashes. Updating a key
+    only writes its value slot, and no object is allocated per entry.
+    The hash does not depend on the table size and the step is derived from it, so
+    neither is recomputed when probing past an entry, deleting or resizing.
+
+    Deleting marks the slot with TOMBSTONE, which probes skip and inserts reuse. The table
+    is rebuilt once tombstones fill more than TOMBSTONE_THRESHOLD of it. With `shrink`, the
+    table also moves down a size once it is less than SHRINK_LOAD_FACTOR full.
+
     Unless stated otherwise, all methods have O(1) complexity.
     """
 
@@ -34,50 +46,146 @@ class HashyStepTable(Generic[K, V]):
     TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869]
 
     HASH_BASE = 31
-
-    def __init__(self, sizes=None) -> None:
+    STEP_PRIME = 7
+    # Largest fraction of the table that can be filled before it is resized
+    LOAD_FACTOR = 2 / 3
+    # Fraction of the table that tombstones can fill before it is rebuilt
+    TOMBSTONE_THRESHOLD = 1 / 6
+    # Fraction of the table below which a shrinking table moves down a size
+    SHRINK_LOAD_FACTOR = 1 / 6
+
+    def __init__(self, sizes=None, shrink: bool = False, hash_function: Union[Callable[[K], int], None] = None) -> None:
         """
         Initialise the Hash Table.
 
+        Args:
+        sizes: The table sizes to use instead of TABLE_SIZES.
+        shrink: Whether the table moves down a size once deletions leave it mostly empty.
+        hash_function: Used as the hash of this table instead of hash,
+            see data_structures.hash_functions.
+
         Complexity:
         Best Case Complexity: O(max(N, M)) where N is the length of TABLE_SIZES and M is the length of sizes.
         Worst Case Complexity: O(max(N, M)) where N is the length of TABLE_SIZES and M is the length of sizes.
         """
         if sizes is not None:
             self.TABLE_SIZES = sizes
+        if hash_function is not None:
+            self.hash = hash_function
         self.size_index = 0
-        self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(self.TABLE_SIZES[self.size_index])
+        self._allocate(self.TABLE_SIZES[self.size_index])
         self.count = 0
+        self.tombstones = 0
+        self.shrink = shrink
+
+    def _allocate(self, size: int) -> None:
+        """
+        Replace the key, value and hash arrays with empty ones of the given size.
+
+        Complexity:
+        Best Case Complexity: O(M) where M is the size.
+        Worst Case Complexity: O(M) where M is the size.
+        """
+        self.array: ArrayR[Union[K, None]] = ArrayR(size)
+        self.value_array: ArrayR[V] = ArrayR(size)
+        self.hash_array: ArrayR[int] = ArrayR(size)
+
+    @classmethod
+    def with_capacity(cls, capacity: int, sizes=None, **kwargs) -> HashyStepTable[K, V]:
+        """
+        Create an empty table large enough to hold `capacity` entries without resizing.
+        Any other keyword arguments (shrink, hash_function) are passed on to the constructor.
+
+        Complexity:
+        Best Case Complexity: O(M) where M is the size of the table chosen.
+        Worst Case Complexity: O(M) where M is the size of the table chosen.
+        """
+        table = cls(sizes, **kwargs)
+        table.reserve(capacity)
+        return table
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[K, V]], sizes=None, **kwargs) -> HashyStepTable[K, V]:
+        """
+        Create a table holding the given (key, value) pairs, sized for all of them up front.
+        Any other keyword arguments are passed on to the constructor, see with_capacity.
+
+        Complexity:
+        See update.
+        """
+        table = cls(sizes, **kwargs)
+        table.update(items)
+        return table
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Grow the table (never shrink it) to the smallest size in TABLE_SIZES that holds
+        `capacity` entries without resizing, or the largest size if none does.
+
+        Complexity:
+        Best Case Complexity: O(1) when the table is already large enough.
+        Worst Case Complexity: See _rehash, done once for the size chosen.
+        """
+        size_index = self.size_index
+        while size_index < len(self.TABLE_SIZES) - 1 and capacity > self.TABLE_SIZES[size_index] * self.LOAD_FACTOR:
+            size_index += 1
+        if size_index > self.size_index:
+            # _rehash moves to the next size
+            self.size_index = size_index - 1
+            self._rehash()
+
+    def update(self, items: Iterable[tuple[K, V]]) -> None:
+        """
+        Set every (key, value) pair of a batch, reserving room for the whole batch first
+        so the table is resized at most once.
+        Keys already in the table count towards the reservation, so it may be larger than needed.
+
+        Complexity:
+        Best Case Complexity: O(B * setitem) where B is the size of the batch, plus one reserve.
+        Worst Case Complexity: O(B * setitem) where B is the size of the batch, plus one reserve.
+        """
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        self.reserve(self.count + len(items))
+        for key, value in items:
+            self[key] = value
 
     def hash(self, key: K) -> int:
         """
         Hash a key for insert/retrieve/update into the hashtable.
+        The hash does not depend on the table size, the position of the key is this hash
+        modulo the table size.
+        This is polynomial_hash of data_structures.hash_functions, unless the table
+        was given another hash function.
 
         Complexity:
         Best Case Complexity: O(len(key))
         Worst Case Complexity: O(len(key))
         """
-
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
-        return value
+        return polynomial_hash(key)
 
     def hash2(self, key: K) -> int:
         
         """
         Used to determine the step size for our hash table.
 
+        Complexity:
+        Best Case Complexity:O(len(key))
+        Worst Case Complexity:O(len(key))
+        """
+        return self._step(self.hash(key))
+
+    def _step(self, key_hash: int) -> int:
+        """
+        The step size for a key with the given hash.
+        A step that is a multiple of the table size would never leave the first position,
+        so 1 is used instead.
+
         Complexity:
         Best Case Complexity:O(1)
         Worst Case Complexity:O(1)
         """
-        prime = 7
-        return prime - (self.hash(key) % prime)
-
-        #raise NotImplementedError
+        return (self.STEP_PRIME - key_hash % self.STEP_PRIME) % self.table_size or 1
 
     @property
     def table_size(self) -> int:
@@ -89,62 +197,82 @@ class HashyStepTable(Generic[K, V]):
         """
         return self.count
 
-    def _hashy_probe(self, key: K, is_insert: bool) -> int:
+    def _hashy_probe(self, key: K, is_insert: bool, key_hash: int = None) -> int:
         """
         Find the correct position for this key in the hash table using hashy probing.
+        The stored hash of an entry is compared before its key. Tombstones are probed
+        past, and an insert of a new key reuses the first one found.
+
+        Args:
+        key_hash: hash(key), computed if not given.
 
         Raises:
         KeyError: When the key is not in the table, but is_insert is False.
         FullError: When a table is full and cannot be inserted.
 
         Complexity:
-        Best Case Complexity:
-        Worst Case Complexity:
+        Best Case Complexity: O(hash(key)) when the first position is empty or holds the key.
+        Worst Case Complexity: O(hash(key) + N*comp(K)) when the entire table is searched, where N is the table size.
         """
+        if key_hash is None:
+            key_hash = self.hash(key)
         # Initial position
-        initial_pos = self.hash(key) % self.table_size
-        step_size = self.hash2(key)
-        position = initial_pos
+        position = key_hash % self.table_size
+        step_size = self._step(key_hash)
+        first_tombstone = None
         # Logic Implementation
         for _ in range(self.table_size):
-            if self.array[position] is None:
+            resident = self.array[position]
+            if resident is None:
                 if is_insert:
-                    return position
+                    return position if first_tombstone is None else first_tombstone
                 raise KeyError(f"Key {key} not found.")
-            elif self.array[position][0] == key:
+            elif resident is TOMBSTONE:
+                if first_tombstone is None:
+                    first_tombstone = position
+            elif self.hash_array[position] == key_hash and resident == key:
                 return position
 
             position = (position + step_size) % self.table_size
 
+        if is_insert and first_tombstone is not None:
+            return first_tombstone
         if is_insert:
             raise FullError("Hash Table is full.")
         else:
             raise KeyError(f"Key {key} not found.")
         #raise NotImplementedError
     
-    def keys(self) -> list[K]:
+    def items(self) -> Iterator[tuple[K, V]]:
         """
-        Returns all keys in the hash table.
+        Yields all (key, value) pairs in the hash table, without copying them.
+        The table should not be modified while iterating.
 
-        :complexity: O(N) where N is self.table_size.
+        :complexity: O(N) where N is self.table_size, over the whole iteration.
         """
-        res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][0])
-        return res
+        for position, key in self.array.enumerate():
+            if key is not None and key is not TOMBSTONE:
+                yield key, self.value_array[position]
 
-    def values(self) -> list[V]:
+    def keys(self) -> Iterator[K]:
         """
-        Returns all values in the hash table.
+        Yields all keys in the hash table, see items.
 
-        :complexity: O(N) where N is self.table_size.
+        :complexity: O(N) where N is self.table_size, over the whole iteration.
         """
-        res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][1])
-        return res
+        for key in self.array:
+            if key is not None and key is not TOMBSTONE:
+                yield key
+
+    def values(self) -> Iterator[V]:
+        """
+        Yields all values in the hash table, see items.
+
+        :complexity: O(N) where N is self.table_size, over the whole iteration.
+        """
+        for position, key in self.array.enumerate():
+            if key is not None and key is not TOMBSTONE:
+                yield self.value_array[position]
 
     def __contains__(self, key: K) -> bool:
         """
@@ -167,49 +295,57 @@ class HashyStepTable(Generic[K, V]):
         :raises KeyError: when the key doesn't exist.
         """
         position = self._hashy_probe(key, False)
-        return self.array[position][1]
+        return self.value_array[position]
 
     def __setitem__(self, key: K, data: V) -> None:
         """
         Set an (key, value) pair in our hash table.
+        Updating a key already in the table only writes its value.
 
         :complexity: See hashy probe.
         :raises FullError: when the table cannot be resized further.
         """
 
-        position = self._hashy_probe(key, True)
-        if self.array[position] is None:
-            self.count += 1
-        self.array[position] = (key, data)
-        if len(self) > self.table_size * 2 / 3:
+        key_hash = self.hash(key)
+        position = self._hashy_probe(key, True, key_hash)
+        resident = self.array[position]
+        if resident is not None and resident is not TOMBSTONE:
+            self.value_array[position] = data
+            return
+        if resident is TOMBSTONE:
+            self.tombstones -= 1
+        self.count += 1
+        self.array[position] = key
+        self.value_array[position] = data
+        self.hash_array[position] = key_hash
+        if len(self) > self.table_size * self.LOAD_FACTOR:
             self._rehash()    
 
     def __delitem__(self, key: K) -> None:
         """
-        Deletes a (key, value) using lazy deletion
+        Deletes a (key, value) using lazy deletion, marking its slot with a tombstone.
 
         Complexity:
-        Best Case Complexity: O(1) no collisions, no rehashing needed 
-        Worst Case Complexity:O(N*T) when there are many collisions 
+        Best Case Complexity: O(hash(key)) no collisions, no rebuilding needed 
+        Worst Case Complexity: O(hash(key) + N*comp(K)) when the entire table is probed, where N is the table size.
+        The table is rebuilt at most once every T/6 deletions, where T is the table size, so this is
+        O(1) amortised on top of the probe.
         """
         position = self._hashy_probe(key, False)
         
-        self.array[position] = None
+        self.array[position] = TOMBSTONE
+        self.value_array[position] = None
         self.count -= 1
+        self.tombstones += 1
 
-       
-        step_size = self.hash2(key)
-        next_position = (position + step_size) % self.table_size
-
-        while self.array[next_position] is not None:
-        
-            next_key, next_value = self.array[next_position]
-            
-            self.array[next_position] = None
-            self.count -= 1
-           
-            self.__setitem__(next_key, next_value)
-            next_position = (next_position + step_size) % self.table_size       
+        # Only move down a size that still holds every entry, as sizes given by the user
+        # can be far apart
+        if self.shrink and self.size_index > 0 and self.count < self.table_size * self.SHRINK_LOAD_FACTOR \
+                and self.count <= self.TABLE_SIZES[self.size_index - 1] * self.LOAD_FACTOR:
+            self.size_index -= 1
+            self._rebuild(self.TABLE_SIZES[self.size_index])
+        elif self.tombstones > self.table_size * self.TOMBSTONE_THRESHOLD:
+            self._rebuild(self.table_size)
 
 
     def is_empty(self) -> bool:
@@ -223,18 +359,36 @@ class HashyStepTable(Generic[K, V]):
         Need to resize table and reinsert all values
 
         Complexity:
-        Best Case Complexity:O(1) no collisions, when the key is found immediately 
-        Worst Case Complexity:O(N*T) many collisions , where N is the number of elements , T is the size of the table. 
+        See _rebuild.
         """
         self.size_index += 1
         if self.size_index >= len(self.TABLE_SIZES):
             raise FullError("Cannot resize further.")
-        old_array = self.array
-        self.array = ArrayR(self.TABLE_SIZES[self.size_index])
-        self.count = 0
-        for item in old_array:
-            if item is not None:
-                self.__setitem__(item[0], item[1])
+        self._rebuild(self.TABLE_SIZES[self.size_index])
+
+    def _rebuild(self, size: int) -> None:
+        """
+        Move all the entries into a new array of the given size, dropping the tombstones.
+        Entries are moved as they are, positioned by their stored hash.
+
+        Complexity:
+        Best Case Complexity:O(T) no collisions, where T is the size of the old table.
+        Worst Case Complexity:O(T + N*S) many collisions, where N is the number of elements and S is the new size.
+        """
+        old_keys, old_values, old_hashes = self.array, self.value_array, self.hash_array
+        self._allocate(size)
+        self.tombstones = 0
+        for old_position in range(len(old_keys)):
+            key = old_keys[old_position]
+            if key is not None and key is not TOMBSTONE:
+                key_hash = old_hashes[old_position]
+                position = key_hash % size
+                step_size = self._step(key_hash)
+                while self.array[position] is not None:
+                    position = (position + step_size) % size
+                self.array[position] = key
+                self.value_array[position] = old_values[old_position]
+                self.hash_array[position] = key_hash
 
         
 
@@ -245,8 +399,6 @@ class HashyStepTable(Generic[K, V]):
         :complexity: O(N * (str(key) + str(value))) where N is the table size
         """
         result = ""
-        for item in self.array:
-            if item is not None:
-                (key, value) = item
-                result += "(" + str(key) + "," + str(value) + ")\n"
+        for key, value in self.items():
+            result += "(" + str(key) + "," + str(value) + ")\n"
         return result
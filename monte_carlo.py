@@ -0,0 +1,177 @@
+"""
+Monte Carlo season runner.
+
+Runs many independently seeded seasons for the same roster of teams across a
+process pool and aggregates how often each team finished in each position.
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Union
+from data_structures.hash_table import LinearProbeTable
+from data_structures.referential_array import ArrayR
+from data_structures.typed_array import IntArray
+from random_gen import RandomGen
+from season import Season
+from team import Team
+
+
+class MonteCarloRunner:
+    """
+    Simulates a number of seasons for a fixed roster of teams.
+
+    Every season is played from a clean slate (zeroed team and season player stats)
+    with its own seed, so the result of season `i` only depends on the roster, the
+    base seed and `i`. The results are therefore the same no matter how many workers
+    are used or how the seasons are split into chunks.
+
+    Team names are used to identify teams across processes, so they must be unique
+    (as they already are for the leaderboard tie-break).
+
+    Usage:
+    ```
+    if __name__ == "__main__":
+        runner = MonteCarloRunner(teams, seed=123)
+        counts = runner.run(10000)
+        counts["Badgers"][0]    # Number of seasons the Badgers finished first
+    ```
+    """
+
+    DEFAULT_CHUNK_SIZE = 25
+    # Numbers reserved per season in the base stream, far more than any season draws.
+    # The low bits of the LCG state repeat every power of two steps, so a power of two
+    # stride would start every season with the same low bits. This odd stride (2^32 divided
+    # by the golden ratio) spreads the seasons across the cycles of the low bits instead
+    SEASON_STRIDE = 0x9E3779B9
+    # Number of seasons that fit in the state space of the generator without any repeating
+    MAX_SEASONS = RandomGen.MOD // SEASON_STRIDE
+
+    def __init__(self, teams: ArrayR[Team], seed: int = 0, max_workers: Union[int, None] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Args:
+            teams (ArrayR[Team]): The teams that play every season. These are copied
+                into the worker processes and are never modified.
+            seed (int): The base seed all the season seeds are derived from.
+            max_workers (Union[int, None]): Number of worker processes, None uses one per core.
+            chunk_size (int): Number of seasons sent to a worker at a time.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size should be larger than 0.")
+        self.teams = teams
+        self.seed = seed
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+    def season_seed(self, season_no: int) -> int:
+        """
+        Returns the seed used to play the given season (numbered from 0).
+        Season `i` starts `i * SEASON_STRIDE` numbers into the stream seeded with the
+        base seed, so no two seasons draw overlapping random numbers.
+
+        Raises:
+            ValueError: If season_no is negative or not below MAX_SEASONS, as the stream
+                would wrap around and replay an earlier season.
+
+        Complexity:
+            Best Case Complexity: O(log(N)) where N is season_no * SEASON_STRIDE.
+            Worst Case Complexity: O(log(N)) where N is season_no * SEASON_STRIDE.
+        """
+        if not 0 <= season_no < MonteCarloRunner.MAX_SEASONS:
+            raise ValueError(f"Season number should be from 0 to {MonteCarloRunner.MAX_SEASONS - 1}.")
+        return RandomGen.jump_seed(self.seed, season_no * MonteCarloRunner.SEASON_STRIDE)
+
+    def run(self, num_seasons: int) -> LinearProbeTable[str, ArrayR[int]]:
+        """
+        Simulates `num_seasons` seasons across the process pool.
+
+        Returns:
+            LinearProbeTable[str, ArrayR[int]]: For each team name, an array where
+                index p holds the number of seasons the team finished in position p + 1.
+
+        Raises:
+            ValueError: If num_seasons is larger than MAX_SEASONS.
+
+        Complexity:
+            Best Case Complexity: O(N * S / W) where N is the number of seasons, S is the cost
+                of simulating one season and W is the number of workers.
+            Worst Case Complexity: O(N * S / W + (N / C) * T^2) where C is the chunk size and T is
+                the number of teams, for merging the counts of every chunk.
+        """
+        if num_seasons > MonteCarloRunner.MAX_SEASONS:
+            raise ValueError(f"Cannot simulate more than {MonteCarloRunner.MAX_SEASONS} distinct seasons.")
+        num_teams = len(self.teams)
+        totals = MonteCarloRunner._empty_counts(num_teams)
+
+        chunk_starts = range(0, num_seasons, self.chunk_size)
+        chunk_seeds = [
+            [self.season_seed(season_no) for season_no in range(start, min(start + self.chunk_size, num_seasons))]
+            for start in chunk_starts
+        ]
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for chunk_counts in executor.map(MonteCarloRunner._simulate_chunk, repeat(self.teams), chunk_seeds):
+                for team_index in range(num_teams):
+                    for position in range(num_teams):
+                        totals[team_index][position] += chunk_counts[team_index][position]
+
+        result: LinearProbeTable[str, ArrayR[int]] = LinearProbeTable()
+        for team_index in range(num_teams):
+            result[self.teams[team_index].get_name()] = totals[team_index]
+        return result
+
+    @staticmethod
+    def _empty_counts(num_teams: int) -> ArrayR[ArrayR[int]]:
+        """
+        Returns a num_teams x num_teams array of zeroes, each row an IntArray.
+
+        Complexity:
+            Best Case Complexity: O(T^2) where T is the number of teams.
+            Worst Case Complexity: O(T^2) where T is the number of teams.
+        """
+        counts: ArrayR[ArrayR[int]] = ArrayR(num_teams)
+        for team_index in range(num_teams):
+            counts[team_index] = IntArray(num_teams)
+        return counts
+
+    @staticmethod
+    def _simulate_chunk(teams: ArrayR[Team], seeds: list[int]) -> ArrayR[ArrayR[int]]:
+        """
+        Plays one season per seed and counts the finishing positions.
+        This runs inside a worker process, on that worker's own copy of the teams.
+
+        Returns:
+            ArrayR[ArrayR[int]]: counts[t][p] is the number of seasons that the team at
+                index t of `teams` finished in position p + 1.
+
+        Complexity:
+            Best Case Complexity: O(N * (S + T*P)) where N is the number of seeds, S is the cost of
+                simulating one season, T is the number of teams and P the number of players per team.
+            Worst Case Complexity: O(N * (S + T*P)) as above.
+        """
+        num_teams = len(teams)
+        counts = MonteCarloRunner._empty_counts(num_teams)
+
+        team_indices: LinearProbeTable[str, int] = LinearProbeTable()
+        for team_index in range(num_teams):
+            team_indices[teams[team_index].get_name()] = team_index
+
+        for seed in seeds:
+            for team in teams:
+                team.reset_stats()
+                for player in team.get_players() or ():
+                    player.reset_season_stats()
+
+            RandomGen.set_seed(seed)
+            season = Season(teams)
+            season.simulate_season()
+
+            for position in range(len(season.leaderboard)):
+                team_index = team_indices[season.leaderboard[position].get_name()]
+                counts[team_index][position] += 1
+
+        return counts
@@ -1,11 +1,19 @@
 from __future__ import annotations
 from constants import PlayerPosition, PlayerStats
-from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from data_structures.stat_store import StatStore, StatView
+from typing import Union
 
 
 class Player:
+    # Stats that are accumulated while playing, as opposed to the player's fixed attributes
+    SEASON_STATS = (PlayerStats.GAMES_PLAYED, PlayerStats.GOALS, PlayerStats.ASSISTS,
+                    PlayerStats.TACKLES, PlayerStats.INTERCEPTIONS)
+    # Fixed attributes of a player, which weight the game simulator's random choices
+    ATTRIBUTES = (PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
+    # League-level store holding the statistics of every player, one column per stat
+    default_store: StatStore[PlayerStats] = StatStore(PlayerStats)
 
-    def __init__(self, name: str, position: PlayerPosition, age: int) -> None:
+    def __init__(self, name: str, position: PlayerPosition, age: int, store: Union[StatStore[PlayerStats], None] = None) -> None:
         """
         Constructor for the Player class
 
@@ -13,21 +21,17 @@ class Player:
             name (str): The name of the player
             position (PlayerPosition): The position of the player
             age (int): The age of the player
+            store (Union[StatStore[PlayerStats], None]): The store holding the player's statistics,
+                Player.default_store (shared by the whole league) if None.
 
         Returns:
             None
 
         Complexity:
-            Best Case Complexity: Assigining name , age and position all have complexity of  O(1). The hash 
-            table iterates through the entire length on the PlayerStats and creates arrays for each stat 
-            this means the time compexity. 
-            O(M) where M is the size of the hash table.  
-            Inserting values into a hash table will take O(N) as the for loop iteraters over PlaerSatsts.Given that 
-            there are N elements in PlayerStats. 
-            Thus the best case becomes O(N+M)
-            Worst Case Complexity: In the worst case there maybe collision in the linked list thus the worst 
-            time complexity will be O(N+M*L) where M is the number of elements in the PlayerStats and L is the length 
-            of the linked list at each position. 
+            Best Case Complexity: Assigining name , age and position all have complexity of  O(1).
+            Allocating an id in the store appends a 0 to the column of each of the N elements in
+            PlayerStats, thus the best case becomes O(N).
+            Worst Case Complexity: O(N) as well, since appending to a column is amortised O(1).
 
         """
         if age<18: 
@@ -35,10 +39,9 @@ class Player:
         self.name= name
         self.position=position
         self.age=age 
-        self.statistics=HashTableSeparateChaining(len(PlayerStats))
-        # iniialising the value of the statistics to zero 
-        for stat in PlayerStats: 
-            self.statistics[stat.value]=0
+        # the store initialises the value of the statistics to zero
+        self.store = Player.default_store if store is None else store
+        self.id = self.store.allocate(self)
 
     def reset_stats(self) -> None:
 
@@ -49,20 +52,26 @@ class Player:
             None
 
         Complexity:
-            Best Case Complexity: In the caase that there are no collisions the best case will be O(1)
-            as updating and declaring have constant time complexity. Since it has to go through all of the players 
-            in stat the best time complexity will be O(M) where M is the number of elements in PlayerStats
-            Worst Case Complexity: The worts time complexity is having to iterate through all of the cases and therre is collision in everything 
-            thus the worst time compleexity woulld be having to iterate through the linked lists. 
-            The worst case will be O(N*L ) where N is the number of elements in PlayerStats and L is the lnegth of a linked List 
-            int he hashtable. 
+            Best Case Complexity: O(N) where N is the number of elements in PlayerStats, as each column
+            of the store is written once.
+            Worst Case Complexity: O(N) where N is the number of elements in PlayerStats.
 
         """
-        for stat in PlayerStats: 
-            self[stat]=0
-        
+        self.store.reset_row(self.id)
 
-        
+    def reset_season_stats(self) -> None:
+        """
+        Reset only the stats that are accumulated by playing games, keeping the
+        player's attributes (star skill, weak foot ability, weight and height).
+
+        Returns:
+            None
+
+        Complexity:
+            Best Case Complexity: O(S) where S is the number of season stats.
+            Worst Case Complexity: O(S) where S is the number of season stats.
+        """
+        self.store.reset_row(self.id, Player.SEASON_STATS)
 
     def get_name(self) -> str:
         """
@@ -91,18 +100,18 @@ class Player:
         """
         return self.position
 
-    def get_statistics(self):
+    def get_statistics(self) -> StatView[PlayerStats]:
         """
         Get the statistics of the player
 
         Returns:
-            statistics: The players' statistics
+            StatView[PlayerStats]: A view of the players' statistics in the store
 
         Complexity:
-            Best Case Complexity: returning from hash table has a constant time complexity thus it will remain O(1)
-            Worst Case Complexity:returning from hash table has a constant time complexity thus it will remain O(1)
+            Best Case Complexity: creating a view has a constant time complexity thus it will remain O(1)
+            Worst Case Complexity: creating a view has a constant time complexity thus it will remain O(1)
         """
-        return self.statistics
+        return self.store.row(self.id)
 
     def __setitem__(self, statistic: PlayerStats, value: int) -> None:
         """
@@ -116,12 +125,10 @@ class Player:
             None
 
         Complexity:
-            Best Case Complexity: The bests complexity would be just setting the value in the hash table without collsion thus
-              giving constant time complexity O(1)
-            Worst Case Complexity: The worst time complexity wpuld happen in the case of collision thus resulting in traversal through linked list 
-              which would give a time complexity of O(L) where L is the length of a linked list. 
+            Best Case Complexity: O(1) finding the column of the stat and writing the player's entry are both constant time.
+            Worst Case Complexity: O(1) finding the column of the stat and writing the player's entry are both constant time.
         """
-        self.statistics[statistic.value] = value
+        self.store.set(self.id, statistic, value)
 
 
     def __getitem__(self, statistic: PlayerStats) -> int:
@@ -135,12 +142,37 @@ class Player:
             int: The value of the stat
 
         Complexity:
-            Best Case Complexity:The bests complexity would be just getting the value in the hash table without collsion thus
-              giving constant time complexity O(1)
-            Worst Case Complexity:The worst time complexity wpuld happen in the case of collision thus resulting in traversal through linked list 
-              which would give a time complexity of O(L) where L is the length of a linked list.
+            Best Case Complexity: O(1) finding the column of the stat and reading the player's entry are both constant time.
+            Worst Case Complexity: O(1) finding the column of the stat and reading the player's entry are both constant time.
+        """
+        return self.store.get(self.id, statistic)
+
+    def __getstate__(self) -> dict:
+        """
+        Pickles the player with the values of its statistics, as the store is not pickled.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of elements in PlayerStats.
+            Worst Case Complexity: O(N) where N is the number of elements in PlayerStats.
         """
-        return self.statistics[statistic.value]
+        state = self.__dict__.copy()
+        del state['store'], state['id']
+        state['statistics'] = self.store.get_row(self.id)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Unpickles the player into Player.default_store of this process.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of elements in PlayerStats.
+            Worst Case Complexity: O(N) where N is the number of elements in PlayerStats.
+        """
+        statistics = state.pop('statistics')
+        self.__dict__.update(state)
+        self.store = Player.default_store
+        self.id = self.store.allocate(self)
+        self.store.set_row(self.id, statistics)
 
     def __str__(self) -> str:
         """
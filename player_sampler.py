@@ -0,0 +1,143 @@
+from __future__ import annotations
+from bisect import bisect_left
+from constants import PlayerPosition, PlayerStats
+from data_structures.stat_store import StatStore
+from player import Player
+from random_gen import RandomGen
+from typing import Collection, Union
+
+
+class PlayerSampler:
+    """
+    Draws players from a team, weighted by the sum of some of their attributes.
+
+    The cumulative weights for every attribute combination used by the game simulator
+    are computed once, so a draw is a single binary search instead of summing the
+    attributes of every player (two hash table lookups per attribute) on each call.
+
+    A draw picks the first player whose cumulative weight is at least a random number
+    from 0 to total_weight - 1, exactly like the linear scan it replaces, so seeded
+    simulations produce the same games as before.
+
+    A sampler is only valid for the roster it was built from and the player attributes
+    at that time. `Team` rebuilds its sampler when the roster changes, and `is_current`
+    reports whether any player's attributes have changed since it was built.
+    """
+
+    SCORING = (PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
+    ASSISTING = (PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
+    DEFENDING = (PlayerStats.HEIGHT,)
+
+    def __init__(self, players: Union[Collection[Player], None]) -> None:
+        """
+        Args:
+            players (Union[Collection[Player], None]): All the players of a team, in the order
+                returned by `Team.get_players`.
+
+        Complexity:
+            Best Case Complexity: O(P * A) where P is the number of players and A the number of attributes
+                in all of the combinations, as every weight is read once.
+            Worst Case Complexity: O(P * A * L + P * S) where L is the cost of a player stat lookup
+                and S the number of stores holding the players.
+        """
+        self.players: list[Player] = [player for player in players] if players is not None else []
+        # The version of the attributes in each store holding some of the players, see is_current
+        self.attribute_versions: list[tuple[StatStore[PlayerStats], int]] = []
+        for player in self.players:
+            if all(store is not player.store for store, _ in self.attribute_versions):
+                self.attribute_versions.append((player.store, player.store.version(Player.ATTRIBUTES)))
+        self.outfield: list[Player] = [player for player in self.players
+                                       if player.get_position() != PlayerPosition.GOALKEEPER]
+
+        self.scoring_weights: list[int] = PlayerSampler._cumulative_weights(self.outfield, PlayerSampler.SCORING)
+        self.assisting_weights: list[int] = PlayerSampler._cumulative_weights(self.outfield, PlayerSampler.ASSISTING)
+        self.defending_weights: list[int] = PlayerSampler._cumulative_weights(self.players, PlayerSampler.DEFENDING)
+
+    def is_current(self) -> bool:
+        """
+        Returns whether no player's attributes have changed since this sampler was built,
+        however they were written (Player, StatView or a reset of the store).
+
+        Complexity:
+            Best Case Complexity: O(A) where A is the number of attributes, when the players share one store.
+            Worst Case Complexity: O(S * A) where S is the number of stores holding the players.
+        """
+        return all(store.version(Player.ATTRIBUTES) == version for store, version in self.attribute_versions)
+
+    def choose_scorer(self) -> Player:
+        """
+        Chooses an outfield player weighted by star skill, weight and height.
+
+        Complexity:
+            Best Case Complexity: O(log(P)) where P is the number of outfield players.
+            Worst Case Complexity: O(log(P)) where P is the number of outfield players.
+        """
+        return PlayerSampler._draw(self.outfield, self.scoring_weights)
+
+    def choose_assister(self) -> Player:
+        """
+        Chooses an outfield player weighted by star skill and weak foot ability.
+
+        Complexity:
+            Best Case Complexity: O(log(P)) where P is the number of outfield players.
+            Worst Case Complexity: O(log(P)) where P is the number of outfield players.
+        """
+        return PlayerSampler._draw(self.outfield, self.assisting_weights)
+
+    @staticmethod
+    def choose_defender(home: PlayerSampler, away: PlayerSampler) -> Player:
+        """
+        Chooses a player from either team weighted by height, as if the home players
+        were followed by the away players in a single list.
+
+        Complexity:
+            Best Case Complexity: O(log(P)) where P is the number of players in both teams.
+            Worst Case Complexity: O(log(P)) where P is the number of players in both teams.
+        """
+        home_total = home.defending_weights[-1] if home.defending_weights else 0
+        away_total = away.defending_weights[-1] if away.defending_weights else 0
+
+        if home_total + away_total == 0:  # Handle edge case where all weights are zero
+            index = RandomGen.randint(0, len(home.players) + len(away.players) - 1)
+            if index < len(home.players):
+                return home.players[index]
+            return away.players[index - len(home.players)]
+
+        rand_val: int = RandomGen.randint(0, home_total + away_total - 1)
+        if home.players and rand_val <= home_total:
+            return home.players[bisect_left(home.defending_weights, rand_val)]
+        return away.players[bisect_left(away.defending_weights, rand_val - home_total)]
+
+    @staticmethod
+    def _cumulative_weights(players: list[Player], attributes: tuple[PlayerStats, ...]) -> list[int]:
+        """
+        Returns the running totals of the summed attributes of the players.
+
+        Complexity:
+            Best Case Complexity: O(P * A) where P is the number of players and A the number of attributes.
+            Worst Case Complexity: O(P * A * L) where L is the cost of a player stat lookup.
+        """
+        cumulative_weights: list[int] = []
+        cumulative_weight: int = 0
+        for player in players:
+            cumulative_weight += sum(player[attr] for attr in attributes)
+            cumulative_weights.append(cumulative_weight)
+        return cumulative_weights
+
+    @staticmethod
+    def _draw(players: list[Player], cumulative_weights: list[int]) -> Player:
+        """
+        Chooses the first player whose cumulative weight is at least a random number
+        from 0 to the total weight - 1.
+
+        Complexity:
+            Best Case Complexity: O(log(P)) where P is the number of players.
+            Worst Case Complexity: O(log(P)) where P is the number of players.
+        """
+        total_weight = cumulative_weights[-1] if cumulative_weights else 0
+
+        if total_weight == 0:  # Handle edge case where all weights are zero
+            return RandomGen.random_choice(players)
+
+        rand_val: int = RandomGen.randint(0, total_weight - 1)
+        return players[bisect_left(cumulative_weights, rand_val)]
@@ -1,6 +1,7 @@
 """
 Random number generator class. Uses LCG method with some reasonable initialisation.
 """
+from __future__ import annotations
 __author__ = "Jackson Goerner"
 
 import time
@@ -18,7 +19,11 @@ class RandomGen:
     RandomGen.random()           # Random number from 0 to 2^32-1
     RandomGen.randint(1, 10)     # Random number from 1 to 10
     RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+    RandomGen.jump(1000)         # Skip the next 1000 numbers in O(log 1000)
     ```
+
+    The class methods all share one global stream. Use `RandomGen.stream()` or `RandomStream`
+    for independent streams, e.g. one per worker process.
     """
 
     MOD: int = pow(2, 48)
@@ -33,6 +38,41 @@ class RandomGen:
         seed = time.time_ns() if seed is None else seed
         cls.seed = seed
 
+    @classmethod
+    def jump_seed(cls, seed: int, n: int) -> int:
+        """
+        Returns the LCG state reached after `n` calls to `random` starting from `seed`.
+
+        Composes the step x -> A*x + C with itself by repeated squaring, so that
+        A^n and C*(A^n - 1)/(A - 1) are found without dividing modulo MOD.
+        :complexity: O(log n)
+        """
+        if n < 0:
+            raise ValueError("Cannot jump backwards.")
+        mult, plus = cls.A, cls.C
+        acc_mult, acc_plus = 1, 0
+        while n > 0:
+            if n & 1:
+                acc_mult = acc_mult * mult % cls.MOD
+                acc_plus = (acc_plus * mult + plus) % cls.MOD
+            plus = (mult + 1) * plus % cls.MOD
+            mult = mult * mult % cls.MOD
+            n >>= 1
+        return (acc_mult * seed + acc_plus) % cls.MOD
+
+    @classmethod
+    def jump(cls, n: int) -> None:
+        """
+        Advances the global stream as if `random` was called `n` times.
+        :complexity: O(log n)
+        """
+        cls.seed = cls.jump_seed(cls.seed, n)
+
+    @classmethod
+    def stream(cls) -> RandomStream:
+        """Returns an independent stream starting at the global stream's current position."""
+        return RandomStream(cls.seed)
+
     @classmethod
     def random(cls) -> int:
         """Returns a random integer from 0 to 2^32-1"""
@@ -70,3 +110,73 @@ class RandomGen:
         tmp = [collection[p[1]] for p in positions]
         for x in range(len(collection)):
             collection[x] = tmp[x]
+
+
+class RandomStream:
+    """
+    An independent LCG stream, using the same constants as `RandomGen`.
+
+    A stream seeded with `s` produces exactly the numbers `RandomGen` produces after
+    `RandomGen.set_seed(s)`, but advancing one never affects the other.
+    All methods are O(1) best/worst case time complexity unless stated otherwise.
+
+    Usage:
+    ```
+    stream = RandomStream(123)
+    stream.randint(1, 10)
+
+    # Worker k of a pool draws the numbers from n*k to n*k + n - 1 of the serial sequence
+    worker_stream = RandomStream(123).split(k, n)
+    ```
+    """
+
+    def __init__(self, seed: int = None) -> None:
+        self.seed = time.time_ns() if seed is None else seed
+
+    def random(self) -> int:
+        """Returns a random integer from 0 to 2^32-1"""
+        self.seed = (RandomGen.A * self.seed + RandomGen.C) % RandomGen.MOD
+        return self.seed >> 16
+
+    def random_float(self) -> float:
+        """Returns a random floating point integer in the range 0 to 1."""
+        return self.random() / (1 << 32)
+
+    def randint(self, lo: int, hi: int) -> int:
+        """Returns a random integer from `lo` to `hi` inclusive on both ends."""
+        return (self.random() % (hi - lo + 1)) + lo
+
+    def random_chance(self, ratio: float) -> bool:
+        """Returns random()/2^32 < ratio"""
+        return self.random_float() < ratio
+
+    def random_choice(self, collection):
+        """Returns a random choice from a collection that supports __getitem__ and __len__"""
+        return collection[self.randint(0, len(collection)-1)]
+
+    def random_shuffle(self, collection) -> None:
+        """
+        Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
+        :complexity: O(len(collection))
+        """
+        positions = [(self.random(), i) for i in range(len(collection))]
+        positions.sort()
+        tmp = [collection[p[1]] for p in positions]
+        for x in range(len(collection)):
+            collection[x] = tmp[x]
+
+    def jump(self, n: int) -> None:
+        """
+        Advances this stream as if `random` was called `n` times.
+        :complexity: O(log n)
+        """
+        self.seed = RandomGen.jump_seed(self.seed, n)
+
+    def split(self, index: int, stride: int) -> RandomStream:
+        """
+        Returns a new stream starting `index * stride` numbers ahead of this one.
+        Streams split with the same stride and different indices never overlap
+        as long as each draws at most `stride` numbers.
+        :complexity: O(log(index * stride))
+        """
+        return RandomStream(RandomGen.jump_seed(self.seed, index * stride))
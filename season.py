@@ -8,8 +8,8 @@ from data_structures.array_sorted_list import ArraySortedList
 from data_structures.hash_table import LinearProbeTable
 from constants import TeamStats
 from data_structures.linked_list import LinkedList
-from constants import ResultStats, PlayerStats, GameResult
-from game_simulator import GameSimulator
+from constants import PlayerStats, GameResult
+from game_simulator import GameOutcome, GameSimulator
 
 
 
@@ -103,17 +103,56 @@ class WeekOfGames:
 
 
 
+class WeekResult:
+    """
+    Simple container for the results of a simulated week of games.
+    """
+
+    def __init__(self, week: int, games: ArrayR[Game], outcomes: ArrayR[GameOutcome],
+                 standings: Union[ArrayR[tuple[str, int, int, int]], None]) -> None:
+        """
+        Container for the results of a week of games.
+
+        Args:
+            week (int): The week number.
+            games (ArrayR[Game]): The games played this week.
+            outcomes (ArrayR[GameOutcome]): The outcome of each game, in the same order as games.
+            standings (Union[ArrayR[tuple[str, int, int, int]], None]): The standings after this week, see Season.get_standings.
+        """
+        self.week: int = week
+        self.games: ArrayR[Game] = games
+        self.outcomes: ArrayR[GameOutcome] = outcomes
+        self.standings: Union[ArrayR[tuple[str, int, int, int]], None] = standings
+
+    def get_week(self) -> int:
+        return self.week
+
+    def get_games(self) -> ArrayR[Game]:
+        return self.games
+
+    def get_outcomes(self) -> ArrayR[GameOutcome]:
+        return self.outcomes
+
+    def get_standings(self) -> Union[ArrayR[tuple[str, int, int, int]], None]:
+        return self.standings
+
+    def __repr__(self) -> str:
+        return f'{self.week} {self.standings}'
+
+
 class Season:
     
 
 
 
-    def __init__(self, teams: ArrayR[Team]) -> None:
+    def __init__(self, teams: ArrayR[Team], round_robin: bool = False) -> None:
         """
         Initializes the season with a schedule.
 
         Args:
             teams (ArrayR[Team]): The teams played in this season.
+            round_robin (bool): If True, the schedule is generated with the circle method
+                (see iter_round_robin) instead of the greedy _generate_schedule.
 
         Complexity:
             Best Case Complexity: O(T+S+W)  where T is the number of teams, S is the complexity of generating the schedule and W is the number of weeks.
@@ -125,27 +164,33 @@ class Season:
         ##
         for team in self.teams:
             self.leaderboard.add(team)
+        self.ranks = LinearProbeTable.with_capacity(len(self.teams))
+        self._update_ranks()
         
         self.schedule=LinkedList()
-        schedule_array=self._generate_schedule() 
-        for week in range (len(schedule_array)): 
-            self.schedule.append(WeekOfGames(week+1,schedule_array[week]))
+        if round_robin:
+            for week_of_games in self.iter_round_robin():
+                self.schedule.append(week_of_games)
+        else:
+            schedule_array=self._generate_schedule() 
+            for week, week_games in schedule_array.enumerate(1):
+                self.schedule.append(WeekOfGames(week, week_games))
 
-    def update_team_stats(self,home_team: Team, away_team: Team, result: LinearProbeTable) -> None:
+    def update_team_stats(self,home_team: Team, away_team: Team, result: GameOutcome) -> None:
         """
     Update the team stats (wins, draws, losses, goals for, goals against).
     
     Args:
         home_team (Team): The home team object.
         away_team (Team): The away team object.
-        result (LinearProbeTable): The result of the game simulation.
+        result (GameOutcome): The result of the game simulation.
 
         Complexity:
-            Best Case Complexity: O(1) retrieving index values in Linear Probe table and updating also have constant time complexity O(1)
-            Worst Case Complexity:  O(1) retrieving index values in Linear Probe table and updating also have constant time complexity O(1)
+            Best Case Complexity: O(1) reading the goals from the outcome and updating also have constant time complexity O(1)
+            Worst Case Complexity:  O(1) reading the goals from the outcome and updating also have constant time complexity O(1)
     """
-        home_goals = result[ResultStats.HOME_GOALS.value]
-        away_goals = result[ResultStats.AWAY_GOALS.value]
+        home_goals = result.home_goals
+        away_goals = result.away_goals
         
         # Update team goals
         home_team[TeamStats.GOALS_FOR] += home_goals
@@ -201,6 +246,91 @@ class Season:
             week += 1
 
         return ArrayR.from_list(weekly_games + flipped_weeks)
+
+    def num_round_robin_weeks(self) -> int:
+        """
+        Returns the number of weeks in the circle method schedule.
+        Every team plays every other team twice, and with an odd number of teams
+        one team has a bye each week.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        num_teams: int = len(self.teams)
+        if num_teams < 2:
+            return 0
+        return 2 * (num_teams + num_teams % 2 - 1)
+
+    def round_robin_week(self, week: int) -> WeekOfGames:
+        """
+        Returns a single week of the double round-robin schedule generated with the
+        circle method (Berger tables), without generating any other week.
+
+        The teams are placed in slots (plus an empty bye slot if there is an odd number
+        of teams). Slot 0 stays fixed while the others rotate one place each round, and
+        slot i plays slot S - 1 - i. After every team has met every other team once, the
+        rounds are repeated with home and away swapped.
+
+        Args:
+            week (int): The week number, starting at 1.
+
+        Raises:
+            ValueError: If the week is not part of the schedule.
+
+        Complexity:
+            Best Case Complexity: O(T) where T is the number of teams.
+            Worst Case Complexity: O(T) where T is the number of teams.
+        """
+        num_weeks: int = self.num_round_robin_weeks()
+        if week < 1 or week > num_weeks:
+            raise ValueError(f"Week {week} is not in the schedule of {num_weeks} weeks")
+
+        num_teams: int = len(self.teams)
+        num_slots: int = num_teams + num_teams % 2
+        num_rounds: int = num_slots - 1
+        round_no: int = (week - 1) % num_rounds
+        flipped: bool = week > num_rounds
+
+        games: list[Game] = []
+        for i in range(num_slots // 2):
+            home: int = Season._circle_slot(i, round_no, num_rounds)
+            away: int = Season._circle_slot(num_slots - 1 - i, round_no, num_rounds)
+            if home >= num_teams or away >= num_teams:
+                continue  # Playing the empty slot is a bye
+
+            # The fixed team alternates between home and away
+            if (i == 0 and round_no % 2 == 1) != flipped:
+                home, away = away, home
+            games.append(Game(self.teams[home], self.teams[away]))
+
+        return WeekOfGames(week, ArrayR.from_list(games))
+
+    def iter_round_robin(self) -> Generator[WeekOfGames]:
+        """
+        Lazily yields every week of the circle method schedule, see round_robin_week.
+        Each week is only built when it is requested.
+
+        Complexity:
+            Best Case Complexity: O(T) per week, O(T^2) for the whole schedule where T is the number of teams.
+            Worst Case Complexity: O(T) per week, O(T^2) for the whole schedule where T is the number of teams.
+        """
+        for week in range(1, self.num_round_robin_weeks() + 1):
+            yield self.round_robin_week(week)
+
+    @staticmethod
+    def _circle_slot(slot: int, round_no: int, num_rounds: int) -> int:
+        """
+        Returns the index of the team in a slot of the circle for the given round.
+        Slot 0 is fixed and the team in every other slot moves one place per round.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if slot == 0:
+            return 0
+        return 1 + (slot - 1 + round_no) % num_rounds
     
     def update_individual_player_stats(self,home_team: Team, away_team: Team, player_list: ArrayR, stat: PlayerStats) -> None:
         """
@@ -213,56 +343,33 @@ class Season:
             stat (PlayerStats): The stat to update (goals, assists, interceptions, or tackles).
 
         Complexities: 
-            Best Case Complexity: O(H+A+P) where H is the nuumber of players in the home team, A is the number od players in the away team and P is the number of people in player_list.
+            Best Case Complexity: O(P) where P is the number of people in player_list.
             returning None  has complexity O(1)
-            Iterating through home_team has complexity O(P)
-            Iterating throuhgh away_team has complexity O(H)
-            Iterating through all the players has complexity O(P)
-            the best case is when we dont need to run the inner for loop when searching for the player with matching name. 
-            This happens under the circumstances that the firs playe in Player_list matches with the first name in all_players
-
-
-
-            Worst Case Complexity: O((H+A)*P where H is the number of players in the home team, A is the number of players in the away team and P is th number of pople in the players lsit. 
-            returning None  has complexity O(1)
-            Iterating through home_team has complexity O(P)
-            Iterating throuhgh away_team has complexity O(H)
-            Iterating through all the players has complexity O(P)
-
-            The worst case happens when player are found at the end of the all_players list making sure it traverse throughout. 
-
+            Each name is looked up in the name index of the home team, then the away team, which is O(1)
+            for names of bounded length when there is no probing.
 
+            Worst Case Complexity: O(P*(H+A)) where H is the number of players in the home team and A is the number
+            of players in the away team, when every lookup has to probe through a cluster holding all the players.
         """
         if player_list is None:
             return
 
-       
-        all_players = []
-        
-       
-        for player in home_team.get_players():
-            all_players.append(player)
-        
-        
-        for player in away_team.get_players():
-            all_players.append(player)
-
-        
         for player_name in player_list:
-            for player in all_players:
-                if player.get_name() == player_name:
-                    player[stat] += 1  
-                    break      
+            player = home_team.get_player_by_name(player_name)
+            if player is None:
+                player = away_team.get_player_by_name(player_name)
+            if player is not None:
+                player[stat] += 1
 
 
-    def update_player_stats(self,home_team: Team, away_team: Team, result: LinearProbeTable) -> None:
+    def update_player_stats(self,home_team: Team, away_team: Team, result: GameOutcome) -> None:
         """
         Update the player stats based on the game result.
         
         Args:
             home_team (Team): The home team object.
             away_team (Team): The away team object.
-            result (LinearProbeTable): The result of the game simulation.
+            result (GameOutcome): The result of the game simulation.
 
         Returns: 
             None
@@ -280,33 +387,72 @@ class Season:
             player[PlayerStats.GAMES_PLAYED] += 1
             
        
-        self.update_individual_player_stats(home_team, away_team, result[ResultStats.GOAL_SCORERS.value], PlayerStats.GOALS)
+        self.update_individual_player_stats(home_team, away_team, result.goal_scorers, PlayerStats.GOALS)
         
         
-        self.update_individual_player_stats(home_team, away_team, result[ResultStats.GOAL_ASSISTS.value], PlayerStats.ASSISTS)
+        self.update_individual_player_stats(home_team, away_team, result.goal_assists, PlayerStats.ASSISTS)
         
         
-        self.update_individual_player_stats(home_team, away_team, result[ResultStats.INTERCEPTIONS.value], PlayerStats.INTERCEPTIONS)
+        self.update_individual_player_stats(home_team, away_team, result.interceptions, PlayerStats.INTERCEPTIONS)
         
         
-        self.update_individual_player_stats(home_team, away_team, result[ResultStats.TACKLES.value], PlayerStats.TACKLES)
+        self.update_individual_player_stats(home_team, away_team, result.tackles, PlayerStats.TACKLES)
     
         
-    def update_leaderboard(self) -> None:
+    def update_leaderboard(self, changed_teams: Union[list[Team], None] = None) -> None:
         """
         Updates the leaderboard by re-sorting the teams based on points,
         goal difference, and goals for. This should be called after simulating
         the season to reflect the final standings.
 
+        Args:
+            changed_teams (Union[list[Team], None]): The teams whose stats changed since the last update.
+                Only these teams are repositioned, the others must not have changed.
+                If None, the whole leaderboard is rebuilt.
+
         Complexity: 
-            Best Case Complexity: O(T) happens when all elements are sorted and element to be inserted can be inserted without shuffling
-            Worst Case Complexity: O(T^2) happens when existing elemtst have to be shuffled to add a new element 
+            Best Case Complexity: O(K*(log(T)*C + T) + R) when only K teams changed, where C is the cost of
+            comparing two teams and R the number of positions between the first and last team that moved, as each
+            changed team is taken out and binary searched back in and only the ranks of those positions are updated.
+            Worst Case Complexity: O(T^2) when the whole leaderboard is rebuilt and existing elements have to be
+            shuffled to add every new element.
         """
-       
-        self.leaderboard.clear()
+        if changed_teams is None:
+            self.leaderboard.clear()
 
-        for team in self.teams:
-            self.leaderboard.add(team)
+            for team in self.teams:
+                self.leaderboard.add(team)
+            self._update_ranks()
+        else:
+            start, stop = self.leaderboard.reposition([self.ranks[team.get_name()] for team in changed_teams])
+            self._update_ranks(start, stop)
+
+    def _update_ranks(self, start: int = 0, stop: Union[int, None] = None) -> None:
+        """
+        Records the position of the teams from position start up to (not including) stop of
+        the leaderboard, by team name, overwriting their previous positions.
+
+        Complexity:
+            Best Case Complexity: O(R) where R is the number of positions, with no probing.
+            Worst Case Complexity: O(R*T) where T is the number of teams, when every update probes the whole cluster.
+        """
+        if stop is None:
+            stop = len(self.leaderboard)
+        for position in range(start, stop):
+            self.ranks[self.leaderboard[position].get_name()] = position
+
+    def get_rank(self, team: Team) -> int:
+        """
+        Returns the current position of a team in the leaderboard, starting at 1.
+
+        Raises:
+            KeyError: If the team is not part of this season.
+
+        Complexity:
+            Best Case Complexity: O(1) when the team name is found without probing.
+            Worst Case Complexity: O(T) where T is the number of teams, when the whole cluster is probed.
+        """
+        return self.ranks[team.get_name()] + 1
 
     def simulate_season(self) -> None:
         """
@@ -319,47 +465,81 @@ class Season:
             Best Case Complexity:O(W * T * P) where W is the number of weeks, T is the number teams and P is the number of players in the team. 
             Worst Case Complexity:O(W * T^2 + W * T * P) where W is the number of weeks, T is the number teams and P is the number of players in the team.
         """
-        for week_num, week_of_games in enumerate(self.schedule, start=1):
+        for _ in self.simulate_weeks():
+            pass
 
-            for game_num, game in enumerate(week_of_games, start=1):
-                for game in week_of_games:
-                    home_team = game.home_team
-                    away_team = game.away_team
-                    
+    def simulate_weeks(self) -> Generator[WeekResult]:
+        """
+        Simulates the season one week at a time, yielding the results of each week
+        together with a snapshot of the standings once that week has been played.
+        The season only advances as the results are consumed.
 
-                    result = GameSimulator.simulate(home_team, away_team)
+        Complexity:
+            Best Case Complexity: O(T * P + T) per week, where T is the number of teams and P is the number of players in the team.
+            Worst Case Complexity: O(T^2 + T * P) per week, where T is the number of teams and P is the number of players in the team.
+        """
+        for week_of_games in self.schedule:
+            games: ArrayR[Game] = week_of_games.get_games()
+            outcomes: ArrayR[GameOutcome] = ArrayR(len(games))
+            changed_teams: list[Team] = []
 
-                    home_goals = result[ResultStats.HOME_GOALS.value]
-                    away_goals = result[ResultStats.AWAY_GOALS.value]
+            for game_no, game in games.enumerate():
+                outcomes[game_no] = self.play_game(game)
+                changed_teams.append(game.home_team)
+                changed_teams.append(game.away_team)
 
-                    self.update_team_stats(home_team, away_team, result)
+            self.update_leaderboard(changed_teams)
+            yield WeekResult(week_of_games.get_week(), games, outcomes, self.get_standings())
 
- 
-                    
-  
-                    self.update_player_stats(home_team, away_team, result)
+    def play_game(self, game: Game) -> GameOutcome:
+        """
+        Simulates a single game and updates the team and player stats with its result.
+        The leaderboard is not updated.
 
-                    if home_goals > away_goals:
- 
-                        home_team[TeamStats.WINS] += 1
-                        away_team[TeamStats.LOSSES] += 1
-                    elif home_goals < away_goals:
+        Complexity:
+            Best Case Complexity: O(P) where P is the number of players in the teams.
+            Worst Case Complexity: O(P + E*P) where E is the number of events in the game, see update_player_stats.
+        """
+        home_team = game.home_team
+        away_team = game.away_team
 
-                        away_team[TeamStats.WINS] += 1
-                        home_team[TeamStats.LOSSES] += 1
-                    else:
+        result = GameSimulator.simulate(home_team, away_team)
 
-                        home_team[TeamStats.DRAWS] += 1
-                        away_team[TeamStats.DRAWS] += 1
+        home_goals = result.home_goals
+        away_goals = result.away_goals
 
-  
-            self.update_leaderboard()
+        self.update_team_stats(home_team, away_team, result)
+        self.update_player_stats(home_team, away_team, result)
 
+        if home_goals > away_goals:
+            home_team[TeamStats.WINS] += 1
+            away_team[TeamStats.LOSSES] += 1
+        elif home_goals < away_goals:
+            away_team[TeamStats.WINS] += 1
+            home_team[TeamStats.LOSSES] += 1
+        else:
+            home_team[TeamStats.DRAWS] += 1
+            away_team[TeamStats.DRAWS] += 1
 
+        return result
 
-    
+    def get_standings(self) -> Union[ArrayR[tuple[str, int, int, int]], None]:
+        """
+        Returns a lightweight snapshot of the current leaderboard, which is not
+        affected by games played later.
+
+        Returns:
+            Union[ArrayR[tuple[str, int, int, int]], None]: For each team in leaderboard order,
+                (team name, games played, points, goal difference). None when the season has
+                no teams, as for an empty list in ArrayR.from_list.
+
+        Complexity:
+            Best Case Complexity: O(T) where T is the number of teams.
+            Worst Case Complexity: O(T) where T is the number of teams.
+        """
+        return ArrayR.from_list([(team.get_name(), team[TeamStats.GAMES_PLAYED], team[TeamStats.POINTS],
+                                  team[TeamStats.GOALS_DIFFERENCE]) for team in self.leaderboard])
 
-    
     def delay_week_of_games(self, orig_week: int, new_week: Union[int, None] = None) -> None:
         """
         Delay a week of games from one week to another.
@@ -2,10 +2,12 @@ from __future__ import annotations
 from data_structures.referential_array import ArrayR
 from constants import GameResult, PlayerPosition, PlayerStats, TeamStats
 from player import Player
+from player_sampler import PlayerSampler
 from typing import Collection, Union, TypeVar
 from data_structures.hash_table import LinearProbeTable
 from data_structures.linked_list import LinkedList
 from data_structures.array_sorted_list import ArraySortedList
+from data_structures.stat_store import StatStore, StatView
 
 T = TypeVar("T")
 
@@ -14,8 +16,11 @@ class Team:
     # Unique number for each team, will be incremented by each team is initialised
     team_number = 1
     team_length = 0
+    # Numeric team stats, held for every team of the league in one store (Last Five Results is kept per team)
+    COUNTED_STATS = tuple(stat for stat in TeamStats if stat is not TeamStats.LAST_FIVE_RESULTS)
+    default_store: StatStore[TeamStats] = StatStore(COUNTED_STATS)
 
-    def __init__(self, team_name: str, players: ArrayR[Player]) -> None:
+    def __init__(self, team_name: str, players: ArrayR[Player], store: Union[StatStore[TeamStats], None] = None) -> None:
 
         """
         Constructor for the Team class
@@ -23,6 +28,8 @@ class Team:
         Args:
             team_name (str): The name of the team
             players (ArrayR[Player]): The players of the team
+            store (Union[StatStore[TeamStats], None]): The store holding the team's statistics,
+                Team.default_store if None.
 
         Returns:
             None
@@ -41,26 +48,28 @@ class Team:
 
         self.team_name = team_name
 
-        self.statistics = LinearProbeTable()
+        # the store initialises the value of the statistics to zero
+        self.store = Team.default_store if store is None else store
+        self.id = self.store.allocate(self)
+        self.last_five_results = LinkedList()
 
         self.all_players = LinkedList()
         
-
-        for stat in TeamStats:
-            if stat.value != "Last Five Results":
-                self.statistics[stat.value] = 0
-            elif stat.value == "Last Five Results":
-                self.statistics[stat.value] = LinkedList()
-        
         self.players = LinearProbeTable()
         
         for pos in PlayerPosition:
             self.players[pos.value] = LinkedList()
         
+        self.players_by_name = LinearProbeTable()
+
         for player in players:
             self.team_length +=1
             self.players[player.position.value].append(player)
             self.all_players.append(player)
+            if player.get_name() not in self.players_by_name:
+                self.players_by_name[player.get_name()] = player
+
+        self.sampler = None
         
         
 
@@ -80,11 +89,8 @@ class Team:
             In the worst case there will be elements reseting when we have to reset the LnkedList for each of the
             Last five results. 
         """
-        for stat in TeamStats:
-            if stat.value != "Last Five Results":
-                self.statistics[stat.value] = 0
-            elif stat.value == "Last Five Results":
-                self.statistics[stat.value].clear()
+        self.store.reset_row(self.id)
+        self.last_five_results.clear()
         
 
     def add_player(self, player: Player) -> None:
@@ -104,6 +110,9 @@ class Team:
         self.players[player.position.value].append(player)
         self.all_players.append(player)
         self.team_length +=1
+        if player.get_name() not in self.players_by_name:
+            self.players_by_name[player.get_name()] = player
+        self.sampler = None
 
     def remove_player(self, player: Player) -> None:
         """
@@ -118,13 +127,22 @@ class Team:
         Complexity:
             Best Case Complexity: O(1) constant time complexity as retrival from hash table has complexity O(1)
             and if the data to be removed is at the beginning of the list. 
-            Worst Case Complexity: O(1)onstant time complexity as retrival from hash table has complexity O(1). 
+            Worst Case Complexity: O(N) where N is the number of players, when the player is at the end of the
+            lists or another player with the same name has to be found for the name index.
         """
         index = self.players[player.position.value].index(player)
         self.players[player.position.value].delete_at_index(index)
         index_1 = self.all_players.index(player)
         self.all_players.delete_at_index(index_1)
         self.team_length -=1
+        if self.players_by_name[player.get_name()] is player:
+            del self.players_by_name[player.get_name()]
+            # Another player with the same name takes over the name
+            for other in self.all_players:
+                if other.get_name() == player.get_name():
+                    self.players_by_name[other.get_name()] = other
+                    break
+        self.sampler = None
 
     def get_number(self) -> int:
         """
@@ -182,18 +200,53 @@ class Team:
             return self.players[position.value]
     
 
-    def get_statistics(self):
+    def get_player_by_name(self, name: str) -> Union[Player, None]:
+        """
+        Returns the player of the team with the given name.
+        If several players share the name, the one added to the team first is returned.
+
+        Args:
+            name (str): The name of the player
+
+        Returns:
+            Player: The player with that name
+            or
+            None if no player in the team has that name.
+
+        Complexity:
+            Best Case Complexity: O(hash(name)) when the name is found without probing.
+            Worst Case Complexity: O(hash(name) + N) where N is the number of players, when the whole cluster is probed.
+        """
+        try:
+            return self.players_by_name[name]
+        except KeyError:
+            return None
+
+    def get_sampler(self) -> PlayerSampler:
+        """
+        Returns the weighted player sampler for this team, rebuilding it if the roster
+        or any player's attributes have changed since it was last built.
+
+        Complexity:
+            Best Case Complexity: O(1) when the cached sampler is still current.
+            Worst Case Complexity: O(N) where N is the number of players, when it has to be rebuilt.
+        """
+        if self.sampler is None or not self.sampler.is_current():
+            self.sampler = PlayerSampler(self.get_players())
+        return self.sampler
+
+    def get_statistics(self) -> StatView[TeamStats]:
         """
-        Get the statistics of the team
+        Get the statistics of the team, apart from the last five results
 
         Returns:
-            statistics: The teams' statistics
+            StatView[TeamStats]: A view of the teams' statistics in the store
 
         Complexity:
-            Best Case Complexity: O(1) returning a linear table has constant time complexity 
-            Worst Case Complexity: O(1) returning a linear table has constant time complexity
+            Best Case Complexity: O(1) creating a view has constant time complexity 
+            Worst Case Complexity: O(1) creating a view has constant time complexity
         """
-        return self.statistics
+        return self.store.row(self.id)
 
     def get_last_five_results(self) -> Union[Collection[GameResult], None]:
         """
@@ -223,12 +276,9 @@ class Team:
             returning none has complexity also O(1)
             Worst Case Complexity: O(1) as accessing elements and returning them all have complexity O(1)
         """
-        if len(self.statistics["Last Five Results"]) != 0:
-            return self.statistics["Last Five Results"]
-        elif self.statistics["Games Played"] == 0:
-            return None
-        else:
-            return None
+        if len(self.last_five_results) != 0:
+            return self.last_five_results
+        return None
 
     def get_top_x_players(self, player_stat: PlayerStats, num_players: int) -> list[tuple[int, str, Player]]:
         """
@@ -258,43 +308,42 @@ class Team:
             Best Case Complexity:O(1) 
             Worst Case Complexity: O(1)
         """
-        if statistic.value == "Wins":
-            dif =  value - self.statistics[statistic.value]
-            self.statistics[statistic.value] = value
-            self.statistics["Games Played"] += dif
-            self.statistics["Points"] = self.statistics["Points"] + (GameResult.WIN*dif)
-
-            if len(self.statistics["Last Five Results"]) >= 5:
-                self.statistics["Last Five Results"].delete_at_index(0)
-
-            self.statistics["Last Five Results"].append(GameResult.WIN)
-        elif statistic.value == "Losses":
-            dif =  value - self.statistics[statistic.value]
-            self.statistics[statistic.value] = value
-            self.statistics["Games Played"] += dif
-
-            if len(self.statistics["Last Five Results"]) >= 5:
-                self.statistics["Last Five Results"].delete_at_index(0)
-
-            self.statistics["Last Five Results"].append(GameResult.LOSS)
-        elif statistic.value == "Draws":
-            dif =  value - self.statistics[statistic.value]
-            self.statistics[statistic.value] = value
-            self.statistics["Games Played"] += dif
-            self.statistics["Points"] = self.statistics["Points"] + (GameResult.DRAW*dif)
-
-            if len(self.statistics["Last Five Results"]) >= 5:
-                self.statistics["Last Five Results"].delete_at_index(0)
-            self.statistics["Last Five Results"].append(GameResult.DRAW)
-        elif statistic.value == "Goals For" or statistic.value == "Goals Against":
-            self.statistics[statistic.value] = value
-            self.statistics["Goals Difference"] = self.statistics["Goals For"] - self.statistics["Goals Against"]
+        store, team_id = self.store, self.id
+        if statistic is TeamStats.WINS:
+            dif = value - store.get(team_id, statistic)
+            store.set(team_id, statistic, value)
+            store.set(team_id, TeamStats.GAMES_PLAYED, store.get(team_id, TeamStats.GAMES_PLAYED) + dif)
+            store.set(team_id, TeamStats.POINTS, store.get(team_id, TeamStats.POINTS) + GameResult.WIN*dif)
+            self.__add_result(GameResult.WIN)
+        elif statistic is TeamStats.LOSSES:
+            dif = value - store.get(team_id, statistic)
+            store.set(team_id, statistic, value)
+            store.set(team_id, TeamStats.GAMES_PLAYED, store.get(team_id, TeamStats.GAMES_PLAYED) + dif)
+            self.__add_result(GameResult.LOSS)
+        elif statistic is TeamStats.DRAWS:
+            dif = value - store.get(team_id, statistic)
+            store.set(team_id, statistic, value)
+            store.set(team_id, TeamStats.GAMES_PLAYED, store.get(team_id, TeamStats.GAMES_PLAYED) + dif)
+            store.set(team_id, TeamStats.POINTS, store.get(team_id, TeamStats.POINTS) + GameResult.DRAW*dif)
+            self.__add_result(GameResult.DRAW)
+        elif statistic is TeamStats.GOALS_FOR or statistic is TeamStats.GOALS_AGAINST:
+            store.set(team_id, statistic, value)
+            store.set(team_id, TeamStats.GOALS_DIFFERENCE,
+                      store.get(team_id, TeamStats.GOALS_FOR) - store.get(team_id, TeamStats.GOALS_AGAINST))
         else:
-            self.statistics[statistic.value] = value
+            store.set(team_id, statistic, value)
 
-        
-        
+    def __add_result(self, result: GameResult) -> None:
+        """
+        Adds a result to the last five results, dropping the oldest one if there are already five.
 
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1) as the list never holds more than five results.
+        """
+        if len(self.last_five_results) >= 5:
+            self.last_five_results.delete_at_index(0)
+        self.last_five_results.append(result)
 
     def __getitem__(self, statistic: TeamStats) -> int:
         """
@@ -310,10 +359,39 @@ class Team:
             ValueError: If the statistic is invalid
 
         Complexity:
-            Best Case Complexity: O(1) retruning values in hash have a constant time complexity
-            Worst Case Complexity: O(1) returning values in a hash have a constant time compelxity
+            Best Case Complexity: O(1) reading a column of the store has a constant time complexity
+            Worst Case Complexity: O(1) reading a column of the store has a constant time compelxity
+        """
+        if statistic is TeamStats.LAST_FIVE_RESULTS:
+            return self.last_five_results
+        return self.store.get(self.id, statistic)
+
+    def __getstate__(self) -> dict:
+        """
+        Pickles the team with the values of its statistics, as the store is not pickled.
+
+        Complexity:
+            Best Case Complexity: O(S) where S is the number of statistics.
+            Worst Case Complexity: O(S) where S is the number of statistics.
+        """
+        state = self.__dict__.copy()
+        del state['store'], state['id']
+        state['statistics'] = self.store.get_row(self.id)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Unpickles the team into Team.default_store of this process.
+
+        Complexity:
+            Best Case Complexity: O(S) where S is the number of statistics.
+            Worst Case Complexity: O(S) where S is the number of statistics.
         """
-        return self.statistics[statistic.value]
+        statistics = state.pop('statistics')
+        self.__dict__.update(state)
+        self.store = Team.default_store
+        self.id = self.store.allocate(self)
+        self.store.set_row(self.id, statistics)
 
     def __len__(self) -> int:
         """
@@ -53,9 +53,8 @@ def take_out_from_adt(adt: POSSIBLE_ADT_TYPES) -> Union[ArrayR[T], None]:
             output[index] = adt[index]
 
     elif adt_type in [LinearProbeTable, HashTableSeparateChaining, HashyPerfectionTable, HashyStepTable]:
-        values: list[T] = adt.values()
-        for index in range(len(adt)):
-            output[index] = values[index]
+        for index, value in enumerate(adt.values()):
+            output[index] = value
 
     elif adt_type == ArraySortedList:
         for index in range(len(adt)):
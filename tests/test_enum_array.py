@@ -0,0 +1,46 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from constants import PlayerPosition, PlayerStats, TeamStats
+from data_structures.enum_array import EnumArray, IndexedEnum
+from player import Player
+
+
+class TestEnumArray(TestCase):
+
+    @number("18.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_slots(self) -> None:
+        for enum in [PlayerStats, TeamStats]:
+            self.assertEqual([member.slot for member in enum], list(range(len(enum))))
+
+        Colour = IndexedEnum("Colour", ["RED", "GREEN", "BLUE"])
+        self.assertEqual([member.slot for member in Colour], [0, 1, 2])
+
+    @number("18.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_get_set(self) -> None:
+        stats: EnumArray[PlayerStats, int] = EnumArray(PlayerStats)
+        self.assertEqual(len(stats), 0)
+        stats[PlayerStats.GOALS] = 3
+        stats[PlayerStats.GAMES_PLAYED] = 1
+        self.assertEqual(stats[PlayerStats.GOALS], 3)
+        self.assertIn(PlayerStats.GOALS, stats)
+        self.assertNotIn(PlayerStats.ASSISTS, stats)
+        self.assertEqual(list(stats.keys()), [PlayerStats.GAMES_PLAYED, PlayerStats.GOALS])
+        self.assertEqual(list(stats.values()), [1, 3])
+
+        del stats[PlayerStats.GOALS]
+        self.assertRaises(KeyError, lambda: stats[PlayerStats.GOALS])
+        self.assertEqual(len(stats), 1)
+
+    @number("18.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_other_keys(self) -> None:
+        stats: EnumArray[PlayerStats, int] = EnumArray(PlayerStats, 0)
+        self.assertRaises(KeyError, lambda: stats[TeamStats.GAMES_PLAYED])
+        self.assertRaises(KeyError, lambda: stats["Goals"])
+        self.assertNotIn(TeamStats.GAMES_PLAYED, stats)
+
+        player = Player("Alexey", PlayerPosition.STRIKER, 18)
+        self.assertRaises(KeyError, lambda: player[TeamStats.GAMES_PLAYED])
@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from constants import PlayerPosition, PlayerStats, ResultStats
+from data_structures.referential_array import ArrayR
+from ed_utils.decorators import number, visibility
+from game_simulator import GameOutcome, GameSimulator
+from player import Player
+from random_gen import RandomGen
+from team import Team
+
+
+class TestGameSimulator(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(99)
+        teams = []
+        for team_name in ['Home', 'Away']:
+            players = []
+            for i, position in enumerate(list(PlayerPosition) * 3):
+                player = Player(f"{team_name} {i}", position, 20)
+                player[PlayerStats.STAR_SKILL] = RandomGen.randint(0, 5)
+                player[PlayerStats.HEIGHT] = RandomGen.randint(150, 180)
+                players.append(player)
+            teams.append(Team(team_name, ArrayR.from_list(players)))
+        self.home_team, self.away_team = teams
+
+    @number("10.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_outcome_mapping(self) -> None:
+        outcome = GameSimulator.simulate(self.home_team, self.away_team)
+        self.assertIsInstance(outcome, GameOutcome)
+        self.assertEqual(outcome[ResultStats.HOME_GOALS.value], outcome.home_goals)
+        self.assertEqual(outcome[ResultStats.AWAY_GOALS.value], outcome.away_goals)
+        self.assertIs(outcome[ResultStats.GOAL_SCORERS.value], outcome.goal_scorers)
+        self.assertIs(outcome[ResultStats.TACKLES.value], outcome.tackles)
+        self.assertEqual(len(outcome.goal_scorers or []), outcome.home_goals + outcome.away_goals)
+        self.assertEqual(list(outcome.keys()), [result_stat.value for result_stat in ResultStats])
+        self.assertEqual(list(outcome.values())[:2], [outcome.home_goals, outcome.away_goals])
+        for result_stat in ResultStats:
+            self.assertIn(result_stat.value, outcome)
+        self.assertRaises(KeyError, lambda: outcome["Corners"])
+        self.assertRaises(AttributeError, lambda: setattr(outcome, "corners", 3))
+
+    @number("10.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_given_goals(self) -> None:
+        outcome = GameSimulator.simulate(self.home_team, self.away_team, goals=(3, 0))
+        self.assertEqual((outcome.home_goals, outcome.away_goals), (3, 0))
+        home_names = [player.get_name() for player in self.home_team.get_players()]
+        for scorer in outcome.goal_scorers:
+            self.assertIn(scorer, home_names, "Only the home team scored")
@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from goal_distribution import GoalDistribution
+from random_gen import RandomGen
+
+
+class TestGoalDistribution(TestCase):
+
+    @number("9.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_matches_list_draw(self) -> None:
+        goal_list: list[int] = [0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5
+        RandomGen.set_seed(123)
+        expected = [RandomGen.random_choice(goal_list) for _ in range(500)]
+
+        distribution = GoalDistribution.default()
+        RandomGen.set_seed(123)
+        self.assertEqual([distribution.draw() for _ in range(500)], expected)
+
+    @number("9.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_draw_fixtures(self) -> None:
+        distribution = GoalDistribution([1, 0, 3, 2])
+        RandomGen.set_seed(5)
+        expected = [(distribution.draw(), distribution.draw()) for _ in range(20)]
+        RandomGen.set_seed(5)
+        self.assertEqual(distribution.draw_fixtures(20).to_list(), expected)
+        self.assertNotIn(1, [goals for fixture in expected for goals in fixture], "A zero weight should never be drawn")
+
+    @number("9.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_invalid_weights(self) -> None:
+        self.assertRaises(ValueError, lambda: GoalDistribution([0, 0]))
+        self.assertRaises(ValueError, lambda: GoalDistribution([3, -1]))
@@ -0,0 +1,78 @@
+import pickle
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.hash_functions import SeededHash, builtin_hash, fnv1a_hash, polynomial_hash
+from data_structures.hash_table import LinearProbeTable
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from data_structures.robin_hood_table import RobinHoodTable
+from hash_benchmark import crafted_names, hash_stats
+from hashy_step_table import HashyStepTable
+
+
+class TestHashFunctions(TestCase):
+
+    def setUp(self) -> None:
+        self.names = ["Player " + str(i) for i in range(200)]
+        self.hash_functions = [polynomial_hash, builtin_hash, fnv1a_hash, SeededHash(1)]
+
+    @number("20.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hash_functions(self) -> None:
+        self.assertEqual(polynomial_hash("Maria"), LinearProbeTable().full_hash("Maria"),
+                         "The polynomial hash should be the default hash of the tables")
+        self.assertEqual(polynomial_hash("Maria"), HashyStepTable().hash("Maria"))
+        chaining = HashTableSeparateChaining()
+        self.assertEqual(chaining.hash("Maria"), polynomial_hash("Maria") % len(chaining.table))
+        self.assertEqual(fnv1a_hash(""), 0xcbf29ce484222325)
+        self.assertEqual(fnv1a_hash("a"), 0xaf63dc4c8601ec8c)
+        for hash_function in self.hash_functions:
+            hashes = [hash_function(name) for name in self.names]
+            self.assertTrue(all(key_hash >= 0 for key_hash in hashes))
+            self.assertEqual(hashes, [hash_function(name) for name in self.names])
+
+    @number("20.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_seeded_hash(self) -> None:
+        self.assertEqual(SeededHash(7)("Maria"), SeededHash(7)("Maria"))
+        self.assertNotEqual(SeededHash(7)("Maria"), SeededHash(8)("Maria"))
+        self.assertNotEqual(SeededHash()("Maria"), SeededHash()("Maria"), "Unseeded hashes should differ")
+
+        restored = pickle.loads(pickle.dumps(SeededHash(7)))
+        self.assertEqual(restored("Maria"), SeededHash(7)("Maria"))
+
+    @number("20.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_tables_use_hash_function(self) -> None:
+        for hash_function in self.hash_functions:
+            tables = [LinearProbeTable(hash_function=hash_function),
+                      LinearProbeTable(tombstones=True, hash_function=hash_function),
+                      RobinHoodTable(hash_function=hash_function),
+                      HashyStepTable(hash_function=hash_function),
+                      HashTableSeparateChaining(hash_function=hash_function)]
+            for table in tables:
+                for i, name in enumerate(self.names):
+                    table[name] = i
+                for name in self.names[:50]:
+                    del table[name]
+                self.assertEqual(sorted(table.items()),
+                                 sorted((name, i) for i, name in enumerate(self.names) if i >= 50))
+                self.assertNotIn(self.names[0], table)
+
+        table = LinearProbeTable(hash_function=SeededHash(3))
+        table["Maria"] = 1
+        self.assertEqual(table.hash_array[table.hash("Maria")], SeededHash(3)("Maria"))
+        restored = pickle.loads(pickle.dumps(table))
+        self.assertEqual(restored["Maria"], 1)
+
+    @number("20.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_benchmark(self) -> None:
+        names = crafted_names(20)
+        size = LinearProbeTable.with_capacity(20).table_size
+        self.assertEqual({polynomial_hash(name) % size for name in names}, {0})
+
+        polynomial = hash_stats(polynomial_hash, names, 1)
+        seeded = hash_stats(SeededHash(1), names, 1)
+        self.assertAlmostEqual(polynomial['slot_collisions'], 19 / 20)
+        self.assertLess(seeded['mean_probe'], polynomial['mean_probe'])
@@ -0,0 +1,206 @@
+import pickle
+from types import GeneratorType
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.hash_functions import fnv1a_hash
+from data_structures.hash_table import LinearProbeTable, TOMBSTONE
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from data_structures.robin_hood_table import RobinHoodTable
+from hashy_perfection_table import PerfectHashTable
+from hashy_step_table import HashyStepTable
+
+
+class CountingTable(LinearProbeTable):
+    """ LinearProbeTable that counts how many times a key is hashed. """
+
+    def __init__(self, sizes=None) -> None:
+        LinearProbeTable.__init__(self, sizes)
+        self.hash_calls = 0
+
+    def full_hash(self, key: str) -> int:
+        self.hash_calls += 1
+        return LinearProbeTable.full_hash(self, key)
+
+
+class TestLinearProbeTable(TestCase):
+
+    def setUp(self) -> None:
+        self.names = ["Player " + str(i) for i in range(200)]
+
+    @number("14.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_growth_does_not_rehash_keys(self) -> None:
+        table = CountingTable()
+        for i, name in enumerate(self.names):
+            table[name] = i
+        self.assertEqual(table.hash_calls, len(self.names), "Each key should only be hashed when it is inserted")
+        for i, name in enumerate(self.names):
+            self.assertEqual(table[name], i)
+
+    @number("14.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_delete_reuses_stored_hashes(self) -> None:
+        table = CountingTable(sizes=[401])
+        for i, name in enumerate(self.names):
+            table[name] = i
+
+        table.hash_calls = 0
+        for name in self.names[::2]:
+            del table[name]
+        self.assertEqual(table.hash_calls, len(self.names[::2]), "Only the deleted keys should be hashed")
+
+        self.assertEqual(len(table), len(self.names) // 2)
+        for i, name in enumerate(self.names):
+            self.assertEqual(name in table, i % 2 == 1)
+
+    @number("14.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hash_matches_position(self) -> None:
+        table = LinearProbeTable(sizes=[97])
+        table["Maria"] = 1
+        position = table.hash("Maria")
+        self.assertEqual(position, table.full_hash("Maria") % table.table_size)
+        self.assertEqual((table.array[position], table.value_array[position]), ("Maria", 1))
+
+    @number("14.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_tombstone_delete(self) -> None:
+        table = LinearProbeTable(sizes=[5], tombstones=True)
+        table.hash = table.full_hash = lambda _: 0
+        for i, name in enumerate(["A", "B"]):
+            table[name] = i
+
+        del table["A"]
+        self.assertIs(table.array[0], TOMBSTONE)
+        self.assertEqual(table.tombstones, 1)
+        self.assertEqual(table["B"], 1, "Lookups should probe past tombstones")
+        self.assertNotIn("A", table)
+        self.assertEqual(list(table.keys()), ["B"])
+
+        table["C"] = 2
+        self.assertEqual((table.array[0], table.value_array[0]), ("C", 2), "Inserts should reuse the first tombstone")
+        self.assertEqual(table.tombstones, 0)
+
+        del table["B"]
+        self.assertIsNone(table.array[1], "The end of a cluster should be emptied rather than marked")
+
+    @number("14.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_tombstone_compaction(self) -> None:
+        table = CountingTable(sizes=[401])
+        table.use_tombstones = True
+        for i, name in enumerate(self.names):
+            table[name] = i
+
+        for name in self.names[:150]:
+            del table[name]
+            self.assertLessEqual(table.tombstones, table.table_size * table.tombstone_threshold)
+        self.assertEqual(len(table), 50)
+        for i, name in enumerate(self.names[150:]):
+            self.assertEqual(table[name], i + 150)
+
+        restored = pickle.loads(pickle.dumps(table))
+        self.assertEqual([item is TOMBSTONE for item in restored.array], [item is TOMBSTONE for item in table.array])
+
+    @number("14.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_invalid_tombstone_threshold(self) -> None:
+        self.assertRaises(ValueError, lambda: LinearProbeTable(tombstones=True, tombstone_threshold=0.5))
+
+    @number("14.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_presized_construction(self) -> None:
+        items = [(name, i) for i, name in enumerate(self.names)]
+        for table_type in [LinearProbeTable, RobinHoodTable, HashyStepTable]:
+            table = table_type.with_capacity(len(items))
+            self.assertGreaterEqual(table.table_size * table_type.LOAD_FACTOR, len(items))
+            self.assertLess(table.TABLE_SIZES[table.size_index - 1] * table_type.LOAD_FACTOR, len(items),
+                            "The smallest large enough size should be chosen")
+
+            table = table_type.from_items(iter(items))
+            self.assertEqual(table.table_size, table_type.with_capacity(len(items)).table_size)
+            self.assertEqual(len(table), len(items))
+            for name, i in items:
+                self.assertEqual(table[name], i)
+
+        table = HashTableSeparateChaining.from_items(items)
+        self.assertEqual(len(table.table), 389, "The smallest size in TABLE_SIZES holding every item should be chosen")
+        self.assertEqual(table[self.names[-1]], len(items) - 1)
+
+        tables = [LinearProbeTable.with_capacity(len(items), tombstones=True, hash_function=fnv1a_hash),
+                  RobinHoodTable.from_items(items, hash_function=fnv1a_hash),
+                  HashyStepTable.from_items(items, shrink=True, hash_function=fnv1a_hash),
+                  HashTableSeparateChaining.from_items(items, hash_function=fnv1a_hash)]
+        self.assertTrue(tables[0].use_tombstones)
+        self.assertTrue(tables[2].shrink)
+        self.assertEqual([tables[0].full_hash, tables[1].full_hash, tables[2].hash, tables[3].hash_function],
+                         [fnv1a_hash] * 4, "The hash function should be passed on to the constructor")
+        for table in tables[1:]:
+            self.assertEqual(table[self.names[-1]], len(items) - 1)
+
+    @number("14.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_update_resizes_once(self) -> None:
+        table = LinearProbeTable()
+        table["Existing"] = -1
+        rehashes = []
+        table._rehash = lambda: rehashes.append(table.table_size)
+        table.update((name, i) for i, name in enumerate(self.names))
+        self.assertEqual(rehashes, [], "Reserving for the batch should avoid resizing while inserting")
+        self.assertEqual(len(table), len(self.names) + 1)
+        self.assertEqual(table["Existing"], -1)
+
+    @number("14.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_separate_chaining_growth(self) -> None:
+        table = HashTableSeparateChaining()
+        for i, name in enumerate(self.names):
+            table[name] = i
+            self.assertLessEqual(len(table), len(table.table) * HashTableSeparateChaining.LOAD_FACTOR)
+        self.assertIn(len(table.table), HashTableSeparateChaining.TABLE_SIZES)
+
+        first_chain = next(chain for chain in table.table if chain is not None)
+        key, _ = first_chain[0]
+        node = first_chain.head
+        table[key] = -1
+        self.assertIs(first_chain.head, node, "Updates should change the existing node")
+        self.assertEqual(node.item, (key, -1))
+        self.assertEqual(len(table), len(self.names))
+
+        for i, name in enumerate(self.names):
+            if name != key:
+                self.assertEqual(table[name], i)
+
+    @number("14.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_iterators(self) -> None:
+        items = [(name, i) for i, name in enumerate(self.names[:50])]
+        tables = [LinearProbeTable(), RobinHoodTable(), HashyStepTable(), HashTableSeparateChaining(),
+                  PerfectHashTable([name for name, _ in items])]
+        for table in tables:
+            for name, i in items:
+                table[name] = i
+            for name, _ in items[:10]:
+                del table[name]
+
+            pairs = list(table.items())
+            self.assertEqual(sorted(pairs), sorted(items[10:]), type(table).__name__)
+            self.assertEqual(list(table.keys()), [key for key, _ in pairs])
+            self.assertEqual(list(table.values()), [value for _, value in pairs])
+            self.assertIsInstance(table.items(), GeneratorType, "Items should be yielded, not copied")
+
+    @number("14.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_update_writes_value_only(self) -> None:
+        for table in [LinearProbeTable(), RobinHoodTable(), HashyStepTable()]:
+            for i, name in enumerate(self.names):
+                table[name] = i
+            keys, hashes = table.array[:], table.hash_array[:]
+            for i, name in enumerate(self.names):
+                table[name] = -i
+            self.assertEqual(table.array[:], keys, type(table).__name__)
+            self.assertEqual(table.hash_array[:], hashes, type(table).__name__)
+            self.assertEqual(len(table), len(self.names))
+            for i, name in enumerate(self.names):
+                self.assertEqual(table[name], -i)
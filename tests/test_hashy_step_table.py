@@ -0,0 +1,107 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.hash_table import TOMBSTONE
+from hashy_step_table import HashyStepTable
+from random_gen import RandomGen
+
+
+class CountingStepTable(HashyStepTable):
+    """ HashyStepTable that counts how many times a key is hashed. """
+
+    def __init__(self, sizes=None, shrink: bool = False) -> None:
+        HashyStepTable.__init__(self, sizes, shrink)
+        self.hash_calls = 0
+
+    def hash(self, key: str) -> int:
+        self.hash_calls += 1
+        return HashyStepTable.hash(self, key)
+
+
+class TestHashyStepTable(TestCase):
+
+    def setUp(self) -> None:
+        self.names = ["Player " + str(i) for i in range(300)]
+
+    @number("16.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_churn(self) -> None:
+        table = HashyStepTable()
+        expected = {}
+        RandomGen.set_seed(11)
+        for step in range(3000):
+            name = RandomGen.random_choice(self.names)
+            if name in expected and RandomGen.random() < 0.5:
+                del table[name]
+                del expected[name]
+            else:
+                table[name] = step
+                expected[name] = step
+
+        self.assertEqual(len(table), len(expected))
+        self.assertLessEqual(table.tombstones, table.table_size * HashyStepTable.TOMBSTONE_THRESHOLD)
+        for name in self.names:
+            self.assertEqual(name in table, name in expected)
+            if name in expected:
+                self.assertEqual(table[name], expected[name])
+
+    @number("16.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stored_hashes(self) -> None:
+        table = CountingStepTable()
+        for i, name in enumerate(self.names):
+            table[name] = i
+        self.assertEqual(table.hash_calls, len(self.names), "Resizing should reuse the stored hashes")
+
+        table.hash_calls = 0
+        for name in self.names[:100]:
+            del table[name]
+        self.assertEqual(table.hash_calls, 100, "Deleting should only hash the deleted key")
+
+    @number("16.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_tombstones(self) -> None:
+        table = HashyStepTable([97])
+        table.hash = lambda _: 0
+        for letter in "ABC":
+            table[letter] = letter
+
+        del table["A"]
+        self.assertIs(table.array[0], TOMBSTONE)
+        self.assertEqual(table["C"], "C")
+        self.assertEqual(sorted(table.keys()), ["B", "C"])
+
+        table["D"] = "D"
+        self.assertEqual(table.array[0], "D", "Inserts should reuse the first tombstone")
+        self.assertEqual(table.tombstones, 0)
+
+    @number("16.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_shrink(self) -> None:
+        growing = HashyStepTable()
+        shrinking = HashyStepTable(shrink=True)
+        for i, name in enumerate(self.names):
+            growing[name] = i
+            shrinking[name] = i
+        full_size = shrinking.table_size
+
+        for name in self.names[:290]:
+            del growing[name]
+            del shrinking[name]
+            self.assertLessEqual(len(shrinking), shrinking.table_size * HashyStepTable.LOAD_FACTOR)
+
+        self.assertEqual(growing.table_size, full_size, "Tables should only shrink when asked to")
+        self.assertLess(shrinking.table_size, full_size / 8)
+        for i, name in enumerate(self.names[290:]):
+            self.assertEqual(shrinking[name], i + 290)
+
+        sparse = HashyStepTable(sizes=[5, 97], shrink=True)
+        for i, name in enumerate(self.names[:40]):
+            sparse[name] = i
+        for name in self.names[:25]:
+            del sparse[name]
+        self.assertEqual(sparse.table_size, 97, "15 entries do not fit in the smaller size")
+        for name in self.names[25:37]:
+            del sparse[name]
+        self.assertEqual(sparse.table_size, 5)
+        self.assertEqual(sorted(sparse.values()), [37, 38, 39])
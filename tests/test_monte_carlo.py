@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from constants import PlayerPosition, PlayerStats
+from data_structures.referential_array import ArrayR
+from ed_utils.decorators import number, visibility
+from monte_carlo import MonteCarloRunner
+from player import Player
+from random_gen import RandomGen, RandomStream
+from team import Team
+
+
+class TestMonteCarlo(TestCase):
+    TEAM_NAMES: list[str] = ['Badgers', 'Blitz', 'Commanders', 'Ferguson']
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(123)
+        self.teams: ArrayR[Team] = ArrayR(len(self.TEAM_NAMES))
+        for i, team_name in enumerate(self.TEAM_NAMES):
+            players: ArrayR[Player] = ArrayR(11)
+            for j in range(len(players)):
+                player = Player(f"{team_name} {j}", RandomGen.random_choice(list(PlayerPosition)), 20)
+                player[PlayerStats.WEIGHT] = RandomGen.randint(70, 90)
+                player[PlayerStats.HEIGHT] = RandomGen.randint(150, 180)
+                player[PlayerStats.STAR_SKILL] = RandomGen.randint(0, 5)
+                player[PlayerStats.WEAK_FOOT_ABILITY] = RandomGen.randint(0, 5)
+                players[j] = player
+            self.teams[i] = Team(team_name, players)
+
+    @number("6.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_position_counts(self) -> None:
+        num_seasons = 6
+        counts = MonteCarloRunner(self.teams, seed=1, max_workers=2, chunk_size=2).run(num_seasons)
+
+        self.assertEqual(len(counts), len(self.TEAM_NAMES))
+        for team_name in self.TEAM_NAMES:
+            self.assertEqual(sum(counts[team_name].to_list()), num_seasons, f"{team_name} should finish every season")
+        for position in range(len(self.TEAM_NAMES)):
+            self.assertEqual(sum(counts[team_name][position] for team_name in self.TEAM_NAMES), num_seasons,
+                             f"Position {position + 1} should be filled every season")
+
+    @number("6.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_deterministic_across_chunks(self) -> None:
+        serial = MonteCarloRunner(self.teams, seed=7, max_workers=1, chunk_size=5).run(5)
+        parallel = MonteCarloRunner(self.teams, seed=7, max_workers=2, chunk_size=1).run(5)
+        for team_name in self.TEAM_NAMES:
+            self.assertEqual(serial[team_name].to_list(), parallel[team_name].to_list(),
+                             f"{team_name} counts should not depend on how seasons are split")
+
+    @number("6.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_teams_not_modified(self) -> None:
+        MonteCarloRunner(self.teams, seed=1, max_workers=1).run(2)
+        for team in self.teams:
+            self.assertEqual(len(team.get_last_five_results() or []), 0, "The caller's teams should not be modified")
+
+    @number("6.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_season_seeds(self) -> None:
+        runner = MonteCarloRunner(self.teams, seed=1)
+        low_bits = set()
+        for season_no in range(5):
+            stream = RandomStream(runner.season_seed(season_no))
+            low_bits.add(tuple(stream.random() & 0xffff for _ in range(8)))
+        self.assertEqual(len(low_bits), 5, "Seasons should not share the low bits of their numbers")
+
+        last = MonteCarloRunner.MAX_SEASONS - 1
+        self.assertNotEqual(runner.season_seed(last), runner.season_seed(0))
+        self.assertRaises(ValueError, lambda: runner.season_seed(last + 1))
+        self.assertRaises(ValueError, lambda: runner.run(last + 2))
@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from constants import PlayerPosition, PlayerStats, ResultStats, TeamStats
+from hashy_perfection_table import PerfectHashTable
+
+
+class TestPerfectHashTable(TestCase):
+
+    @number("17.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_enum_key_sets(self) -> None:
+        for enum in [PlayerStats, TeamStats, ResultStats, PlayerPosition]:
+            keys = [member.value for member in enum]
+            table = PerfectHashTable(keys)
+            self.assertEqual(len(table.array), len(keys), "The table should be minimal by default")
+            self.assertEqual(sorted(table.hash(key) for key in keys), list(range(len(keys))))
+
+            for i, key in enumerate(keys):
+                table[key] = i
+            self.assertTrue(table.is_full())
+            for i, key in enumerate(keys):
+                self.assertEqual(table[key], i)
+
+    @number("17.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_roster(self) -> None:
+        names = ["Player " + str(i) for i in range(400)]
+        table = PerfectHashTable(names, table_size=450)
+        self.assertEqual(len({table.hash(name) for name in names}), len(names))
+
+        for name in names:
+            table[name] = name.upper()
+        del table[names[0]]
+        self.assertEqual(len(table), len(names) - 1)
+        self.assertNotIn(names[0], table)
+        self.assertEqual(table[names[-1]], names[-1].upper())
+
+    @number("17.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_unknown_keys(self) -> None:
+        table = PerfectHashTable([position.value for position in PlayerPosition])
+        for position in PlayerPosition:
+            table[position.value] = 0
+        self.assertNotIn("Winger", table)
+        self.assertRaises(KeyError, lambda: table["Winger"])
+        self.assertRaises(KeyError, lambda: table.__setitem__("Winger", 1))
+
+        table = PerfectHashTable([stat.value for stat in TeamStats])
+        self.assertRaises(KeyError, lambda: table.__setitem__("Not a stat", 1))
+        self.assertRaises(KeyError, lambda: table.__delitem__("Not a stat"))
+        for stat in TeamStats:
+            table[stat.value] = 0
+        self.assertEqual(len(table), len(TeamStats), "Rejected keys should not take the slot of a key of the set")
+
+    @number("17.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_invalid_key_sets(self) -> None:
+        self.assertRaises(ValueError, lambda: PerfectHashTable(["Goals", "Goals"]))
+        self.assertRaises(ValueError, lambda: PerfectHashTable(["Goals", "Assists"], table_size=1))
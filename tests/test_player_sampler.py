@@ -0,0 +1,122 @@
+from unittest import TestCase
+
+from constants import PlayerPosition, PlayerStats
+from data_structures.referential_array import ArrayR
+from data_structures.stat_store import StatStore
+from ed_utils.decorators import number, visibility
+from player import Player
+from random_gen import RandomGen
+from team import Team
+
+
+class TestPlayerSampler(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(42)
+        self.players: list[Player] = []
+        for i, position in enumerate(list(PlayerPosition) * 3):
+            player = Player(f"Player {i}", position, 20)
+            player[PlayerStats.STAR_SKILL] = RandomGen.randint(0, 5)
+            player[PlayerStats.WEAK_FOOT_ABILITY] = RandomGen.randint(0, 5)
+            player[PlayerStats.WEIGHT] = RandomGen.randint(70, 90)
+            player[PlayerStats.HEIGHT] = RandomGen.randint(150, 180)
+            self.players.append(player)
+        self.team = Team("Sample Team", ArrayR.from_list(self.players))
+
+    @staticmethod
+    def linear_choice(players: list[Player], *attributes: PlayerStats) -> Player:
+        """ The linear scan the sampler replaces. """
+        total_weight = sum(sum(player[attr] for attr in attributes) for player in players)
+        if total_weight == 0:
+            return RandomGen.random_choice(players)
+        rand_val = RandomGen.random_choice(range(total_weight))
+        cumulative_weight = 0
+        for player in players:
+            cumulative_weight += sum(player[attr] for attr in attributes)
+            if cumulative_weight >= rand_val:
+                return player
+
+    @number("8.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_matches_linear_scan(self) -> None:
+        sampler = self.team.get_sampler()
+        outfield = [player for player in self.team.get_players() if player.get_position() != PlayerPosition.GOALKEEPER]
+
+        RandomGen.set_seed(7)
+        expected = [self.linear_choice(outfield, PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
+                    for _ in range(50)]
+        RandomGen.set_seed(7)
+        self.assertEqual([sampler.choose_scorer() for _ in range(50)], expected)
+
+        RandomGen.set_seed(7)
+        expected = [self.linear_choice(outfield, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
+                    for _ in range(50)]
+        RandomGen.set_seed(7)
+        self.assertEqual([sampler.choose_assister() for _ in range(50)], expected)
+
+    @number("8.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_defender_spans_both_teams(self) -> None:
+        other = Team("Other Team", ArrayR.from_list([Player("Away", PlayerPosition.DEFENDER, 20)]))
+        other.get_players()[0][PlayerStats.HEIGHT] = 170
+        both = [player for player in self.team.get_players()] + [player for player in other.get_players()]
+
+        RandomGen.set_seed(7)
+        expected = [self.linear_choice(both, PlayerStats.HEIGHT) for _ in range(100)]
+        RandomGen.set_seed(7)
+        actual = [self.team.get_sampler().choose_defender(self.team.get_sampler(), other.get_sampler())
+                  for _ in range(100)]
+        self.assertEqual(actual, expected)
+
+    @number("8.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_invalidation(self) -> None:
+        sampler = self.team.get_sampler()
+        self.assertIs(self.team.get_sampler(), sampler, "An unchanged team should reuse its sampler")
+
+        self.players[0][PlayerStats.GOALS] += 1
+        self.assertIs(self.team.get_sampler(), sampler, "Season stats do not affect the weights")
+
+        self.players[0][PlayerStats.HEIGHT] = 200
+        self.assertIsNot(self.team.get_sampler(), sampler, "Changing an attribute should rebuild the sampler")
+
+        sampler = self.team.get_sampler()
+        self.team.remove_player(self.players[1])
+        self.assertIsNot(self.team.get_sampler(), sampler, "Changing the roster should rebuild the sampler")
+        self.assertNotIn(self.players[1], self.team.get_sampler().players)
+
+    @number("8.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_invalidation_on_reset(self) -> None:
+        sampler = self.team.get_sampler()
+        self.players[0].reset_season_stats()
+        self.assertIs(self.team.get_sampler(), sampler, "Resetting season stats keeps the attributes")
+
+        self.players[0].reset_stats()
+        self.assertEqual(self.players[0][PlayerStats.HEIGHT], 0)
+        rebuilt = self.team.get_sampler()
+        self.assertIsNot(rebuilt, sampler, "Resetting all stats zeroes the attributes, so the sampler should be rebuilt")
+
+        self.team.reset_stats()
+        self.assertIs(self.team.get_sampler(), rebuilt, "Team stats do not affect the weights")
+
+    @number("8.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_invalidation_through_store(self) -> None:
+        sampler = self.team.get_sampler()
+        self.players[0].get_statistics()[PlayerStats.HEIGHT] = 1000
+        rebuilt = self.team.get_sampler()
+        self.assertIsNot(rebuilt, sampler, "Writing an attribute through a view should rebuild the sampler")
+        self.assertEqual(rebuilt.defending_weights[0], 1000)
+
+        store: StatStore[PlayerStats] = StatStore(PlayerStats)
+        players = [Player(f"Stored {i}", PlayerPosition.STRIKER, 20, store) for i in range(3)]
+        for player in players:
+            player[PlayerStats.HEIGHT] = 180
+        team = Team("Stored Team", ArrayR.from_list(players))
+        sampler = team.get_sampler()
+        self.assertIs(team.get_sampler(), sampler)
+        store.reset([PlayerStats.GOALS])
+        self.assertIs(team.get_sampler(), sampler, "Resetting season stats keeps the attributes")
+        store.reset()
+        self.assertIsNot(team.get_sampler(), sampler, "Resetting the store zeroes the attributes")
@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from random_gen import RandomGen, RandomStream
+
+
+class TestRandomGen(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(123)
+        self.serial: list[int] = [RandomGen.random() for _ in range(200)]
+
+    @number("7.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stream_matches_global(self) -> None:
+        stream = RandomStream(123)
+        self.assertEqual([stream.random() for _ in range(200)], self.serial)
+
+    @number("7.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_streams_are_independent(self) -> None:
+        RandomGen.set_seed(123)
+        stream = RandomGen.stream()
+        stream.random()
+        stream.random()
+        self.assertEqual(RandomGen.random(), self.serial[0], "Using a stream should not advance the global stream")
+        self.assertEqual(stream.random(), self.serial[2])
+
+    @number("7.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_jump(self) -> None:
+        for n in [0, 1, 2, 17, 64, 199]:
+            RandomGen.set_seed(123)
+            RandomGen.jump(n)
+            self.assertEqual(RandomGen.random(), self.serial[n], f"Jumping {n} ahead gave the wrong number")
+
+            stream = RandomStream(123)
+            stream.jump(n)
+            self.assertEqual(stream.random(), self.serial[n], f"Jumping {n} ahead gave the wrong number")
+
+        self.assertRaises(ValueError, lambda: RandomGen.jump(-1))
+
+    @number("7.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_split(self) -> None:
+        n = 50
+        base = RandomStream(123)
+        for k in range(4):
+            worker = base.split(k, n)
+            self.assertEqual([worker.random() for _ in range(n)], self.serial[n * k:n * (k + 1)],
+                             f"Worker {k} does not match the serial sequence")
+        self.assertEqual(base.random(), self.serial[0], "Splitting should not advance the base stream")
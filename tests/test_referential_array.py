@@ -0,0 +1,109 @@
+import gc
+import pickle
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.referential_array import ArrayR
+
+
+class TestReferentialArray(TestCase):
+
+    @number("21.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bulk_operations(self) -> None:
+        array = ArrayR.from_list(list(range(6)))
+        self.assertEqual(array[1:4], [1, 2, 3])
+        array[1:4] = ["a", "b", "c"]
+        self.assertEqual(array.to_list(), [0, "a", "b", "c", 4, 5])
+        with self.assertRaises(ValueError):
+            array[0:2] = [1]
+
+        array.fill(None, 4)
+        self.assertEqual(array.to_list(), [0, "a", "b", "c", None, None])
+        array.fill(7)
+        self.assertEqual(array.to_list(), [7] * 6)
+
+        copy = array.copy()
+        copy[0] = 1
+        self.assertEqual(array[0], 7, "A copy should not share its references")
+        self.assertEqual(array.copy(8).to_list(), [7] * 6 + [None, None])
+        self.assertEqual(array.copy(2).to_list(), [7, 7])
+        self.assertEqual((ArrayR.from_list([1, 2]) + ArrayR.from_list([3])).to_list(), [1, 2, 3])
+
+    @number("21.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_views(self) -> None:
+        array = ArrayR.from_list(list(range(10)))
+        view = array.view(2, 6)
+        self.assertEqual(len(view), 4)
+        self.assertEqual(view.to_list(), [2, 3, 4, 5])
+
+        array[2] = "a"
+        view[-1] = "b"
+        view.view(1)[0:2] = ["c", "d"]
+        self.assertEqual(view.to_list(), ["a", "c", "d", "b"])
+        self.assertEqual(array[0:7], [0, 1, "a", "c", "d", "b", 6])
+        self.assertRaises(IndexError, lambda: view.__setitem__(4, 0))
+        front = array.view(0, 5)
+        front[::-1] = [9, 8, 7, 6, 5]
+        self.assertEqual(array[0:5], [5, 6, 7, 8, 9])
+        front[3::-2] = ["x", "y"]
+        self.assertEqual(array[0:5], [5, "y", 7, "x", 9])
+        view[2::-1] = ["e", "f", "g"]
+        self.assertEqual(array[0:6], [5, "y", "g", "f", "e", "b"])
+        array[0:5] = [0, 1, "a", "c", "d"]
+        self.assertRaises(ValueError, lambda: array.view(5, 5))
+
+        # Objects written through a view stay alive once the view is gone
+        view[0] = ["kept"]
+        del view
+        gc.collect()
+        self.assertEqual(array[2], ["kept"])
+
+        view = array.view(8)
+        del array
+        gc.collect()
+        self.assertEqual(view.to_list(), [8, 9], "A view should keep its base array alive")
+        restored = pickle.loads(pickle.dumps(view))
+        self.assertEqual(restored.to_list(), [8, 9])
+        self.assertIs(type(restored), ArrayR)
+
+    @number("21.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_sorted_list(self) -> None:
+        sorted_list = ArraySortedList(1)
+        for item in [5, 1, 4, 2, 3, 0]:
+            sorted_list.add(item)
+        self.assertEqual([sorted_list[i] for i in range(len(sorted_list))], [0, 1, 2, 3, 4, 5])
+        sorted_list.delete_at_index(2)
+        sorted_list.delete_at_index(0)
+        self.assertEqual([sorted_list[i] for i in range(len(sorted_list))], [1, 3, 4, 5])
+
+    @number("21.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_iteration(self) -> None:
+        array = ArrayR.from_list(["a", "b", "a", "c"])
+        self.assertEqual(list(array), ["a", "b", "a", "c"])
+        self.assertEqual(list(reversed(array)), ["c", "a", "b", "a"])
+        self.assertEqual(list(array.enumerate(1)), [(1, "a"), (2, "b"), (3, "a"), (4, "c")])
+        self.assertEqual([(x, y) for x in array for y in array][:5],
+                         [("a", "a"), ("a", "b"), ("a", "a"), ("a", "c"), ("b", "a")],
+                         "Iterations should be independent of each other")
+        self.assertEqual(list(array.view(1, 3)), ["b", "a"])
+        iterator = iter(array)
+        next(iterator)
+        array[1] = "e"
+        self.assertEqual(list(iterator), ["e", "a", "c"], "Iteration should read the array in place")
+        array[1] = "b"
+
+        self.assertEqual(array.index("a"), 0)
+        self.assertEqual(array.index("a", 1), 2)
+        self.assertRaises(ValueError, lambda: array.index("c", 0, 3))
+        self.assertEqual(array.count("a"), 2)
+        self.assertEqual(array.count("d"), 0)
+
+        sorted_list = ArraySortedList(8)
+        for item in [3, 1, 2]:
+            sorted_list.add(item)
+        self.assertEqual(list(sorted_list), [1, 2, 3])
@@ -0,0 +1,77 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.hash_table import LinearProbeTable
+from data_structures.robin_hood_table import RobinHoodTable
+from random_gen import RandomGen
+
+
+class TestRobinHoodTable(TestCase):
+
+    def setUp(self) -> None:
+        self.names = ["Player " + str(i) for i in range(300)]
+
+    def assertOrdered(self, table: RobinHoodTable) -> None:
+        """ Every entry of a cluster should be at least as far from its hash position as the one before, minus one. """
+        for position in range(table.table_size):
+            if table.array[position] is not None and table._probe_distance(position, table.hash_array[position]) > 0:
+                self.assertIsNotNone(table.array[position - 1],
+                                     "An entry away from its hash position should follow another entry")
+                self.assertLessEqual(table._probe_distance(position, table.hash_array[position]),
+                                     table._probe_distance(position - 1, table.hash_array[position - 1]) + 1)
+
+    @number("15.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_matches_linear_probe_table(self) -> None:
+        robin_hood = RobinHoodTable()
+        linear = LinearProbeTable()
+        RandomGen.set_seed(7)
+        for step in range(2000):
+            name = RandomGen.random_choice(self.names)
+            if name in linear and RandomGen.random() < 0.4:
+                del linear[name]
+                del robin_hood[name]
+            else:
+                linear[name] = step
+                robin_hood[name] = step
+
+        self.assertEqual(len(robin_hood), len(linear))
+        for name in self.names:
+            self.assertEqual(name in robin_hood, name in linear)
+            if name in linear:
+                self.assertEqual(robin_hood[name], linear[name])
+        self.assertOrdered(robin_hood)
+        self.assertEqual(sorted(robin_hood.keys()), sorted(linear.keys()))
+
+    @number("15.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_load_factor_and_probe_distances(self) -> None:
+        table = RobinHoodTable()
+        for i, name in enumerate(self.names):
+            table[name] = i
+        self.assertLessEqual(len(table), table.table_size * RobinHoodTable.LOAD_FACTOR)
+        self.assertGreater(len(table), table.table_size / 2, "The table should fill past the linear probe load factor")
+        self.assertGreaterEqual(table.max_probe_distance(), table.mean_probe_distance())
+
+        for name in self.names:
+            del table[name]
+        self.assertTrue(table.is_empty())
+        self.assertEqual(table.max_probe_distance(), 0)
+        self.assertEqual(table.mean_probe_distance(), 0)
+
+    @number("15.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_collisions(self) -> None:
+        table = RobinHoodTable(sizes=[7])
+        table.full_hash = lambda key: 0 if key < "C" else 1
+        for i, key in enumerate(["C", "A", "D", "B"]):
+            table[key] = i
+        self.assertEqual(table.array[0:4], ["A", "B", "C", "D"])
+        self.assertEqual(table.value_array[0:4], [1, 3, 0, 2])
+        self.assertEqual(table.max_probe_distance(), 2)
+        self.assertRaises(KeyError, lambda: table["E"])
+
+        del table["A"]
+        self.assertEqual(table.array[0:3], ["B", "C", "D"])
+        self.assertEqual(table.value_array[0:3], [3, 0, 2])
+        self.assertIsNone(table.array[3])
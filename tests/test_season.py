@@ -0,0 +1,150 @@
+from unittest import TestCase
+
+from constants import PlayerPosition, PlayerStats, TeamStats
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.referential_array import ArrayR
+from ed_utils.decorators import number, visibility
+from player import Player
+from random_gen import RandomGen
+from season import Season
+from team import Team
+
+
+class TestSeason(TestCase):
+    TEAM_NAMES: list[str] = ['Badgers', 'Blitz', 'Commanders', 'Ferguson', 'Gladiators', 'Grizzlies']
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(2024)
+        self.teams: ArrayR[Team] = ArrayR(len(self.TEAM_NAMES))
+        for i, team_name in enumerate(self.TEAM_NAMES):
+            players: ArrayR[Player] = ArrayR(11)
+            for j in range(len(players)):
+                player = Player(f"{team_name} {j}", RandomGen.random_choice(list(PlayerPosition)), 20)
+                player[PlayerStats.WEIGHT] = RandomGen.randint(70, 90)
+                player[PlayerStats.HEIGHT] = RandomGen.randint(150, 180)
+                player[PlayerStats.STAR_SKILL] = RandomGen.randint(0, 5)
+                player[PlayerStats.WEAK_FOOT_ABILITY] = RandomGen.randint(0, 5)
+                players[j] = player
+            self.teams[i] = Team(team_name, players)
+
+    @number("12.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_incremental_leaderboard(self) -> None:
+        season = Season(self.teams)
+        for week_of_games in season.schedule:
+            changed_teams = []
+            for game in week_of_games:
+                game.home_team[TeamStats.GOALS_FOR] += RandomGen.randint(0, 3)
+                game.away_team[TeamStats.WINS] += 1
+                changed_teams += [game.home_team, game.away_team]
+            season.update_leaderboard(changed_teams)
+
+            expected = sorted(self.teams, key=lambda team: (-team[TeamStats.POINTS], -team[TeamStats.GOALS_DIFFERENCE],
+                                                             -team[TeamStats.GOALS_FOR], team.get_name()))
+            self.assertEqual([team.get_name() for team in season.leaderboard],
+                             [team.get_name() for team in expected], "Leaderboard out of order")
+            for position, team in enumerate(expected, start=1):
+                self.assertEqual(season.get_rank(team), position, f"Wrong rank for {team}")
+
+    @number("12.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_rank_after_simulation(self) -> None:
+        season = Season(self.teams)
+        season.simulate_season()
+        for position in range(len(season.leaderboard)):
+            self.assertEqual(season.get_rank(season.leaderboard[position]), position + 1)
+        self.assertRaises(KeyError, lambda: season.get_rank(Team("Unknown", ArrayR.from_list([Player("Nobody", PlayerPosition.STRIKER, 20)]))))
+
+    @number("12.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_round_robin_schedule(self) -> None:
+        for num_teams in range(2, len(self.TEAM_NAMES) + 1):
+            season = Season(self.teams[:num_teams], round_robin=True)
+            expected_weeks = 2 * (num_teams - 1) if num_teams % 2 == 0 else 2 * num_teams
+            self.assertEqual(len(season.schedule), expected_weeks, f"Wrong number of weeks for {num_teams} teams")
+
+            fixtures = set()
+            for week_no, week_of_games in enumerate(season.schedule, start=1):
+                self.assertEqual(week_of_games.get_week(), week_no)
+                playing = []
+                for game in week_of_games:
+                    playing += [game.home_team.get_name(), game.away_team.get_name()]
+                    fixtures.add((game.home_team.get_name(), game.away_team.get_name()))
+                self.assertEqual(len(playing), len(set(playing)), f"A team plays twice in week {week_no}")
+                self.assertEqual(len(playing), num_teams - num_teams % 2)
+
+            self.assertEqual(len(fixtures), num_teams * (num_teams - 1), "Every team should host every other team once")
+
+    @number("12.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_round_robin_lazy(self) -> None:
+        season = Season(self.teams)
+        weeks = season.iter_round_robin()
+        first_week = next(weeks)
+        self.assertEqual(first_week.get_week(), 1)
+        self.assertEqual(len(first_week.get_games()), len(self.TEAM_NAMES) // 2)
+        self.assertEqual(str(season.round_robin_week(4)), str(next(weeks) and next(weeks) and next(weeks)))
+        self.assertRaises(ValueError, lambda: season.round_robin_week(season.num_round_robin_weeks() + 1))
+
+    @number("12.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_simulate_weeks(self) -> None:
+        season = Season(self.teams)
+        games_played = 0
+        week_results = []
+        for week_result in season.simulate_weeks():
+            games_played += len(week_result.get_games())
+            self.assertEqual(len(week_result.get_outcomes()), len(week_result.get_games()))
+            standings = week_result.get_standings()
+            self.assertEqual(len(standings), len(self.TEAM_NAMES))
+            self.assertEqual(sum(row[1] for row in standings), 2 * games_played, "Standings should only include games played so far")
+            week_results.append(week_result)
+
+        self.assertEqual(len(week_results), len(season.schedule))
+        final_standings = [row[0] for row in week_results[-1].get_standings()]
+        self.assertEqual(final_standings, [team.get_name() for team in season.leaderboard])
+        self.assertIsNone(Season([], round_robin=True).get_standings(), "A season without teams has no standings")
+
+    @number("12.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_simulate_weeks_matches_simulate_season(self) -> None:
+        RandomGen.set_seed(1)
+        Season(self.teams).simulate_season()
+        expected = [(team.get_name(), team[TeamStats.POINTS], team[TeamStats.GOALS_FOR]) for team in self.teams]
+
+        for team in self.teams:
+            team.reset_stats()
+        RandomGen.set_seed(1)
+        for _ in Season(self.teams).simulate_weeks():
+            pass
+        self.assertEqual([(team.get_name(), team[TeamStats.POINTS], team[TeamStats.GOALS_FOR]) for team in self.teams], expected)
+
+    @number("12.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reposition(self) -> None:
+        sorted_list = ArraySortedList(8)
+        items = [[i] for i in range(8)]
+        for item in items:
+            sorted_list.add(item)
+        items[1][0] = 5.5
+        items[2][0] = 2.5
+        items[6][0] = 0.5
+        self.assertEqual(sorted_list.reposition([6, 1, 2, 1]), (1, 7), "Only positions 1 to 6 can have changed")
+        self.assertEqual(list(sorted_list), [[0], [0.5], [2.5], [3], [4], [5], [5.5], [7]])
+        self.assertEqual(sorted_list.reposition([]), (0, 0))
+        self.assertRaises(IndexError, lambda: sorted_list.reposition([8]))
+
+    @number("12.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_each_game_played_once(self) -> None:
+        season = Season(self.teams)
+        scheduled = {team.get_name(): 0 for team in self.teams}
+        for week_of_games in season.schedule:
+            for game in week_of_games:
+                scheduled[game.home_team.get_name()] += 1
+                scheduled[game.away_team.get_name()] += 1
+
+        season.simulate_season()
+        for team in self.teams:
+            self.assertEqual(team[TeamStats.GAMES_PLAYED], scheduled[team.get_name()],
+                             f"{team} should play each of its scheduled games exactly once")
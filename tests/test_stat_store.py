@@ -0,0 +1,83 @@
+import gc
+import pickle
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from constants import PlayerPosition, PlayerStats, TeamStats
+from data_structures.referential_array import ArrayR
+from data_structures.stat_store import StatStore
+from player import Player
+from team import Team
+
+
+class TestStatStore(TestCase):
+
+    def setUp(self) -> None:
+        self.store: StatStore[PlayerStats] = StatStore(PlayerStats)
+        self.players = [
+            Player("Alexey", PlayerPosition.STRIKER, 18, self.store),
+            Player("Maria", PlayerPosition.MIDFIELDER, 21, self.store),
+            Player("Brendon", PlayerPosition.DEFENDER, 26, self.store),
+        ]
+
+    @number("13.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_player_view(self) -> None:
+        alexey = self.players[0]
+        alexey[PlayerStats.GOALS] = 4
+        statistics = alexey.get_statistics()
+        self.assertEqual(statistics[PlayerStats.GOALS], 4)
+        self.assertEqual(statistics[PlayerStats.GOALS.value], 4)
+        self.assertEqual(len(statistics), len(PlayerStats))
+
+        statistics[PlayerStats.ASSISTS] = 2
+        self.assertEqual(alexey[PlayerStats.ASSISTS], 2)
+        self.assertEqual(self.players[1][PlayerStats.ASSISTS], 0)
+        self.assertEqual(dict(zip(statistics.keys(), statistics.values())),
+                         {stat.value: alexey[stat] for stat in PlayerStats})
+
+    @number("13.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_aggregates(self) -> None:
+        for player, goals in zip(self.players, [3, 7, 1]):
+            player[PlayerStats.GOALS] = goals
+            player[PlayerStats.HEIGHT] = 180
+
+        self.assertEqual(self.store.total(PlayerStats.GOALS), 11)
+        top = self.store.top_k(PlayerStats.GOALS, 2)
+        self.assertEqual([goals for goals, _ in top], [7, 3])
+        self.assertIs(top[0][1], self.players[1])
+
+        self.store.reset(Player.SEASON_STATS)
+        self.assertEqual(self.store.total(PlayerStats.GOALS), 0)
+        self.assertEqual(self.store.total(PlayerStats.HEIGHT), 540, "Attributes should survive a season reset")
+
+    @number("13.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_ids_are_reused(self) -> None:
+        maria_id = self.players[1].id
+        self.players[1][PlayerStats.GOALS] = 9
+        del self.players[1]
+        gc.collect()
+        self.assertEqual(len(self.store), 2)
+
+        newcomer = Player("Rebecca", PlayerPosition.GOALKEEPER, 23, self.store)
+        self.assertEqual(newcomer.id, maria_id)
+        self.assertEqual(newcomer[PlayerStats.GOALS], 0)
+
+    @number("13.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_team_stats_and_pickling(self) -> None:
+        team = Team("Sharks", ArrayR.from_list(self.players))
+        team[TeamStats.WINS] = 1
+        team[TeamStats.GOALS_FOR] = 3
+        self.players[0][PlayerStats.GOALS] = 3
+
+        copy = pickle.loads(pickle.dumps(team))
+        self.assertEqual(copy[TeamStats.POINTS], 3)
+        self.assertEqual(copy[TeamStats.GOALS_DIFFERENCE], 3)
+        self.assertEqual(list(copy.get_last_five_results()), list(team.get_last_five_results()))
+        self.assertEqual(copy.get_player_by_name("Alexey")[PlayerStats.GOALS], 3)
+
+        copy[TeamStats.WINS] = 2
+        self.assertEqual(team[TeamStats.WINS], 1, "The copy should have its own statistics")
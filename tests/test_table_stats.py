@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from constants import PlayerStats
+from data_structures.hash_table import LinearProbeTable
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from data_structures.robin_hood_table import RobinHoodTable
+from data_structures.table_stats import TableStats, disable_stats, enable_stats
+from hashy_perfection_table import HashyPerfectionTable
+from hashy_step_table import HashyStepTable
+
+
+class TestTableStats(TestCase):
+
+    def setUp(self) -> None:
+        self.names = ["Player " + str(i) for i in range(100)]
+
+    @number("19.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_all_tables(self) -> None:
+        for table in [LinearProbeTable(), RobinHoodTable(), HashyStepTable(), HashTableSeparateChaining(5)]:
+            table_type = type(table)
+            stats = enable_stats(table, sample_interval=10)
+            self.assertIs(enable_stats(table), stats, "Enabling twice should keep the same stats")
+            for i, name in enumerate(self.names):
+                table[name] = i
+            for name in self.names[:10]:
+                del table[name]
+            self.assertNotIn("Nobody", table)
+            self.assertEqual(table[self.names[-1]], len(self.names) - 1)
+
+            self.assertIs(disable_stats(table), stats)
+            self.assertIs(type(table), table_type, "Disabling should restore the class of the table")
+            self.assertFalse(hasattr(table, "stats"))
+            self.assertIsNone(disable_stats(table))
+
+            self.assertEqual(stats.operations, len(self.names) + 10)
+            self.assertEqual(sum(stats.searches.values()), len(self.names) + 10 + 1, table_type.__name__)
+            self.assertEqual(sum(stats.failed_searches.values()), 1, table_type.__name__)
+            self.assertGreater(stats.rehashes, 0, table_type.__name__)
+            self.assertEqual(len(stats.load_factors), stats.rehashes + stats.operations // 10)
+            self.assertGreater(TableStats.mean(stats.searches), 0)
+            self.assertIn("Rehashes: " + str(stats.rehashes), stats.report())
+
+    @number("19.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_probe_lengths(self) -> None:
+        table = LinearProbeTable(sizes=[11])
+        table.full_hash = lambda _: 0
+        stats = enable_stats(table)
+        for key in "ABC":
+            table[key] = key
+        self.assertEqual(stats.searches, {1: 1, 2: 1, 3: 1})
+        self.assertRaises(KeyError, lambda: table["D"])
+        self.assertEqual(stats.failed_searches, {4: 1})
+
+    @number("19.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_chain_lengths_and_perfect_table(self) -> None:
+        table = HashTableSeparateChaining(5)
+        table.TABLE_SIZES = [5]
+        table.hash = lambda _: 0
+        stats = enable_stats(table)
+        for name in self.names[:3]:
+            table[name] = 0
+        self.assertEqual(stats.searches, {0: 1, 1: 1, 2: 1})
+        disable_stats(table)
+        self.assertEqual(stats.chain_lengths, {0: 4, 3: 1})
+
+        perfect = HashyPerfectionTable()
+        stats = enable_stats(perfect)
+        for stat in PlayerStats:
+            perfect[stat.value] = 0
+        self.assertNotIn("Apple", perfect)
+        self.assertEqual((stats.searches, stats.failed_searches), ({1: len(PlayerStats)}, {1: 1}))
+        self.assertEqual(stats.rehashes, 0)
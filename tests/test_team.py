@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from constants import PlayerPosition
+from data_structures.referential_array import ArrayR
+from ed_utils.decorators import number, visibility
+from player import Player
+from team import Team
+
+
+class TestTeam(TestCase):
+
+    def setUp(self) -> None:
+        self.alexey = Player("Alexey", PlayerPosition.STRIKER, 22)
+        self.maria = Player("Maria", PlayerPosition.MIDFIELDER, 22)
+        self.other_maria = Player("Maria", PlayerPosition.GOALKEEPER, 30)
+        self.team = Team("Sample Team", ArrayR.from_list([self.alexey, self.maria]))
+
+    @number("11.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_get_player_by_name(self) -> None:
+        self.assertIs(self.team.get_player_by_name("Alexey"), self.alexey)
+        self.assertIs(self.team.get_player_by_name("Maria"), self.maria)
+        self.assertIsNone(self.team.get_player_by_name("Brendon"))
+
+    @number("11.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_name_index_follows_roster(self) -> None:
+        self.team.add_player(self.other_maria)
+        self.assertIs(self.team.get_player_by_name("Maria"), self.maria, "The first player with a name keeps it")
+
+        self.team.remove_player(self.maria)
+        self.assertIs(self.team.get_player_by_name("Maria"), self.other_maria)
+
+        self.team.remove_player(self.other_maria)
+        self.team.remove_player(self.alexey)
+        self.assertIsNone(self.team.get_player_by_name("Maria"))
+        self.assertIsNone(self.team.get_player_by_name("Alexey"))
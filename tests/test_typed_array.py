@@ -0,0 +1,54 @@
+import pickle
+from ctypes import c_int64, sizeof
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.referential_array import ArrayR
+from data_structures.typed_array import FloatArray, IntArray
+
+
+class TestTypedArray(TestCase):
+
+    @number("22.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_array_interface(self) -> None:
+        goals = IntArray(4)
+        self.assertIsInstance(goals, ArrayR)
+        self.assertEqual(goals.to_list(), [0, 0, 0, 0], "New positions should hold 0")
+        goals[0] = 3
+        goals[1:3] = [1, 4]
+        self.assertEqual(list(goals), [3, 1, 4, 0])
+        self.assertEqual(goals.sum(), 8)
+        self.assertEqual(goals.index(4), 2)
+        self.assertEqual(goals.copy(5).to_list(), [3, 1, 4, 0, 0])
+        self.assertIsInstance(goals + IntArray.from_list([2]), IntArray)
+        self.assertRaises(TypeError, lambda: goals.__setitem__(0, 1.5))
+
+        weights = FloatArray.from_list([0.5, 2])
+        self.assertEqual(weights.to_list(), [0.5, 2.0])
+        self.assertEqual(weights.sum(), 2.5)
+
+        restored = pickle.loads(pickle.dumps(goals))
+        self.assertIsInstance(restored, IntArray)
+        self.assertEqual(restored.to_list(), goals.to_list())
+
+    @number("22.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_shared_memory(self) -> None:
+        goals = IntArray.from_list([3, 1, 4, 1, 5])
+        buffer = goals.buffer()
+        self.assertEqual((buffer.format, buffer.itemsize, buffer.tolist()), ("q", 8, [3, 1, 4, 1, 5]))
+        buffer[0] = 9
+        self.assertEqual(goals[0], 9, "The buffer should share the memory of the array")
+        self.assertEqual(FloatArray(2).buffer().format, "d")
+
+        view = goals.view(1, 4)
+        self.assertIsInstance(view, IntArray)
+        view[0] = 7
+        self.assertEqual(goals.to_list(), [9, 7, 4, 1, 5])
+        self.assertEqual(view.buffer().tolist(), [7, 4, 1])
+
+        interface = view.__array_interface__
+        self.assertEqual(interface['shape'], (3,))
+        self.assertEqual(interface['typestr'][1:], "i8")
+        self.assertEqual(interface['data'][0], goals.__array_interface__['data'][0] + sizeof(c_int64))